@@ -0,0 +1,270 @@
+"""
+Class solving many DIMACS files in parallel over a pool of worker processes.
+
+The files to solve are given as a directory, a glob pattern, or a manifest listing one file per line. Every file is
+parsed and solved in a worker process, which writes the `.out` file of a satisfiable instance itself, so only a small
+result record travels back to the parent. Results are yielded as soon as each instance finishes, in completion order,
+and can be streamed into a JSONL or CSV summary.
+
+Each instance can be given a time limit, a SolverBudget that preprocessing and the engines check cooperatively, so an
+instance running out of time stops at a point where nothing is half done, is reported as UNKNOWN, and the worker moves
+on to the next instance. The limit runs from before the file is parsed, so parsing uses up part of it, but parsing
+itself is never interrupted: an instance that is still parsing once the limit is reached stops at the first check
+after it.
+
+The model of every satisfiable instance is checked against the clauses of the file by a ModelVerifier before its
+`.out` file is written, so an engine returning a wrong model is reported as an error instead of a solution. Answers
+taken from the result cache were checked when they were first found.
+
+Workers can share a ResultCache, so an instance whose CNF was solved before, in this batch or an earlier run,
+is answered from the cache without being searched, or even parsed if the very same file was solved before.
+"""
+
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import time
+from pydoku.DIMACSError import DIMACSError
+from pydoku.EngineType import EngineType
+from pydoku.FileHandler import FileHandler
+from pydoku.HeuristicType import HeuristicType
+from pydoku.ModelVerifier import ModelVerifier
+from pydoku.RestartType import RestartType
+from pydoku.ResultCache import ResultCache
+from pydoku.SATSolver import SATSolver
+from pydoku.SolverBudget import SolverBudget
+from typing import Iterator
+
+# files produced by the CLI next to its inputs, never picked up as instances
+SKIPPED_EXTENSIONS = ('.out', '.models', '.cache')
+GLOB_CHARACTERS = '*?['
+SUMMARY_FIELDS = ['file', 'status', 'backtracks', 'splits', 'conflicts', 'learned_clauses', 'restarts', 'run_time', 'cached', 'verified', 'output', 'error']
+
+STATUS_SATISFIABLE = 'SAT'
+STATUS_UNSATISFIABLE = 'UNSAT'
+STATUS_UNKNOWN = 'UNKNOWN'
+STATUS_ERROR = 'ERROR'
+
+class BatchSolver:
+
+  def __init__(self, heuristic: HeuristicType, engine: EngineType = EngineType.RECURSIVE_DPLL, restart: RestartType = RestartType.NONE,
+               reduce_interval: int = 2000, preprocess: bool = False, cache: bool = False, workers: int = None, timeout: float = None,
+               result_cache: str = None):
+    """
+    Parameters
+    ----------
+    heuristic : HeuristicType
+        the branching heuristic to solve every instance with
+    engine : EngineType
+        the search engine to solve every instance with
+    restart : RestartType
+        the restart policy of the CDCL engine
+    reduce_interval : int
+        number of conflicts before the CDCL engine first reduces its learned clauses
+    preprocess : bool
+        simplify every CNF before searching
+    cache : bool
+        load every file through its binary cache
+    workers : int
+        number of worker processes, defaults to the number of CPUs
+    timeout : float
+        time limit per instance in seconds, None for no limit
+    result_cache : str
+        path of the ResultCache database shared by the workers, None to solve every instance
+    """
+    if heuristic not in HeuristicType:
+      raise TypeError('Invalid heuristic provided as input.')
+
+    if engine not in EngineType:
+      raise TypeError('Invalid engine provided as input.')
+
+    if workers is not None and workers < 1:
+      raise TypeError('Invalid number of workers provided as input.')
+
+    if timeout is not None and timeout <= 0:
+      raise TypeError('Invalid timeout provided as input.')
+
+    self.heuristic = heuristic
+    self.engine = engine
+    self.restart = restart
+    self.reduce_interval = reduce_interval
+    self.preprocess = preprocess
+    self.cache = cache
+    self.workers = workers or os.cpu_count() or 1
+    self.timeout = timeout
+    self.result_cache = result_cache
+
+  @staticmethod
+  def collect(source: str) -> list:
+    """
+    Returns the files to solve from a directory, a glob pattern or a manifest
+
+    Parameters
+    ----------
+    source : str
+        a directory whose files are all solved, a glob pattern, or a file listing one path per line,
+        relative paths in a manifest being relative to the manifest itself
+
+    Returns
+    -------
+    list
+        returns the sorted paths of the files to solve
+    """
+    if os.path.isdir(source):
+      filepaths = [os.path.join(source, name) for name in os.listdir(source)]
+    elif any(character in source for character in GLOB_CHARACTERS):
+      filepaths = glob.glob(source, recursive = True)
+    else:
+      directory = os.path.dirname(source)
+
+      with open(source, 'r') as manifest:
+        lines = [line.strip() for line in manifest]
+
+      filepaths = [os.path.join(directory, line) for line in lines if line != '' and not line.startswith('#')]
+
+    return sorted(filepath for filepath in filepaths if os.path.isfile(filepath) and not filepath.endswith(SKIPPED_EXTENSIONS))
+
+  def run(self, filepaths: list) -> Iterator[dict]:
+    """
+    Solves the files over the pool of workers, yielding the result of every instance as soon as it finishes
+
+    Parameters
+    ----------
+    filepaths : list
+        paths of the DIMACS files to solve
+
+    Returns
+    -------
+    Iterator[dict]
+        yields a result record for every file, in the order they finish
+
+    See Also
+    --------
+    solve_instance : function solving a single file inside a worker
+    """
+    settings = (self.heuristic, self.engine, self.restart, self.reduce_interval, self.preprocess, self.cache, self.timeout,
+                self.result_cache)
+    tasks = [(filepath, settings) for filepath in filepaths]
+
+    if len(tasks) == 0:
+      return
+
+    with multiprocessing.Pool(min(self.workers, len(tasks))) as pool:
+      yield from pool.imap_unordered(BatchSolver.solve_instance, tasks)
+
+  @staticmethod
+  def solve_instance(task: tuple) -> dict:
+    """
+    Parses and solves a single file, writing its `.out` file if it is satisfiable
+
+    Parameters
+    ----------
+    task : tuple
+        the path of the file and the settings of the batch
+
+    Returns
+    -------
+    dict
+        returns the result record of the instance, with one entry per summary field
+    """
+    filepath, (heuristic, engine, restart, reduce_interval, preprocess, cache, timeout, result_cache) = task
+    result = dict.fromkeys(SUMMARY_FIELDS)
+    result['file'] = filepath
+    start_time = time.time()
+    budget = SolverBudget(time_limit = timeout)
+    solver = SATSolver(budget = budget, cache = ResultCache(result_cache) if result_cache is not None else None)
+
+    # started before parsing, so the solve only gets what parsing left of the time limit, although parsing is not
+    # interrupted itself
+    budget.start()
+
+    try:
+      answer = solver.recall_file(filepath)
+
+      if answer is None:
+        if cache:
+          cnf = FileHandler.load(filepath)
+        else:
+          cnf = FileHandler.parse(filepath, integers = engine in (EngineType.WATCHED_LITERALS, EngineType.CDCL))
+
+        # the engines may change the clauses they are given, so they are copied for the verifier beforehand
+        verifier = ModelVerifier(cnf)
+        answer = solver.solve(cnf, heuristic, engine, restart, reduce_interval, preprocess = preprocess)
+        solver.link_file()
+      else:
+        verifier = None
+
+      satisfied, assignments, backtracks, splits = answer
+
+      if satisfied and verifier is not None:
+        falsified = verifier.check(assignments)
+        result['verified'] = falsified is None
+
+        if falsified is not None:
+          raise ValueError(f'The model found does not satisfy clause {falsified + 1} of the file.')
+
+      if satisfied:
+        result['output'] = f'{filepath}.out'
+        FileHandler.output(result['output'], assignments)
+
+      if satisfied is None:
+        result['status'] = STATUS_UNKNOWN
+      else:
+        result['status'] = STATUS_SATISFIABLE if satisfied else STATUS_UNSATISFIABLE
+
+      result['backtracks'] = backtracks
+      result['splits'] = splits
+      result['conflicts'] = solver.conflicts
+      result['learned_clauses'] = solver.learned_clauses
+      result['restarts'] = solver.restarts
+      result['cached'] = solver.cached
+    except DIMACSError as exception:
+      result['status'] = STATUS_ERROR
+      result['error'] = str(exception)
+    except Exception as exception:
+      result['status'] = STATUS_ERROR
+      result['error'] = str(exception) or type(exception).__name__
+    finally:
+      budget.stop()
+
+      if solver.cache is not None:
+        solver.cache.close()
+
+    result['run_time'] = time.time() - start_time
+
+    return result
+
+  @staticmethod
+  def summarize(results: Iterator[dict], summary_path: str) -> Iterator[dict]:
+    """
+    Appends every result to a summary file as it comes in and passes it on
+
+    The summary is written as CSV if its path ends with `.csv`, and as one JSON object per line otherwise.
+    It is flushed after every result, so it stays complete up to the last finished instance if the batch is stopped.
+
+    Parameters
+    ----------
+    results : Iterator[dict]
+        the result records of the batch
+    summary_path : str
+        path of the summary file to write
+
+    Returns
+    -------
+    Iterator[dict]
+        yields the same result records
+    """
+    with open(summary_path, 'w', newline = '') as file:
+      if summary_path.endswith('.csv'):
+        writer = csv.DictWriter(file, fieldnames = SUMMARY_FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+      else:
+        write = lambda result: file.write(json.dumps(result) + '\n')
+
+      for result in results:
+        write(result)
+        file.flush()
+        yield result
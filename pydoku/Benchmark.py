@@ -0,0 +1,378 @@
+"""
+Class benchmarking solver configurations on a fixed corpus of CNFs.
+
+The corpus holds Sudoku puzzles of every bundled size, encoded with the full rules and their givens, along with random
+3-SAT instances at the phase transition (4.26 clauses per variable), where they are hardest. Instances are generated
+deterministically, so every run measures the same work.
+
+Every configuration runs in a freshly spawned process, which keeps the peak resident set size (RSS) it reports its own.
+Each instance is first solved a few times to warm up, then solved repeatedly while timing only the call to solve: the
+CNF is prepared and copied beforehand. The median and interquartile range (IQR) of the run times are reported.
+The model of every satisfiable run is then checked by a ModelVerifier, outside of the timing, and an instance whose
+model does not satisfy its clauses is reported as not verified.
+
+Reports are plain dictionaries that can be stored as JSON. Comparing a report to a stored baseline flags every
+instance whose median run time grew by more than a tolerance, every instance whose satisfiability changed, and every
+instance that was not verified.
+"""
+
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pydoku.EngineType import EngineType
+from pydoku.HeuristicType import HeuristicType
+from pydoku.ModelVerifier import ModelVerifier
+from pydoku.RestartType import RestartType
+from pydoku.SATSolver import SATSolver
+from pydoku.Sudoku import Sudoku
+
+try:
+  import resource
+except ImportError:
+  resource = None
+
+TEST_FILES = os.path.join(os.path.dirname(__file__), 'test_files')
+
+SMALL = 'small'
+MEDIUM = 'medium'
+LARGE = 'large'
+
+# engines without clause learning take exponentially longer on the larger instances, so they skip them
+DEFAULT_CONFIGURATIONS = [
+  {'name': 'dpll', 'heuristic': HeuristicType.STANDARD_DPLL, 'engine': EngineType.RECURSIVE_DPLL, 'restart': RestartType.NONE, 'sizes': (SMALL,)},
+  {'name': 'iterative', 'heuristic': HeuristicType.STANDARD_DPLL, 'engine': EngineType.ITERATIVE_DPLL, 'restart': RestartType.NONE, 'sizes': (SMALL,)},
+  {'name': 'watched-moms', 'heuristic': HeuristicType.MAX_OCCURRENCES_MIN_SIZE, 'engine': EngineType.WATCHED_LITERALS, 'restart': RestartType.NONE, 'sizes': (SMALL, MEDIUM)},
+  {'name': 'cdcl-vsids', 'heuristic': HeuristicType.VSIDS, 'engine': EngineType.CDCL, 'restart': RestartType.NONE, 'sizes': (SMALL, MEDIUM, LARGE)},
+  {'name': 'cdcl-vsids-luby', 'heuristic': HeuristicType.VSIDS, 'engine': EngineType.CDCL, 'restart': RestartType.LUBY, 'sizes': (SMALL, MEDIUM, LARGE)}
+]
+
+# name, generator arguments, number of instances in a full and in a quick run, and size of the instances
+CORPUS = [
+  ('sudoku-4x4', (4,), 5, 2, SMALL),
+  ('sudoku-9x9', (9,), 3, 1, MEDIUM),
+  ('sudoku-16x16', (16,), 1, 1, LARGE),
+  ('random-3sat-50', (50, 213), 5, 2, SMALL),
+  ('random-3sat-100', (100, 426), 3, 1, MEDIUM)
+]
+
+class Benchmark:
+
+  def __init__(self, configurations: list = None, repeats: int = 5, warmup: int = 1, quick: bool = False):
+    """
+    Parameters
+    ----------
+    configurations : list
+        the configurations to benchmark, as dictionaries holding a name, heuristic, engine, restart policy and
+        the sizes of the instances to run, defaults to a configuration per engine
+    repeats : int
+        number of timed runs of every instance
+    warmup : int
+        number of untimed runs of every instance before the timed ones
+    quick : bool
+        only benchmark a few instances of every kind
+    """
+    if repeats < 1 or warmup < 0:
+      raise TypeError('Invalid number of runs provided as input.')
+
+    self.configurations = configurations if configurations is not None else DEFAULT_CONFIGURATIONS
+    self.repeats = repeats
+    self.warmup = warmup
+    self.quick = quick
+
+  def run(self, progress = None) -> dict:
+    """
+    Benchmarks every configuration, each in its own process
+
+    Parameters
+    ----------
+    progress : callable
+        called with the name of every configuration once it is benchmarked, None to stay silent
+
+    Returns
+    -------
+    dict
+        returns the report, holding the metadata of the run and the results of every configuration
+    """
+    context = multiprocessing.get_context('spawn')
+    report = {
+      'metadata': {
+        'date': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeats': self.repeats,
+        'warmup': self.warmup,
+        'quick': self.quick
+      },
+      'results': dict()
+    }
+
+    for configuration in self.configurations:
+      with context.Pool(1) as pool:
+        result = pool.apply(Benchmark.run_configuration, (configuration, self.repeats, self.warmup, self.quick))
+
+      report['results'][configuration['name']] = result
+
+      if progress is not None:
+        progress(configuration['name'])
+
+    return report
+
+  @staticmethod
+  def run_configuration(configuration: dict, repeats: int, warmup: int, quick: bool) -> dict:
+    """
+    Benchmarks a single configuration on the corpus
+
+    Parameters
+    ----------
+    configuration : dict
+        the name, heuristic, engine, restart policy and the sizes of the instances to run
+    repeats : int
+        number of timed runs of every instance
+    warmup : int
+        number of untimed runs of every instance before the timed ones
+    quick : bool
+        only benchmark a few instances of every kind
+
+    Returns
+    -------
+    dict
+        returns the statistics of every instance, including whether the model of every satisfiable run satisfies
+        its clauses, and the peak RSS of the process in bytes
+    """
+    heuristic = configuration['heuristic']
+    engine = configuration['engine']
+    restart = configuration['restart']
+    strings = engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL)
+    instances = dict()
+
+    for name, cnf in Benchmark.corpus(quick, configuration['sizes']):
+      if strings:
+        cnf = [[str(literal) for literal in clause] for clause in cnf]
+
+      times = list()
+      verifier = ModelVerifier(cnf)
+      models = list()
+
+      for run in range(warmup + repeats):
+        copy = [list(clause) for clause in cnf]
+        solver = SATSolver()
+        start_time = time.perf_counter()
+        satisfied, assignments, backtracks, splits = solver.solve(copy, heuristic, engine, restart)
+        run_time = time.perf_counter() - start_time
+
+        if run >= warmup:
+          times.append(run_time)
+
+        if satisfied:
+          models.append(assignments)
+
+      verified = all(falsified is None for falsified in verifier.check_all(models)) if satisfied else None
+      instances[name] = Benchmark.summarize(times)
+      instances[name].update({'satisfied': satisfied, 'verified': verified, 'backtracks': backtracks, 'splits': splits,
+                              'conflicts': solver.conflicts})
+
+    return {'instances': instances, 'peak_rss': Benchmark.peak_rss()}
+
+  @staticmethod
+  def corpus(quick: bool = False, sizes: tuple = (SMALL, MEDIUM, LARGE)) -> list:
+    """
+    Returns the instances of the corpus
+
+    Parameters
+    ----------
+    quick : bool
+        only return a few instances of every kind
+    sizes : tuple
+        the sizes of the instances to include
+
+    Returns
+    -------
+    list
+        returns a list of (name, cnf) pairs, the CNFs using integer literals
+    """
+    instances = list()
+
+    for kind, arguments, count, quick_count, size in CORPUS:
+      if size not in sizes:
+        continue
+
+      for index in range(quick_count if quick else count):
+        if kind.startswith('sudoku'):
+          cnf = Benchmark.sudoku(*arguments, index)
+        else:
+          cnf = Benchmark.random_3sat(*arguments, index)
+
+        instances.append((f'{kind}-{index}', cnf))
+
+    return instances
+
+  @staticmethod
+  def sudoku(size: int, index: int) -> list:
+    """
+    Returns a bundled Sudoku puzzle encoded with the full rules and its givens
+
+    Parameters
+    ----------
+    size : int
+        the number of rows of the board
+    index : int
+        the line of the puzzle in the examples of that size
+
+    Returns
+    -------
+    list
+        returns a list of clauses of integer literals
+    """
+    with open(os.path.join(TEST_FILES, f'{size}x{size}', 'examples.txt'), 'r') as file:
+      puzzles = [line for line in file if line.strip() != '']
+
+    grid = Sudoku.parse(puzzles[index])
+    sudoku = Sudoku.for_grid(grid)
+
+    return [[literal] for literal in sudoku.givens(grid)] + sudoku.rules()
+
+  @staticmethod
+  def random_3sat(variables: int, clauses: int, seed: int) -> list:
+    """
+    Returns a random 3-SAT instance, every clause holding three distinct variables with random signs
+
+    Parameters
+    ----------
+    variables : int
+        number of variables
+    clauses : int
+        number of clauses
+    seed : int
+        seed of the random generator
+
+    Returns
+    -------
+    list
+        returns a list of clauses of integer literals
+    """
+    generator = random.Random(seed)
+
+    return [[variable if generator.random() < 0.5 else -variable for variable in generator.sample(range(1, variables + 1), 3)]
+            for _ in range(clauses)]
+
+  @staticmethod
+  def summarize(times: list) -> dict:
+    """
+    Returns the statistics of the run times of an instance
+
+    Parameters
+    ----------
+    times : list
+        the run times in seconds
+
+    Returns
+    -------
+    dict
+        returns the median, interquartile range, minimum and maximum, along with every run time
+    """
+    ordered = sorted(times)
+
+    return {
+      'median': statistics.median(times),
+      'iqr': Benchmark.quantile(ordered, 0.75) - Benchmark.quantile(ordered, 0.25),
+      'min': min(times),
+      'max': max(times),
+      'runs': times
+    }
+
+  @staticmethod
+  def quantile(ordered: list, fraction: float) -> float:
+    """
+    Returns a quantile of sorted values, interpolating linearly between the two closest values
+
+    This gives the same quartiles as statistics.quantiles with the inclusive method, which needs Python 3.8.
+
+    Parameters
+    ----------
+    ordered : list
+        the values, sorted in increasing order
+    fraction : float
+        the fraction of the values below the quantile, between 0 and 1
+
+    Returns
+    -------
+    float
+        returns the quantile
+    """
+    position = (len(ordered) - 1) * fraction
+    index = int(position)
+
+    if index + 1 == len(ordered):
+      return ordered[index]
+
+    return ordered[index] + (ordered[index + 1] - ordered[index]) * (position - index)
+
+  @staticmethod
+  def peak_rss() -> int:
+    """
+    Returns the peak resident set size of the current process
+
+    Returns
+    -------
+    int
+        returns the peak RSS in bytes, or None if the platform does not report it
+    """
+    if resource is None:
+      return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes and macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+  @staticmethod
+  def compare(report: dict, baseline: dict, tolerance: float = 0.1, noise: float = 0.001) -> list:
+    """
+    Compares a report to a baseline report
+
+    Parameters
+    ----------
+    report : dict
+        the report of the current run
+    baseline : dict
+        the report to compare against
+    tolerance : float
+        relative growth of the median run time above which an instance regressed
+    noise : float
+        absolute growth of the median run time in seconds below which an instance never regressed
+
+    Returns
+    -------
+    list
+        returns a message for every regression, empty if there is none
+    """
+    regressions = list()
+
+    for name, result in report['results'].items():
+      if name not in baseline['results']:
+        continue
+
+      previous = baseline['results'][name]['instances']
+
+      for instance, current in result['instances'].items():
+        if current.get('verified') is False:
+          regressions.append(f'{name} {instance}: the model found does not satisfy the clauses')
+
+        if instance not in previous:
+          continue
+
+        if current['satisfied'] != previous[instance]['satisfied']:
+          regressions.append(f'{name} {instance}: satisfiable changed from {previous[instance]["satisfied"]} to {current["satisfied"]}')
+
+        median = current['median']
+        baseline_median = previous[instance]['median']
+
+        if median > baseline_median * (1 + tolerance) and median - baseline_median > noise:
+          regressions.append(f'{name} {instance}: median {median:.4f}s against {baseline_median:.4f}s, {median / baseline_median - 1:+.1%}')
+
+    return regressions
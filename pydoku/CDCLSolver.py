@@ -0,0 +1,505 @@
+"""
+Class containing a conflict-driven clause learning (CDCL) search built on the watched literal engine.
+
+Instead of flipping the most recent decision after a conflict, the conflict is analysed back to its first
+unique implication point (1-UIP). The resulting clause is learned, and the search jumps back to the second
+highest decision level in that clause, where the learned clause immediately asserts the negation of the UIP.
+
+The search can optionally restart following a RestartPolicy. Restarts go together with phase saving: the polarity
+of every unassigned variable is remembered and reused at its next decision, so a restart keeps the partial
+assignments the search already found instead of throwing them away.
+
+Learned clauses are kept in a ClauseDatabase, which periodically deletes the least useful ones.
+
+The search can also run under assumptions: literals that are decided first, one per decision level, before the
+heuristic picks any other literal. Since assumptions are decisions rather than clauses, everything learned under
+them stays valid once they are dropped, which is what the IncrementalSolver relies on.
+
+Pure literals can only be set at the root: a pure literal has no reason clause, and below the root it could end up
+in a learned clause that conflict analysis would need to explain.
+
+When given a ClauseExchange, short learned clauses are exported to engines solving the same CNF in other processes,
+and the clauses they exported are imported whenever the search is back at decision level 0.
+"""
+
+from pydoku.ClauseDatabase import ClauseDatabase
+from pydoku.HeuristicType import HeuristicType
+from pydoku.PureLiteralType import PureLiteralType
+from pydoku.RestartPolicy import RestartPolicy
+from pydoku.RestartType import RestartType
+from pydoku.SolverBudget import SolverBudget
+from pydoku.SolverHooks import SolverHooks
+from pydoku.WatchedLiteralSolver import WatchedLiteralSolver, COUNTED_HEURISTICS
+import time
+
+class CDCLSolver(WatchedLiteralSolver):
+
+  def __init__(self, restart: RestartType = RestartType.NONE, reduce_interval: int = 2000, reduce_increment: int = 300,
+               hooks: SolverHooks = None, budget: SolverBudget = None, pure_literals: PureLiteralType = PureLiteralType.NONE):
+    """
+    Parameters
+    ----------
+    restart : RestartType
+        the restart policy to follow, phase saving is enabled along with any policy other than NONE
+    reduce_interval : int
+        number of conflicts before the first reduction of the learned clauses
+    reduce_increment : int
+        growth of the number of conflicts between two reductions of the learned clauses
+    hooks : SolverHooks
+        the callbacks to invoke while searching, None for no callbacks
+    budget : SolverBudget
+        the limits of every solve, None to always run until an answer is found
+    pure_literals : PureLiteralType
+        whether the search sets pure literals to True at the root, they are never set below it
+    """
+    super().__init__(hooks, budget, pure_literals)
+
+    if restart not in RestartType:
+      raise TypeError('Invalid restart policy provided as input.')
+
+    if pure_literals == PureLiteralType.ALL:
+      raise TypeError('Pure literals below the root are not supported by the CDCL engine.')
+
+    self.restart = restart
+    self.phase_saving = restart != RestartType.NONE
+    self.policy = RestartPolicy(restart)
+    self.restarts = 0
+    self.phases = list()
+    self.reduce_interval = reduce_interval
+    self.reduce_increment = reduce_increment
+    self.learned_clauses = 0
+    self.database = ClauseDatabase(reduce_interval, reduce_increment)
+    self.levels = list()
+    self.reasons = list()
+    self.seen = list()
+    self.trail_limits = list()
+    self.assumptions = list()
+    self.failed_assumption = None
+    self.exchange = None
+    self.imported_clauses = 0
+
+  def solve(self, cnf: list, heuristic: HeuristicType) -> [bool, dict, int, int]:
+    """
+    Solves a boolean satisfiability problem represented in conjunctive normal form (CNF)
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, literals may be given as strings or integers
+    heuristic : HeuristicType
+        an Enum value giving us an indication of the branching heuristic to use while searching
+
+    Returns
+    -------
+    [bool, dict, int, int]
+        returns true if a satisfiable solution to the CNF was found, or None if the budget ran out first,
+        along with a the valid assignments, the number of backtracks, and number of splits.
+
+    See Also
+    --------
+    search : function implementing the logic for the CDCL search
+    """
+    self.learned_clauses = 0
+    self.restarts = 0
+    self.policy = RestartPolicy(self.restart)
+
+    return super().solve(cnf, heuristic)
+
+  def allocate(self, max_variable: int) -> None:
+    """
+    Creates empty watches, assignments and trail, along with the decision level and reason of every variable
+
+    Parameters
+    ----------
+    max_variable : int
+        the largest variable occurring in the CNF
+
+    Returns
+    -------
+    None
+    """
+    super().allocate(max_variable)
+    self.database = ClauseDatabase(self.reduce_interval, self.reduce_increment)
+    self.levels = [0] * (max_variable + 1)
+    self.reasons = [None] * (max_variable + 1)
+    self.seen = [False] * (max_variable + 1)
+    self.phases = [None] * (max_variable + 1)
+    self.trail_limits = list()
+
+  def assign(self, literal: int, reason: list = None) -> None:
+    """
+    Sets the literal to True and pushes it on the trail, recording its decision level and reason
+
+    Parameters
+    ----------
+    literal : int
+        the literal to set to True
+    reason : list
+        the clause that implied the literal, None for decisions
+
+    Returns
+    -------
+    None
+    """
+    variable = abs(literal)
+    self.values[literal] = True
+    self.values[-literal] = False
+    self.levels[variable] = len(self.trail_limits)
+    self.reasons[variable] = reason
+    self.trail.append(literal)
+
+    if self.counters is not None:
+      self.counters.assign(literal)
+
+  def search(self, heuristic: HeuristicType) -> bool:
+    """
+    Runs the CDCL search: propagate, learn a clause and backjump on conflicts, otherwise decide
+
+    Assumptions are decided before anything else. The search stops as unsatisfiable as soon as one of them is
+    falsified, recording it as the failed assumption, while a conflict at level 0 makes the CNF itself inconsistent.
+
+    Parameters
+    ----------
+    heuristic : HeuristicType
+        the type of heuristic to use while picking the next literal
+
+    Returns
+    -------
+    bool
+        returns true if the CNF is satisfiable under the assumptions, or None if the budget ran out
+
+    See Also
+    --------
+    RestartPolicy : class deciding when to restart the search
+    analyze : function implementing the 1-UIP conflict analysis
+    backjump : function undoing every decision level above the given one
+    """
+    self.count_occurrences(heuristic)
+
+    if self.inconsistent:
+      self.conflicts += 1
+      return False
+
+    if self.pure_literals == PureLiteralType.ROOT:
+      if self.propagate() is not None:
+        self.conflicts += 1
+        self.inconsistent = True
+        return False
+
+      self.assign_pure_literals()
+
+      if heuristic not in COUNTED_HEURISTICS:
+        self.counters = None
+
+    hooks = self.hooks
+    budget = self.budget
+    statistics = self.statistics
+
+    while True:
+      if budget is not None and budget.exhausted(self.splits, self.conflicts):
+        return None
+
+      if self.exchange is not None and len(self.trail_limits) == 0 and not self.import_clauses():
+        self.conflicts += 1
+        return False
+
+      conflict = self.propagate()
+
+      if conflict is not None:
+        self.conflicts += 1
+
+        if hooks is not None:
+          self.update_statistics()
+          hooks.conflict(conflict, statistics)
+
+        if len(self.trail_limits) == 0:
+          self.inconsistent = True
+          return False
+
+        learned, level = self.analyze(conflict)
+        lbd = self.get_lbd(learned)
+        self.policy.on_conflict(lbd)
+        self.backtracks += 1
+        self.backjump(level)
+        self.learn(learned, lbd)
+
+        if self.database.should_reduce(self.conflicts):
+          self.reduce_database()
+
+        continue
+
+      if self.policy.should_restart():
+        self.restarts += 1
+        self.policy.on_restart()
+        self.backjump(0)
+
+        if hooks is not None:
+          self.update_statistics()
+          hooks.restart(statistics)
+        continue
+
+      # assumptions already implied by earlier ones still get their own, empty, decision level
+      if len(self.trail_limits) < len(self.assumptions):
+        literal = self.assumptions[len(self.trail_limits)]
+
+        if self.values[literal] is False:
+          self.failed_assumption = literal
+          return False
+
+        self.trail_limits.append(len(self.trail))
+
+        if self.values[literal] is None:
+          self.assign(literal)
+        continue
+
+      start_time = time.perf_counter()
+      literal = self.next_literal(heuristic)
+
+      if literal is not None and self.phase_saving and self.phases[abs(literal)] is not None:
+        literal = abs(literal) if self.phases[abs(literal)] else -abs(literal)
+
+      statistics.branching_time += time.perf_counter() - start_time
+
+      if literal is None:
+        return True
+
+      self.splits += 1
+      self.trail_limits.append(len(self.trail))
+      self.assign(literal)
+
+      if hooks is not None:
+        self.update_statistics()
+        hooks.decision(literal, statistics)
+
+  def update_statistics(self) -> None:
+    """
+    Copies the counters of the search, including restarts and learned clauses, and the time elapsed since the
+    start of the solve into the statistics
+
+    Returns
+    -------
+    None
+    """
+    super().update_statistics()
+    self.statistics.restarts = self.restarts
+    self.statistics.learned_clauses = self.learned_clauses
+
+  def analyze(self, conflict: list) -> [list, int]:
+    """
+    Derives the first unique implication point (1-UIP) clause from a conflicting clause
+
+    Starting from the conflict, literals of the current decision level are resolved away with their reasons,
+    walking the trail backwards, until only one literal of the current level is left. That literal is the UIP.
+
+    Parameters
+    ----------
+    conflict : list
+        the clause falsified by unit propagation
+
+    Returns
+    -------
+    [list, int]
+        returns the learned clause, with the negated UIP first and a literal of the backjump level second,
+        along with the decision level to backjump to
+    """
+    levels = self.levels
+    seen = self.seen
+    trail = self.trail
+    current_level = len(self.trail_limits)
+
+    learned = [None]
+    pending = 0
+    position = len(trail) - 1
+    clause = conflict
+    literal = None
+
+    while True:
+      if clause in self.database:
+        self.database.bump(clause)
+
+      for other in clause:
+        variable = abs(other)
+
+        if other == literal or seen[variable] or levels[variable] == 0:
+          continue
+
+        seen[variable] = True
+        self.bump(variable)
+
+        if levels[variable] == current_level:
+          pending += 1
+        else:
+          learned.append(other)
+
+      while not seen[abs(trail[position])]:
+        position -= 1
+
+      literal = trail[position]
+      position -= 1
+      seen[abs(literal)] = False
+      pending -= 1
+
+      if pending == 0:
+        break
+
+      clause = self.reasons[abs(literal)]
+
+    learned[0] = -literal
+    self.decay_activity()
+    self.database.decay()
+
+    for other in learned[1:]:
+      seen[abs(other)] = False
+
+    if len(learned) == 1:
+      return learned, 0
+
+    # the literal with the highest level below the current one becomes the second watch
+    highest = max(range(1, len(learned)), key = lambda index: levels[abs(learned[index])])
+    learned[1], learned[highest] = learned[highest], learned[1]
+
+    return learned, levels[abs(learned[1])]
+
+  def get_lbd(self, clause: list) -> int:
+    """
+    Returns the literal block distance (LBD) of a clause, which is the number of distinct decision levels in it
+
+    Parameters
+    ----------
+    clause : list
+        the clause to compute the LBD of
+
+    Returns
+    -------
+    int
+        returns the number of distinct decision levels among the literals of the clause
+    """
+    levels = self.levels
+
+    return len({levels[abs(literal)] for literal in clause})
+
+  def backtrack_to(self, mark: int) -> None:
+    """
+    Unassigns every literal that was pushed on the trail after the given position, saving its phase if enabled
+
+    Parameters
+    ----------
+    mark : int
+        length of the trail to go back to
+
+    Returns
+    -------
+    None
+    """
+    if self.phase_saving:
+      phases = self.phases
+
+      for literal in self.trail[mark:]:
+        phases[abs(literal)] = literal > 0
+
+    super().backtrack_to(mark)
+
+  def backjump(self, level: int) -> None:
+    """
+    Unassigns every literal assigned at a decision level above the given one
+
+    Parameters
+    ----------
+    level : int
+        the decision level to go back to
+
+    Returns
+    -------
+    None
+    """
+    if level < len(self.trail_limits):
+      self.backtrack_to(self.trail_limits[level])
+      del self.trail_limits[level:]
+
+  def learn(self, learned: list, lbd: int) -> None:
+    """
+    Adds a learned clause and assigns its asserting literal, which is the only unassigned literal after backjumping
+
+    Parameters
+    ----------
+    learned : list
+        the learned clause with the asserting literal first
+    lbd : int
+        the literal block distance of the learned clause
+
+    Returns
+    -------
+    None
+    """
+    self.learned_clauses += 1
+
+    if self.exchange is not None and len(learned) <= self.exchange.max_size:
+      self.exchange.export(learned)
+
+    if len(learned) == 1:
+      self.assign(learned[0])
+      return
+
+    self.database.add(learned, lbd)
+    self.watches[learned[0]].append(learned)
+    self.watches[learned[1]].append(learned)
+    self.assign(learned[0], learned)
+
+  def reduce_database(self) -> None:
+    """
+    Deletes the least useful learned clauses and stops watching them
+
+    A clause is locked, and kept, while its first literal is assigned with the clause as its reason.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    ClauseDatabase : class storing the learned clauses and deciding which ones to delete
+    """
+    values = self.values
+    reasons = self.reasons
+    locked = lambda clause: values[clause[0]] is True and reasons[abs(clause[0])] is clause
+    deleted = self.database.reduce(self.conflicts, locked)
+    removed = {id(clause) for clause in deleted}
+    watched = {literal for clause in deleted for literal in clause[:2]}
+
+    for literal in watched:
+      self.watches[literal] = [clause for clause in self.watches[literal] if id(clause) not in removed]
+
+  def import_clauses(self) -> bool:
+    """
+    Adds the clauses exported by other processes through the exchange, simplified against the root assignments
+
+    Must only be called at decision level 0. Imported clauses are stored with the learned clauses, using their
+    length as their LBD, so they are reduced like any other learned clause.
+
+    Returns
+    -------
+    bool
+        returns false if an imported clause is falsified at the root, making the CNF unsatisfiable
+    """
+    values = self.values
+
+    for clause in self.exchange.collect():
+      if any(values[literal] is True for literal in clause):
+        continue
+
+      literals = [literal for literal in clause if values[literal] is None]
+      self.imported_clauses += 1
+
+      if len(literals) == 0:
+        self.inconsistent = True
+        return False
+
+      if len(literals) == 1:
+        self.assign(literals[0])
+        continue
+
+      self.database.add(literals, len(literals))
+      self.watches[literals[0]].append(literals)
+      self.watches[literals[1]].append(literals)
+
+    return True
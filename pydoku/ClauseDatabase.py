@@ -0,0 +1,149 @@
+"""
+Class containing the learned clauses of the CDCL engine, kept apart from the clauses of the original CNF.
+
+Every learned clause carries its literal block distance (LBD) and an activity that is bumped whenever the clause takes
+part in conflict analysis. Once enough conflicts happened, the least useful half of the learned clauses is deleted:
+clauses with a high LBD and a low activity go first, while glue clauses (a small LBD) and clauses that are currently
+the reason for an assignment are always kept. The number of conflicts between reductions grows linearly, which keeps
+the database, and with it the memory used by the solver, bounded on long runs.
+"""
+
+CLAUSE_DECAY = 0.999
+CLAUSE_ACTIVITY_LIMIT = 1e20
+
+class ClauseDatabase:
+
+  def __init__(self, interval: int = 2000, increment: int = 300, glue: int = 2):
+    """
+    Parameters
+    ----------
+    interval : int
+        number of conflicts before the first reduction
+    increment : int
+        growth of the number of conflicts between two reductions after every reduction
+    glue : int
+        learned clauses with an LBD up to this value are never deleted
+    """
+    self.interval = interval
+    self.increment = increment
+    self.glue = glue
+    self.clauses = list()
+    self.lbd = dict()
+    self.activity = dict()
+    self.bump_increment = 1.0
+    self.reductions = 0
+    self.deleted = 0
+    self.next_reduction = interval
+
+  def __len__(self) -> int:
+    return len(self.clauses)
+
+  def __contains__(self, clause: list) -> bool:
+    return id(clause) in self.lbd
+
+  def add(self, clause: list, lbd: int) -> None:
+    """
+    Stores a learned clause along with its literal block distance
+
+    Parameters
+    ----------
+    clause : list
+        the learned clause
+    lbd : int
+        the number of distinct decision levels in the clause when it was learned
+
+    Returns
+    -------
+    None
+    """
+    self.clauses.append(clause)
+    self.lbd[id(clause)] = lbd
+    self.activity[id(clause)] = self.bump_increment
+
+  def bump(self, clause: list) -> None:
+    """
+    Increases the activity of a learned clause that took part in conflict analysis
+
+    Parameters
+    ----------
+    clause : list
+        the learned clause
+
+    Returns
+    -------
+    None
+    """
+    activity = self.activity
+    key = id(clause)
+    activity[key] += self.bump_increment
+
+    if activity[key] > CLAUSE_ACTIVITY_LIMIT:
+      for other in activity:
+        activity[other] /= CLAUSE_ACTIVITY_LIMIT
+
+      self.bump_increment /= CLAUSE_ACTIVITY_LIMIT
+
+  def decay(self) -> None:
+    """
+    Decays the activity of every learned clause by growing the increment used for future bumps instead
+
+    Returns
+    -------
+    None
+    """
+    self.bump_increment /= CLAUSE_DECAY
+
+  def should_reduce(self, conflicts: int) -> bool:
+    """
+    Returns whether the database is due for a reduction
+
+    Parameters
+    ----------
+    conflicts : int
+        the number of conflicts so far
+
+    Returns
+    -------
+    bool
+        returns true if enough conflicts happened since the last reduction
+    """
+    return conflicts >= self.next_reduction
+
+  def reduce(self, conflicts: int, locked) -> list:
+    """
+    Deletes the least useful half of the learned clauses and schedules the next reduction
+
+    Parameters
+    ----------
+    conflicts : int
+        the number of conflicts so far
+    locked : callable
+        returns true for a clause that is the reason of a current assignment and therefore must be kept
+
+    Returns
+    -------
+    list
+        returns the deleted clauses, so their watches can be dropped
+    """
+    self.reductions += 1
+    self.next_reduction = conflicts + self.interval + self.reductions * self.increment
+
+    lbd = self.lbd
+    activity = self.activity
+    candidates = [clause for clause in self.clauses if lbd[id(clause)] > self.glue and not locked(clause)]
+    candidates.sort(key = lambda clause: (-lbd[id(clause)], activity[id(clause)]))
+    deleted = candidates[:len(self.clauses) // 2]
+
+    if len(deleted) == 0:
+      return deleted
+
+    removed = {id(clause) for clause in deleted}
+    self.clauses = [clause for clause in self.clauses if id(clause) not in removed]
+
+    for key in removed:
+      del lbd[key]
+      del activity[key]
+
+    self.deleted += len(deleted)
+
+    return deleted
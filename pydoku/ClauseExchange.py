@@ -0,0 +1,81 @@
+"""
+Class containing a shared-memory buffer through which CDCL engines running in separate processes share learned clauses.
+
+The buffer is a ring of fixed-size slots in shared memory, each holding the process that exported a clause, its
+length and its literals. Only short clauses are exchanged, since they prune the most and fit in a slot. A shared
+counter tracks how many clauses were exported so far; every process remembers how far it has read and collects the
+clauses exported since, skipping its own. A process lagging more than a full ring behind simply misses the
+overwritten clauses, which is harmless since sharing learned clauses only speeds the search up.
+
+The exchange must be created before the processes are started so they all inherit the same shared memory.
+Every process then sets its own owner before exporting or collecting clauses.
+"""
+
+import multiprocessing
+
+class ClauseExchange:
+
+  def __init__(self, slots: int = 4096, max_size: int = 8):
+    """
+    Parameters
+    ----------
+    slots : int
+        number of clauses the ring holds before the oldest ones are overwritten
+    max_size : int
+        only learned clauses with at most this many literals are exchanged
+    """
+    self.slots = slots
+    self.max_size = max_size
+    self.slot_size = max_size + 2
+    self.buffer = multiprocessing.RawArray('i', slots * self.slot_size)
+    self.count = multiprocessing.RawValue('q', 0)
+    self.lock = multiprocessing.Lock()
+    self.owner = 0
+    self.cursor = 0
+
+  def export(self, clause: list) -> None:
+    """
+    Publishes a learned clause to the other processes
+
+    Parameters
+    ----------
+    clause : list
+        the integer literals of the clause, at most max_size of them
+
+    Returns
+    -------
+    None
+    """
+    with self.lock:
+      base = (self.count.value % self.slots) * self.slot_size
+      self.buffer[base] = self.owner
+      self.buffer[base + 1] = len(clause)
+      self.buffer[base + 2:base + 2 + len(clause)] = clause
+      self.count.value += 1
+
+  def collect(self) -> list:
+    """
+    Returns the clauses exported by the other processes since the last call
+
+    Returns
+    -------
+    list
+        returns a list of clauses of integer literals
+    """
+    if self.count.value == self.cursor:
+      return list()
+
+    clauses = list()
+
+    with self.lock:
+      count = self.count.value
+
+      for index in range(max(self.cursor, count - self.slots), count):
+        base = (index % self.slots) * self.slot_size
+
+        if self.buffer[base] != self.owner:
+          clauses.append(self.buffer[base + 2:base + 2 + self.buffer[base + 1]])
+
+    self.cursor = count
+
+    return clauses
@@ -0,0 +1,147 @@
+"""
+Class containing a compact, flat representation of a CNF.
+
+All literals are stored back to back in a single buffer of 32 bit integers, and a second buffer of 64 bit integers
+holds the offset at which every clause starts, followed by the total number of literals. Clause i therefore spans
+literals[offsets[i]:offsets[i + 1]]. This takes 4 bytes per literal instead of a Python string per literal, and the
+buffers can be backed by a memory-mapped file so a CNF can be reloaded without parsing or copying it.
+
+The savings hold while the CNF is held and reloaded, not while it is searched: every engine still builds its own
+clauses to search. The watched literal and CDCL engines read the buffers directly into their clauses, without a list
+of lists in between, while the string literal engines, the preprocessor and the splitting into components first copy
+the store into lists of literals.
+"""
+
+from array import array
+
+class ClauseStore:
+
+  def __init__(self, literals = None, offsets = None, buffer = None):
+    """
+    Parameters
+    ----------
+    literals : array or memoryview
+        the literals of every clause, back to back, as 32 bit integers
+    offsets : array or memoryview
+        the offset of the first literal of every clause, followed by the total number of literals, as 64 bit integers
+    buffer : mmap
+        the memory-mapped file backing the buffers, if any, closed along with the store
+    """
+    self.literals = literals if literals is not None else array('i')
+    self.offsets = offsets if offsets is not None else array('q', [0])
+    self.buffer = buffer
+
+  @staticmethod
+  def from_clauses(clauses) -> 'ClauseStore':
+    """
+    Builds a store from an iterable of clauses, consuming it one clause at a time
+
+    Parameters
+    ----------
+    clauses : iterable
+        the clauses of the CNF, with literals given as integers or strings
+
+    Returns
+    -------
+    ClauseStore
+        returns the store holding every clause
+    """
+    store = ClauseStore()
+
+    for clause in clauses:
+      store.append(clause)
+
+    return store
+
+  def append(self, clause: list) -> None:
+    """
+    Adds a clause at the end of the store
+
+    Parameters
+    ----------
+    clause : list
+        the literals of the clause, as integers or strings
+
+    Returns
+    -------
+    None
+    """
+    self.literals.extend(int(literal) for literal in clause)
+    self.offsets.append(len(self.literals))
+
+  def __len__(self) -> int:
+    return len(self.offsets) - 1
+
+  def __getitem__(self, index: int):
+    if index < 0:
+      index += len(self)
+
+    if not 0 <= index < len(self):
+      raise IndexError('Clause index out of range.')
+
+    return self.literals[self.offsets[index]:self.offsets[index + 1]]
+
+  def __iter__(self):
+    literals = self.literals
+    offsets = self.offsets
+
+    for index in range(len(offsets) - 1):
+      yield literals[offsets[index]:offsets[index + 1]]
+
+  def to_lists(self, strings: bool = False) -> list:
+    """
+    Returns the clauses as a list of lists, in the representation used by the string literal engines if asked for
+
+    Parameters
+    ----------
+    strings : bool
+        return the literals as strings instead of integers
+
+    Returns
+    -------
+    list
+        returns a list of clauses
+    """
+    if strings:
+      return [[str(literal) for literal in clause] for clause in self]
+
+    return [list(clause) for clause in self]
+
+  @property
+  def nbytes(self) -> int:
+    """
+    Returns the number of bytes taken by the literal and offset buffers
+    """
+    return len(self.literals) * self.literals.itemsize + len(self.offsets) * self.offsets.itemsize
+
+  def close(self) -> None:
+    """
+    Releases the memory-mapped file backing the store, if any
+
+    A clause taken from the store, or an array built over its buffers, keeps the file mapped until it is garbage
+    collected, the store being emptied all the same.
+
+    Returns
+    -------
+    None
+    """
+    if self.buffer is None:
+      return
+
+    try:
+      self.literals.release()
+      self.offsets.release()
+      self.buffer.close()
+    except BufferError:
+      # views of the buffers are still held, the file is unmapped once the last of them is gone
+      pass
+
+    self.buffer = None
+    self.literals = array('i')
+    self.offsets = array('q', [0])
+
+  def __enter__(self) -> 'ClauseStore':
+    return self
+
+  def __exit__(self, *exception) -> None:
+    self.close()
@@ -0,0 +1,207 @@
+"""
+Class splitting a CNF into components, groups of clauses that share no variable with any other group.
+
+Two clauses belong to the same component when they share a variable, directly or through a chain of other clauses,
+so the components are found with a union-find over the variables in a single pass over the CNF. Every component can
+then be solved on its own: the CNF is satisfiable exactly when every component is, and the union of their models is
+a model of the CNF. A conflict in one component no longer makes the search backtrack over the decisions made in
+another one, and components can be solved in parallel.
+
+CNFs often only fall apart once the root is simplified, for instance Sudoku puzzles whose givens fix most of the
+grid, or several puzzles merged into one file. The root is therefore first simplified by unit propagation, and
+optionally pure literal elimination, before it is split.
+
+Clauses are taken as lists of integer literals or of string literals, whichever the CNF uses.
+"""
+
+class ComponentSplitter:
+
+  def __init__(self, pure: bool = False):
+    """
+    Parameters
+    ----------
+    pure : bool
+        set pure literals to True when simplifying the root, on top of unit propagation
+    """
+    self.pure = pure
+    self.propagations = 0
+    self.pure_literals = 0
+
+  def simplify(self, cnf: list) -> [list, dict]:
+    """
+    Propagates the unit clauses of the CNF, and eliminates its pure literals if asked to, until neither is left
+
+    Every literal is visited once by unit propagation, which keeps the number of unassigned literals of every clause
+    and walks the clauses containing the negation of each literal set. Pure literals are looked for in a pass over
+    the clauses left once propagation is done, which is repeated as long as new pure literals are found.
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF
+
+    Returns
+    -------
+    [list, dict]
+        returns the clauses left, without the literals set to False, along with a dictionary mapping every literal
+        set to True to True, or None and None if the CNF is unsatisfiable
+    """
+    clauses = [list(dict.fromkeys(clause)) for clause in cnf]
+    occurrences = dict()
+
+    for index, clause in enumerate(clauses):
+      if len(clause) == 0:
+        return None, None
+
+      for literal in clause:
+        occurrences.setdefault(literal, list()).append(index)
+
+    sizes = [len(clause) for clause in clauses]
+    satisfied = [False] * len(clauses)
+    assigned = dict()
+    queue = [clause[0] for clause in clauses if len(clause) == 1]
+
+    while True:
+      while len(queue) != 0:
+        literal = queue.pop()
+
+        if literal in assigned:
+          continue
+
+        negation = self.get_negation(literal)
+
+        if negation in assigned:
+          return None, None
+
+        assigned[literal] = True
+        self.propagations += 1
+
+        for index in occurrences.get(literal, ()):
+          satisfied[index] = True
+
+        for index in occurrences.get(negation, ()):
+          if satisfied[index]:
+            continue
+
+          sizes[index] -= 1
+
+          if sizes[index] == 0:
+            return None, None
+
+          if sizes[index] == 1:
+            queue.extend(unit for unit in clauses[index] if self.get_negation(unit) not in assigned)
+
+      if not self.pure:
+        break
+
+      counts = dict()
+
+      for index, clause in enumerate(clauses):
+        if not satisfied[index]:
+          for literal in clause:
+            if self.get_negation(literal) not in assigned:
+              counts[literal] = counts.get(literal, 0) + 1
+
+      pure_literals = [literal for literal in counts if self.get_negation(literal) not in counts]
+
+      if len(pure_literals) == 0:
+        break
+
+      # pure literals only satisfy clauses, so they can never lead to a conflict or a new unit clause
+      self.pure_literals += len(pure_literals)
+
+      for literal in pure_literals:
+        assigned[literal] = True
+
+        for index in occurrences[literal]:
+          satisfied[index] = True
+
+    remaining = [[literal for literal in clause if self.get_negation(literal) not in assigned]
+                 for index, clause in enumerate(clauses) if not satisfied[index]]
+
+    return remaining, {str(literal): True for literal in assigned}
+
+  def split(self, cnf: list) -> list:
+    """
+    Splits the CNF into the components of clauses sharing no variable with each other
+
+    Parameters
+    ----------
+    cnf : list
+        a list of non-empty clauses that belong to the CNF
+
+    Returns
+    -------
+    list
+        returns a list of components, each a list of clauses in the order they appear in the CNF,
+        the components with the fewest clauses first
+    """
+    parents = dict()
+
+    def find(variable):
+      parents.setdefault(variable, variable)
+
+      # halve the path on the way up, so later lookups get shorter
+      while parents[variable] != variable:
+        parents[variable] = parents[parents[variable]]
+        variable = parents[variable]
+
+      return variable
+
+    roots = list()
+
+    for clause in cnf:
+      root = find(self.get_variable(clause[0]))
+
+      for literal in clause[1:]:
+        other = find(self.get_variable(literal))
+
+        if other != root:
+          parents[other] = root
+
+      roots.append(root)
+
+    components = dict()
+
+    for index, clause in enumerate(cnf):
+      components.setdefault(find(roots[index]), list()).append(clause)
+
+    return sorted(components.values(), key = len)
+
+  def get_variable(self, literal):
+    """
+    Returns the variable of the literal provided as parameter
+
+    Parameters
+    ----------
+    literal : int or str
+        the literal whose variable you want to obtain
+
+    Returns
+    -------
+    int or str
+        returns the literal without its sign
+    """
+    if isinstance(literal, int):
+      return abs(literal)
+
+    return literal[1:] if literal[0] == '-' else literal
+
+  def get_negation(self, literal):
+    """
+    Returns the negation of the literal provided as parameter
+
+    Parameters
+    ----------
+    literal : int or str
+        the literal whose negation you want to obtain
+
+    Returns
+    -------
+    int or str
+        returns the negation of the literal
+    """
+    if isinstance(literal, int):
+      return -literal
+
+    return literal[1:] if literal[0] == '-' else f'-{literal}'
@@ -0,0 +1,392 @@
+"""
+Class solving a single hard CNF with cube-and-conquer over a pool of processes.
+
+The CNF is first split into cubes, partial assignments that together cover the whole search space, by a lookahead
+search. At every node the lookahead assigns both polarities of the most promising free variables in turn and
+propagates them: a polarity leading to a conflict is a failed literal, whose negation is added to the cube, and
+the variable implying the most assignments in both polarities (the product of both counts) is split on. Cubes
+refuted by propagation are dropped on the spot.
+
+Every worker process loads the CNF once into an IncrementalSolver and solves cubes as assumptions, keeping its
+learned clauses from one cube to the next. Each worker starts with its own block of consecutive cubes, which share
+most of their literals, and a worker that runs out of cubes steals the last pending cube of the worker with the most
+cubes left. As soon as any cube is satisfiable the workers are stopped, and the CNF is unsatisfiable once every cube
+was refuted.
+
+Every worker gets its own copy of the budget, if any, covering every cube it solves. A cube left unsolved once the
+budget ran out makes the outcome UNKNOWN, unless another cube is satisfiable.
+"""
+
+import multiprocessing
+import os
+import queue
+from pydoku.ClauseStore import ClauseStore
+from pydoku.HeuristicType import HeuristicType
+from pydoku.IncrementalSolver import IncrementalSolver
+from pydoku.RestartType import RestartType
+from pydoku.SolverBudget import SolverBudget
+from pydoku.StatusType import StatusType
+from pydoku.WatchedLiteralSolver import WatchedLiteralSolver
+
+# seconds between two checks that the workers are still running while cubes are left unanswered
+POLL_INTERVAL = 0.5
+
+class CubeSolver:
+
+  def __init__(self, heuristic: HeuristicType = HeuristicType.VSIDS, restart: RestartType = RestartType.LUBY, workers: int = None,
+               depth: int = None, candidates: int = 32, budget: SolverBudget = None):
+    """
+    Parameters
+    ----------
+    heuristic : HeuristicType
+        the branching heuristic the workers solve cubes with
+    restart : RestartType
+        the restart policy the workers solve cubes with
+    workers : int
+        number of worker processes, defaults to the number of CPUs
+    depth : int
+        number of splits along every branch of the lookahead, defaults to enough for 16 cubes per worker
+    candidates : int
+        number of free variables, the most frequent ones, evaluated by the lookahead at every node
+    budget : SolverBudget
+        the limits of the search of every worker, None to run until an answer is found
+    """
+    if heuristic not in HeuristicType:
+      raise TypeError('Invalid heuristic provided as input.')
+
+    if restart not in RestartType:
+      raise TypeError('Invalid restart policy provided as input.')
+
+    if workers is not None and workers < 1:
+      raise TypeError('Invalid number of workers provided as input.')
+
+    if depth is not None and depth < 0:
+      raise TypeError('Invalid depth provided as input.')
+
+    self.heuristic = heuristic
+    self.restart = restart
+    self.workers = workers or os.cpu_count() or 1
+    self.depth = depth if depth is not None else (self.workers * 16 - 1).bit_length()
+    self.candidates = candidates
+    self.budget = budget
+    self.status = None
+    self.cubes = 0
+    self.refuted_cubes = 0
+    self.solved_cubes = 0
+    self.backtracks = 0
+    self.splits = 0
+    self.conflicts = 0
+
+  def solve(self, cnf: list) -> [bool, dict, int, int]:
+    """
+    Splits the CNF into cubes and solves them in parallel
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, or a ClauseStore holding them
+
+    Returns
+    -------
+    [bool, dict, int, int]
+        returns true if a satisfiable solution to the CNF was found along with a the valid assignments, or None if
+        a cube was left unsolved by a worker that ran out of its budget, and the number of backtracks and splits
+        summed over every cube solved. The StatusType of the solve is available as the status attribute.
+        The number of cubes, of cubes refuted by the lookahead and of cubes solved are available as attributes afterwards.
+
+    Raises
+    ------
+    RuntimeError
+        if a worker process failed, or exited without answering its cubes
+
+    See Also
+    --------
+    split : function generating the cubes with a lookahead search
+    run_worker : function solving cubes inside a worker process
+    """
+    if isinstance(cnf, ClauseStore):
+      cnf = cnf.to_lists()
+
+    self.backtracks = 0
+    self.splits = 0
+    self.conflicts = 0
+    self.solved_cubes = 0
+    self.status = None
+    unknown = False
+    cubes = self.split(cnf)
+
+    if len(cubes) == 0:
+      self.status = StatusType.UNSATISFIABLE
+      return False, None, self.backtracks, self.splits
+
+    workers = min(self.workers, len(cubes))
+    # worker i owns the cubes from heads[i] to tails[i], consecutive cubes sharing most of their literals
+    heads = multiprocessing.RawArray('q', [len(cubes) * index // workers for index in range(workers)])
+    tails = multiprocessing.RawArray('q', [len(cubes) * (index + 1) // workers for index in range(workers)])
+    lock = multiprocessing.Lock()
+    results = multiprocessing.Queue()
+    settings = (cnf, cubes, heads, tails, lock, results, self.heuristic, self.restart, self.budget)
+    processes = [multiprocessing.Process(target = CubeSolver.run_worker, args = (index, settings), daemon = True) for index in range(workers)]
+
+    for process in processes:
+      process.start()
+
+    try:
+      answered = 0
+
+      while answered < len(cubes):
+        # a worker exits only once its outcomes are in the queue, so if every worker exited before an empty poll, the
+        # cubes left unanswered were taken by a worker killed while solving them, by the OOM killer for instance
+        exited = all(process.exitcode is not None for process in processes)
+
+        try:
+          satisfied, assignments, backtracks, splits, conflicts, message = results.get(timeout = POLL_INTERVAL)
+        except queue.Empty:
+          if exited:
+            codes = ', '.join(str(process.exitcode) for process in processes if process.exitcode != 0)
+            raise RuntimeError(f'A worker of the cube solver exited without answering its cubes (exit codes: {codes})')
+          continue
+
+        answered += 1
+
+        if message is not None:
+          raise RuntimeError(f'A worker of the cube solver failed: {message}')
+
+        self.backtracks += backtracks
+        self.splits += splits
+        self.conflicts += conflicts
+
+        if satisfied is None:
+          unknown = True
+          continue
+
+        self.solved_cubes += 1
+
+        if satisfied:
+          self.status = StatusType.SATISFIABLE
+          return True, assignments, self.backtracks, self.splits
+    finally:
+      for process in processes:
+        if process.is_alive():
+          process.terminate()
+
+      for process in processes:
+        process.join()
+
+    if unknown:
+      self.status = StatusType.UNKNOWN
+      return None, None, self.backtracks, self.splits
+
+    self.status = StatusType.UNSATISFIABLE
+    return False, None, self.backtracks, self.splits
+
+  def split(self, cnf: list) -> list:
+    """
+    Splits the CNF into cubes with a lookahead search
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF
+
+    Returns
+    -------
+    list
+        returns the cubes as lists of integer literals, which is empty if propagation refutes the CNF
+    """
+    self.cubes = 0
+    self.refuted_cubes = 0
+    solver = WatchedLiteralSolver()
+    solver.load(cnf)
+
+    if solver.inconsistent or solver.propagate() is not None:
+      return list()
+
+    occurrences = [0] * len(solver.activity)
+
+    for clause in solver.clauses:
+      for literal in clause:
+        occurrences[abs(literal)] += 1
+
+    order = sorted(range(1, len(occurrences)), key = lambda variable: -occurrences[variable])
+    cubes = list()
+    self.lookahead(solver, order, list(), self.depth, cubes)
+    self.cubes = len(cubes)
+
+    return cubes
+
+  def lookahead(self, solver: WatchedLiteralSolver, order: list, cube: list, depth: int, cubes: list) -> None:
+    """
+    Extends the cube below the current assignment of the solver, appending every complete cube to the list
+
+    Parameters
+    ----------
+    solver : WatchedLiteralSolver
+        the solver holding the CNF, with the cube assigned and propagated
+    order : list
+        every variable, most frequent first
+    cube : list
+        the literals of the cube so far
+    depth : int
+        number of splits left along this branch
+    cubes : list
+        the list collecting the cubes
+
+    Returns
+    -------
+    None
+    """
+    values = solver.values
+    mark = len(solver.trail)
+    cube = list(cube)
+    best = None
+    best_score = -1
+
+    if depth != 0:
+      candidates = [variable for variable in order if values[variable] is None][:self.candidates]
+
+      for variable in candidates:
+        if values[variable] is not None:
+          continue
+
+        implied = [self.probe(solver, variable), self.probe(solver, -variable)]
+
+        if implied[0] is None and implied[1] is None:
+          self.refuted_cubes += 1
+          solver.backtrack_to(mark)
+          return
+
+        if implied[0] is None or implied[1] is None:
+          # a failed literal: its negation holds everywhere below this node
+          forced = -variable if implied[0] is None else variable
+          cube.append(forced)
+          solver.assign(forced)
+
+          if solver.propagate() is not None:
+            self.refuted_cubes += 1
+            solver.backtrack_to(mark)
+            return
+          continue
+
+        score = implied[0] * implied[1]
+
+        if score > best_score:
+          best = variable
+          best_score = score
+
+    if best is None or values[best] is not None:
+      cubes.append(cube)
+      solver.backtrack_to(mark)
+      return
+
+    for literal in (best, -best):
+      branch = len(solver.trail)
+      solver.assign(literal)
+
+      if solver.propagate() is None:
+        self.lookahead(solver, order, cube + [literal], depth - 1, cubes)
+      else:
+        self.refuted_cubes += 1
+
+      solver.backtrack_to(branch)
+
+    solver.backtrack_to(mark)
+
+  @staticmethod
+  def probe(solver: WatchedLiteralSolver, literal: int) -> int:
+    """
+    Assigns and propagates a literal, then undoes it
+
+    Parameters
+    ----------
+    solver : WatchedLiteralSolver
+        the solver holding the CNF
+    literal : int
+        the literal to probe
+
+    Returns
+    -------
+    int
+        returns the number of literals the assignment implied, including itself, or None if it led to a conflict
+    """
+    mark = len(solver.trail)
+    solver.assign(literal)
+    conflict = solver.propagate()
+    implied = len(solver.trail) - mark
+    solver.backtrack_to(mark)
+
+    return implied if conflict is None else None
+
+  @staticmethod
+  def next_cube(index: int, heads, tails, lock) -> int:
+    """
+    Takes the next cube of a worker, stealing the last cube of the worker with the most cubes left once it has none
+
+    Parameters
+    ----------
+    index : int
+        the index of the worker
+    heads : RawArray
+        the position of the next cube of every worker
+    tails : RawArray
+        the position after the last cube of every worker
+    lock : Lock
+        the lock guarding both arrays
+
+    Returns
+    -------
+    int
+        returns the position of the cube to solve, or None once every cube was taken
+    """
+    with lock:
+      if heads[index] < tails[index]:
+        heads[index] += 1
+        return heads[index] - 1
+
+      victim = max(range(len(heads)), key = lambda other: tails[other] - heads[other])
+
+      if heads[victim] == tails[victim]:
+        return None
+
+      tails[victim] -= 1
+      return tails[victim]
+
+  @staticmethod
+  def run_worker(index: int, settings: tuple) -> None:
+    """
+    Loads the CNF once, then solves cubes under assumptions until none are left, putting every outcome on the queue
+
+    Parameters
+    ----------
+    index : int
+        the index of the worker
+    settings : tuple
+        the CNF, the cubes, the shared positions of every worker with their lock, the queue receiving the
+        outcome of every cube along with an error message if the worker failed, the heuristic and restart policy,
+        and the budget of the worker
+
+    Returns
+    -------
+    None
+    """
+    cnf, cubes, heads, tails, lock, results, heuristic, restart, budget = settings
+
+    # started once for every cube, so that the budget covers them all rather than each of them
+    if budget is not None:
+      budget.start()
+
+    try:
+      solver = IncrementalSolver(restart, budget = budget)
+      solver.add_clauses(cnf)
+
+      while True:
+        position = CubeSolver.next_cube(index, heads, tails, lock)
+
+        if position is None:
+          return
+
+        conflicts = solver.conflicts
+        satisfied, assignments, backtracks, splits = solver.solve(cubes[position], heuristic)
+        results.put((satisfied, assignments, backtracks, splits, solver.conflicts - conflicts, None))
+    except Exception as exception:
+      results.put((None, None, 0, 0, 0, str(exception) or type(exception).__name__))
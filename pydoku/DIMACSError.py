@@ -0,0 +1,6 @@
+"""
+Exception raised when a file does not define a valid CNF in DIMACS format
+"""
+
+class DIMACSError(ValueError):
+  pass
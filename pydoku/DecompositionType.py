@@ -0,0 +1,10 @@
+"""
+The class contains enums defining where the solver splits the CNF into independent components
+"""
+from enum import IntEnum, unique
+
+@unique
+class DecompositionType(IntEnum):
+  NONE = 1
+  ROOT = 2
+  ALL = 3
@@ -0,0 +1,11 @@
+"""
+The class contains enums defining the available search engines for the SAT solver
+"""
+from enum import IntEnum, unique
+
+@unique
+class EngineType(IntEnum):
+  RECURSIVE_DPLL = 1
+  WATCHED_LITERALS = 2
+  ITERATIVE_DPLL = 3
+  CDCL = 4
@@ -2,47 +2,390 @@
 Class containing a helper methods to parse and write DIMACS files
 """
 
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pydoku.ClauseStore import ClauseStore
+from pydoku.DIMACSError import DIMACSError
+from typing import BinaryIO, Iterator
+
+CHUNK_SIZE = 1 << 20
+
+# the binary cache starts with a magic string, the byte order it was written in, and the number of clauses and literals
+CACHE_EXTENSION = '.cache'
+CACHE_MAGIC = b'PYDOKU1' + (b'L' if sys.byteorder == 'little' else b'B')
+CACHE_HEADER = struct.Struct('=8sQQ')
+
 class FileHandler:
 
   @staticmethod
-  def parse(filepath: str) -> list:
+  def parse(filepath: str, integers: bool = False) -> list:
     """
     Parses a file provided to it in DIMACS format and returns the appropriate CNF as a list
 
     Parameters
     ----------
     filepath : str
-        Path of the file defining a CNF in DIMACS format
+        Path of the file defining a CNF in DIMACS format, optionally compressed with gzip, bzip2 or xz
+    integers : bool
+        return the literals as integers instead of strings, which takes less memory and suits the integer engines
 
     Returns
     -------
     list
         returns CNF containing
 
+    Raises
+    ------
+    DIMACSError
+        if the file does not define a valid CNF
+
+    See Also
+    --------
+    read_clauses : function yielding the clauses of a DIMACS file one at a time
+    """
+    if integers:
+      return list(FileHandler.read_clauses(filepath))
+
+    return [[str(literal) for literal in clause] for clause in FileHandler.read_clauses(filepath)]
+
+  @staticmethod
+  def read_clauses(filepath: str) -> Iterator[list]:
+    """
+    Yields the clauses of a file in DIMACS format one at a time, as lists of integer literals
+
+    The file is read in large binary chunks and literals are converted to integers straight from the bytes,
+    so even very large files never have to be held in memory. If the file has a `p cnf` header, every variable
+    must lie within the number of variables declared and the number of clauses must match the declared one.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file defining a CNF in DIMACS format, optionally compressed with gzip, bzip2 or xz
+
+    Returns
+    -------
+    Iterator[list]
+        yields every clause of the CNF as a list of integers
+
+    Raises
+    ------
+    DIMACSError
+        if the file does not define a valid CNF
+    """
+    with FileHandler.open(filepath) as file:
+      yield from FileHandler.read_dimacs(FileHandler.read_lines(file), filepath)
+
+  @staticmethod
+  def parse_text(text: str, integers: bool = False) -> list:
+    """
+    Parses a CNF given as a string in DIMACS format, such as the body of a request, and returns it as a list
+
+    Parameters
+    ----------
+    text : str
+        the CNF in DIMACS format
+    integers : bool
+        return the literals as integers instead of strings
+
+    Returns
+    -------
+    list
+        returns the clauses of the CNF
+
+    Raises
+    ------
+    DIMACSError
+        if the text does not define a valid CNF
     """
-    file = open(filepath, 'r')
+    clauses = FileHandler.read_dimacs(text.encode().split(b'\n'), '<text>')
 
-    cnf = list()
-    cnf.append(list())
+    if integers:
+      return list(clauses)
+
+    return [[str(literal) for literal in clause] for clause in clauses]
+
+  @staticmethod
+  def read_dimacs(lines: Iterator[bytes], source: str) -> Iterator[list]:
+    """
+    Yields the clauses defined by the lines of a CNF in DIMACS format one at a time, as lists of integer literals
+
+    Parameters
+    ----------
+    lines : Iterator[bytes]
+        the lines of the CNF without their line endings
+    source : str
+        the name of the file or the text the lines come from, for error messages
+
+    Returns
+    -------
+    Iterator[list]
+        yields every clause of the CNF as a list of integers
 
-    for line in file:
+    Raises
+    ------
+    DIMACSError
+        if the lines do not define a valid CNF
+    """
+    variables = None
+    expected = None
+    count = 0
+    clause = list()
+
+    for number, line in enumerate(lines, 1):
       tokens = line.split()
-      if len(tokens) != 0 and tokens[0] not in ('p', 'c'):
-        for literal in tokens:
-          if literal == "0":
-            cnf.append(list())
-          else:
-            cnf[-1].append(literal)
-
-    cnf.pop()
-    file.close()
 
-    for clause in cnf:
-      if len(clause) == 0:
-        print(cnf)
-        exit(0)
+      if len(tokens) == 0 or tokens[0].startswith(b'c'):
+        continue
+
+      if tokens[0] == b'%':
+        break
+
+      if tokens[0] == b'p':
+        if variables is not None:
+          raise DIMACSError(f'{source}:{number}: duplicate problem line.')
+
+        if len(tokens) != 4 or tokens[1] != b'cnf' or not tokens[2].isdigit() or not tokens[3].isdigit():
+          raise DIMACSError(f'{source}:{number}: problem line must be "p cnf <variables> <clauses>".')
+
+        variables, expected = int(tokens[2]), int(tokens[3])
+        continue
+
+      try:
+        literals = [int(token) for token in tokens]
+      except ValueError:
+        raise DIMACSError(f'{source}:{number}: literals must be integers.') from None
+
+      for literal in literals:
+        if literal != 0:
+          if variables is not None and abs(literal) > variables:
+            raise DIMACSError(f'{source}:{number}: variable {abs(literal)} exceeds the {variables} variables declared.')
+
+          clause.append(literal)
+          continue
+
+        if len(clause) == 0:
+          raise DIMACSError(f'{source}:{number}: empty clause.')
+
+        count += 1
+        yield clause
+        clause = list()
+
+    # the last clause does not need to be terminated
+    if len(clause) != 0:
+      count += 1
+      yield clause
+
+    if expected is not None and count != expected:
+      raise DIMACSError(f'{source}: {count} clauses found while {expected} were declared.')
+
+  @staticmethod
+  def read_variables(filepath: str) -> int:
+    """
+    Returns the number of variables declared by the `p cnf` header of a file in DIMACS format, reading up to the header only
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file defining a CNF in DIMACS format, optionally compressed with gzip, bzip2 or xz
+
+    Returns
+    -------
+    int
+        returns the number of variables declared, or None if the file has no header
+
+    Raises
+    ------
+    DIMACSError
+        if the header is not valid
+    """
+    with FileHandler.open(filepath) as file:
+      for number, line in enumerate(FileHandler.read_lines(file), 1):
+        tokens = line.split()
+
+        if len(tokens) == 0 or tokens[0].startswith(b'c'):
+          continue
+
+        if tokens[0] != b'p':
+          return None
+
+        if len(tokens) != 4 or tokens[1] != b'cnf' or not tokens[2].isdigit() or not tokens[3].isdigit():
+          raise DIMACSError(f'{filepath}:{number}: problem line must be "p cnf <variables> <clauses>".')
+
+        return int(tokens[2])
+
+    return None
+
+  @staticmethod
+  def open(filepath: str) -> BinaryIO:
+    """
+    Opens a file for reading in binary mode, decompressing it on the fly based on its extension
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file, files ending in .gz, .bz2 and .xz are decompressed
+
+    Returns
+    -------
+    BinaryIO
+        returns the opened file
+    """
+    if filepath.endswith('.gz'):
+      return gzip.open(filepath, 'rb')
+    elif filepath.endswith('.bz2'):
+      return bz2.open(filepath, 'rb')
+    elif filepath.endswith('.xz'):
+      return lzma.open(filepath, 'rb')
+
+    return open(filepath, 'rb')
+
+  @staticmethod
+  def read_lines(file: BinaryIO) -> Iterator[bytes]:
+    """
+    Yields the lines of a binary file, reading it in chunks of CHUNK_SIZE bytes
+
+    Parameters
+    ----------
+    file : BinaryIO
+        the file to read
+
+    Returns
+    -------
+    Iterator[bytes]
+        yields every line of the file without its line ending
+    """
+    remainder = b''
+
+    while True:
+      chunk = file.read(CHUNK_SIZE)
+
+      if len(chunk) == 0:
+        break
+
+      lines = (remainder + chunk).split(b'\n')
+      remainder = lines.pop()
+      yield from lines
+
+    if len(remainder) != 0:
+      yield remainder
+
+  @staticmethod
+  def load(filepath: str) -> ClauseStore:
+    """
+    Loads a DIMACS file as a ClauseStore, going through a binary cache next to the file
+
+    The first time a file is loaded it is parsed and the cache is written to `filepath.cache`. Later loads
+    memory-map the cache instead of parsing the file again, as long as the cache is newer than the file. A cache that
+    cannot be read, being empty, truncated or corrupt, is rebuilt from the file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file defining a CNF in DIMACS format, optionally compressed with gzip, bzip2 or xz
+
+    Returns
+    -------
+    ClauseStore
+        returns the CNF as a flat store of integer literals
+
+    See Also
+    --------
+    write_cache : function writing a ClauseStore to a binary file
+    load_cache : function memory-mapping a binary file written by write_cache
+    """
+    cache_path = f'{filepath}{CACHE_EXTENSION}'
+
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+      try:
+        return FileHandler.load_cache(cache_path)
+      except DIMACSError:
+        pass
+
+    store = ClauseStore.from_clauses(FileHandler.read_clauses(filepath))
 
-    return cnf
+    try:
+      FileHandler.write_cache(cache_path, store)
+    except OSError:
+      pass
+
+    return store
+
+  @staticmethod
+  def write_cache(cache_path: str, store: ClauseStore) -> None:
+    """
+    Writes a ClauseStore to a binary file that can be memory-mapped by load_cache
+
+    Parameters
+    ----------
+    cache_path : str
+        path of the binary file to write
+    store : ClauseStore
+        the CNF to write
+
+    Returns
+    -------
+    None
+    """
+    temporary_path = f'{cache_path}.{os.getpid()}'
+
+    with open(temporary_path, 'wb') as file:
+      file.write(CACHE_HEADER.pack(CACHE_MAGIC, len(store), len(store.literals)))
+      file.write(array('q', store.offsets).tobytes())
+      file.write(array('i', store.literals).tobytes())
+
+    # replacing the cache in one step keeps readers from ever seeing a partially written file
+    os.replace(temporary_path, cache_path)
+
+  @staticmethod
+  def load_cache(cache_path: str) -> ClauseStore:
+    """
+    Memory-maps a binary file written by write_cache, without parsing or copying the clauses
+
+    Parameters
+    ----------
+    cache_path : str
+        path of the binary file to read
+
+    Returns
+    -------
+    ClauseStore
+        returns a ClauseStore backed by the memory-mapped file, which is released by ClauseStore.close
+
+    Raises
+    ------
+    DIMACSError
+        if the file is empty, truncated or corrupt, or not a cache written on a machine with the same byte order
+    """
+    with open(cache_path, 'rb') as file:
+      # an empty file cannot be memory-mapped, and a truncated one has no header to unpack
+      if os.fstat(file.fileno()).st_size < CACHE_HEADER.size:
+        raise DIMACSError(f'{cache_path}: not a valid CNF cache.')
+
+      buffer = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+    magic, clauses, literals = CACHE_HEADER.unpack_from(buffer)
+    offsets_end = CACHE_HEADER.size + 8 * (clauses + 1)
+
+    if magic != CACHE_MAGIC or len(buffer) != offsets_end + 4 * literals:
+      buffer.close()
+      raise DIMACSError(f'{cache_path}: not a valid CNF cache.')
+
+    offsets = memoryview(buffer)[CACHE_HEADER.size:offsets_end].cast('q')
+
+    if offsets[0] != 0 or offsets[-1] != literals:
+      offsets.release()
+      buffer.close()
+      raise DIMACSError(f'{cache_path}: not a valid CNF cache.')
+
+    literals = memoryview(buffer)[offsets_end:].cast('i')
+
+    return ClauseStore(literals, offsets, buffer)
 
   @staticmethod
   def output(output_path: str, assignments: dict) -> None:
@@ -71,4 +414,32 @@ class FileHandler:
 
     file = open(output_path, '+w')
     file.write(dimacs)
-    file.close()
\ No newline at end of file
+    file.close()
+
+  @staticmethod
+  def output_models(output_path: str, models: Iterator[dict]) -> Iterator[dict]:
+    """
+    Writes every model to a file as it comes in, one line per model, and passes it on
+
+    Every line lists the literals set to True by a model followed by 0, like a clause in DIMACS format.
+    The file is flushed after every model, so it keeps the models found so far if the enumeration is stopped.
+
+    Parameters
+    ----------
+    output_path : str
+      file to write the models to
+    models : Iterator[dict]
+      dictionaries containing assignments that satisfy the CNF
+
+    Returns
+    -------
+    Iterator[dict]
+        yields the same models
+    """
+    with open(output_path, 'w') as file:
+      for assignments in models:
+        literals = [key for key, value in assignments.items() if value is True]
+        file.write(' '.join(literals + ['0']) + '\n')
+        file.flush()
+
+        yield assignments
@@ -7,4 +7,8 @@ from enum import IntEnum, unique
 class HeuristicType(IntEnum):
   STANDARD_DPLL = 1
   RANDOM_LITERAL = 2
-  MAX_OCCURRENCES_MIN_SIZE = 3
\ No newline at end of file
+  MAX_OCCURRENCES_MIN_SIZE = 3
+  VSIDS = 4
+  JEROSLOW_WANG = 5
+  JEROSLOW_WANG_TWO_SIDED = 6
+  DYNAMIC_LARGEST_INDIVIDUAL_SUM = 7
@@ -0,0 +1,279 @@
+"""
+Class containing an incremental version of the CDCL engine, for solving many CNFs that share most of their clauses.
+
+Clauses are added once and stay loaded between calls to solve, which only takes the literals that differ from one
+call to the next as assumptions. For Sudoku, the rules are added once and the givens of every puzzle are assumed.
+Learned clauses, variable activities and saved phases are kept between calls, so later calls benefit from what
+earlier ones learned, and nothing is parsed, copied or indexed again for each puzzle.
+
+Clauses can still be added between calls. Variables are allocated as they show up, in clauses or in assumptions.
+
+Every model of the clauses can be enumerated one at a time, by calling solve again after blocking each model found.
+Blocking clauses only negate the decisions that led to a model, or the literals of the variables projected on, since
+the literals the decisions imply follow from them, so blocking clauses stay short.
+
+Heuristics other than VSIDS stop as soon as every clause is satisfied, which can leave some variables unassigned.
+Those are set to False in the model, and the blocking clause negates the whole assignment instead of the decisions.
+Negating the decisions would also block every other value of the unassigned variables.
+
+Every blocking clause holds the negation of a selector variable, allocated for the enumeration and assumed True while
+it runs. Once the enumeration is over the selector is set to False, so the blocking clauses, and the clauses learned
+from them, do not restrict later calls.
+"""
+
+from pydoku.CDCLSolver import CDCLSolver
+from pydoku.HeuristicType import HeuristicType
+from pydoku.RestartPolicy import RestartPolicy
+from pydoku.RestartType import RestartType
+from pydoku.SolverBudget import SolverBudget
+from pydoku.SolverHooks import SolverHooks
+from typing import Iterator
+import time
+
+class IncrementalSolver(CDCLSolver):
+
+  def __init__(self, restart: RestartType = RestartType.NONE, reduce_interval: int = 2000, reduce_increment: int = 300,
+               hooks: SolverHooks = None, budget: SolverBudget = None):
+    """
+    Parameters
+    ----------
+    restart : RestartType
+        the restart policy to follow, phase saving is enabled along with any policy other than NONE
+    reduce_interval : int
+        number of conflicts before the first reduction of the learned clauses
+    reduce_increment : int
+        growth of the number of conflicts between two reductions of the learned clauses
+    hooks : SolverHooks
+        the callbacks to invoke while searching, None for no callbacks
+    budget : SolverBudget
+        the limits of every call to solve, None to always run until an answer is found
+    """
+    super().__init__(restart, reduce_interval, reduce_increment, hooks, budget)
+    self.calls = 0
+    self.models = 0
+    self.complete = False
+    self.model_decisions = list()
+    self.allocate(0)
+
+  def add_clauses(self, cnf) -> None:
+    """
+    Adds every clause of a CNF
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses, or a ClauseStore holding them, literals may be given as strings or integers
+
+    Returns
+    -------
+    None
+    """
+    for clause in cnf:
+      self.add_clause(clause)
+
+  def add_clause(self, clause: list) -> None:
+    """
+    Adds a clause between two calls to solve, simplifying it against the literals assigned at the root
+
+    Parameters
+    ----------
+    clause : list
+        the literals of the clause, as strings or integers
+
+    Returns
+    -------
+    None
+    """
+    literals = list(dict.fromkeys(int(literal) for literal in clause))
+    unique = set(literals)
+    # variables only occurring in tautologies are allocated all the same, so models still give them a value
+    self.reserve(max((abs(literal) for literal in literals), default = 0))
+
+    if any(-literal in unique for literal in literals):
+      return
+
+    values = self.values
+
+    if any(values[literal] is True for literal in literals):
+      return
+
+    super().add_clause([literal for literal in literals if values[literal] is None])
+
+  def reserve(self, max_variable: int) -> None:
+    """
+    Grows every table indexed by variables or literals so that it holds variables up to the given one
+
+    Parameters
+    ----------
+    max_variable : int
+        the largest variable that must fit
+
+    Returns
+    -------
+    None
+    """
+    current = len(self.activity) - 1
+
+    if max_variable <= current:
+      return
+
+    size = 2 * max_variable + 1
+    values = [None] * size
+    watches = [list() for _ in range(size)]
+
+    # negative literals move when the table grows, so every slot is copied by literal rather than by index
+    for variable in range(1, current + 1):
+      values[variable], values[-variable] = self.values[variable], self.values[-variable]
+      watches[variable], watches[-variable] = self.watches[variable], self.watches[-variable]
+
+    self.values = values
+    self.watches = watches
+
+    added = max_variable - current
+    self.activity.extend([0.0] * added)
+    self.heap.positions.extend([-1] * added)
+    self.levels.extend([0] * added)
+    self.reasons.extend([None] * added)
+    self.seen.extend([False] * added)
+    self.phases.extend([None] * added)
+
+    for variable in range(current + 1, max_variable + 1):
+      self.heap.push(variable)
+
+  def solve(self, assumptions: list = None, heuristic: HeuristicType = HeuristicType.VSIDS) -> [bool, dict, int, int]:
+    """
+    Solves the clauses added so far under the given assumptions
+
+    Parameters
+    ----------
+    assumptions : list
+        literals, as strings or integers, that must be True in this call only
+    heuristic : HeuristicType
+        an Enum value giving us an indication of the branching heuristic to use while searching
+
+    Returns
+    -------
+    [bool, dict, int, int]
+        returns true if a satisfiable solution under the assumptions was found, or None if the budget ran out first,
+        along with the valid assignments, the number of backtracks, and number of splits of this call.
+        The conflicts, learned clauses and restarts attributes keep counting across calls, and so do the
+        statistics, whose total time only covers the calls to solve.
+        If the search failed because an assumption was falsified, it is available as the failed_assumption attribute.
+
+    See Also
+    --------
+    search : function implementing the logic for the CDCL search, deciding the assumptions first
+    """
+    if heuristic not in HeuristicType:
+      raise TypeError('Invalid heuristic provided as input.')
+
+    assumptions = [int(literal) for literal in assumptions or list()]
+    self.reserve(max((abs(literal) for literal in assumptions), default = 0))
+
+    backtracks = self.backtracks
+    splits = self.splits
+    self.calls += 1
+    self.assumptions = assumptions
+    self.failed_assumption = None
+    self.policy = RestartPolicy(self.restart)
+    self.start_time = time.perf_counter() - self.statistics.total_time
+
+    started = self.budget is not None and self.budget.start(self.splits, self.conflicts)
+
+    try:
+      satisfied = self.search(heuristic)
+    finally:
+      if started:
+        self.budget.stop()
+
+    assignments = self.get_assignments() if satisfied else None
+    # the decisions made on top of the assumptions are all it takes to block the model
+    self.model_decisions = [self.trail[limit] for limit in self.trail_limits[len(assumptions):]] if satisfied else list()
+    self.update_statistics()
+
+    self.backjump(0)
+    self.assumptions = list()
+    # clauses and variables may be added before the next call, which sets the counters up again if it needs them
+    self.counters = None
+
+    return satisfied, assignments, self.backtracks - backtracks, self.splits - splits
+
+  def enumerate(self, assumptions: list = None, heuristic: HeuristicType = HeuristicType.VSIDS, limit: int = None,
+                projection: list = None) -> Iterator[dict]:
+    """
+    Yields the models of the clauses added so far under the given assumptions one at a time, each blocked once found
+
+    Learned clauses, activities and saved phases carry over from one model to the next. The budget, if any, covers
+    the whole enumeration, including the time spent by the caller between two models.
+
+    Parameters
+    ----------
+    assumptions : list
+        literals, as strings or integers, that must be True in every model
+    heuristic : HeuristicType
+        an Enum value giving us an indication of the branching heuristic to use while searching
+    limit : int
+        number of models after which the enumeration stops, None for every model, 2 to check that a model is unique
+    projection : list
+        variables, as strings or integers, two models must differ on to both be yielded, None for every variable
+
+    Returns
+    -------
+    Iterator[dict]
+        yields a dictionary mapping every literal set to True to True for every model, one per assignment of the
+        projected variables. The number of models yielded is available as the models attribute, and whether the
+        enumeration proved there are no others as the complete attribute.
+
+    See Also
+    --------
+    solve : function finding the next model
+    """
+    if limit is not None and (not isinstance(limit, int) or limit < 1):
+      raise TypeError('Invalid model limit provided as input.')
+
+    if projection is not None:
+      projection = list(dict.fromkeys(int(variable) for variable in projection))
+
+      if any(variable <= 0 for variable in projection):
+        raise TypeError('Invalid projection provided as input.')
+
+      self.reserve(max(projection, default = 0))
+
+    assumptions = [int(literal) for literal in assumptions or list()]
+    self.reserve(max((abs(literal) for literal in assumptions), default = 0))
+    selector = len(self.activity)
+    self.reserve(selector)
+    self.models = 0
+    self.complete = False
+
+    started = self.budget is not None and self.budget.start(self.splits, self.conflicts)
+
+    try:
+      while limit is None or self.models < limit:
+        satisfied, assignments, _, _ = self.solve([selector] + assumptions, heuristic)
+
+        if not satisfied:
+          self.complete = satisfied is False
+          return
+
+        # heuristics other than VSIDS stop once every clause is satisfied, so the trail may leave variables unassigned
+        complete = len(assignments) == len(self.activity) - 1
+        del assignments[str(selector)]
+
+        if projection is None and complete:
+          blocked = self.model_decisions
+        elif projection is None:
+          # the variables left unassigned are yielded as False, so that whole assignment is blocked, and no other
+          blocked = [variable if str(variable) in assignments else -variable for variable in range(1, selector)]
+        else:
+          blocked = [variable if str(variable) in assignments else -variable for variable in projection]
+
+        self.add_clause([-selector] + [-literal for literal in blocked])
+        self.models += 1
+
+        yield assignments
+    finally:
+      if started:
+        self.budget.stop()
+
+      self.add_clause([-selector])
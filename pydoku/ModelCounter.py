@@ -0,0 +1,404 @@
+"""
+Class counting the models of a CNF exactly (#SAT) with a DPLL search over components and a cache of their counts.
+
+The search branches on a variable and adds up the number of models of both branches, after unit propagation, instead
+of stopping at the first model. Pure literals are never set, since that would drop the models where they are False.
+
+After every branch the clauses left are split into components sharing no variable with each other by a
+ComponentSplitter. The number of models of a CNF is the product of the numbers of models of its components, so every
+component is counted on its own, and a component whose count is 0 ends the branch. Variables that no longer occur in
+any clause and were not assigned are free, each of them doubling the count.
+
+The same component often shows up in many branches, so the count of every component is kept in a cache keyed by a
+canonical encoding of its clauses: the literals of every clause and the clauses themselves are sorted, then packed
+into bytes. The cache is bounded by the memory its entries take; once it grows beyond its maximum size, the least
+recently used counts are evicted.
+
+Counts are Python integers, so they are exact however many models the CNF has.
+"""
+
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from pydoku.ClauseStore import ClauseStore
+from pydoku.ComponentSplitter import ComponentSplitter
+from pydoku.SolverBudget import SolverBudget
+from pydoku.SolverStatistics import SolverStatistics
+
+DEFAULT_MAX_CACHE_SIZE = 64 << 20
+
+# bytes taken by a cache entry on top of its key and its count: the slot of the dictionary and the link of its order
+ENTRY_OVERHEAD = 100
+
+# kinds of the frames on the stack of the search
+BRANCH = 0
+COMPONENT = 1
+
+class ModelCounter:
+
+  def __init__(self, max_cache_size: int = DEFAULT_MAX_CACHE_SIZE, budget: SolverBudget = None):
+    """
+    Parameters
+    ----------
+    max_cache_size : int
+        the number of bytes the cached component counts may take before the least recently used ones are evicted
+    budget : SolverBudget
+        the limits of every count, None to always run until the count is known
+    """
+    if not isinstance(max_cache_size, int) or max_cache_size < 0:
+      raise TypeError('Invalid cache size provided as input.')
+
+    self.max_cache_size = max_cache_size
+    self.budget = budget
+    self.cache = OrderedDict()
+    self.cache_size = 0
+    self.splitter = ComponentSplitter()
+    self.reset()
+
+  def reset(self) -> None:
+    """
+    Clears the counters and statistics of the previous count, keeping the cached component counts
+
+    Returns
+    -------
+    None
+    """
+    self.decisions = 0
+    self.conflicts = 0
+    self.components = 0
+    self.cache_hits = 0
+    self.cache_misses = 0
+    self.cache_evictions = 0
+    self.statistics = SolverStatistics()
+
+  def count(self, cnf, variables: int = None) -> int:
+    """
+    Counts the models of a CNF
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses of integer literals, or a ClauseStore holding them
+    variables : int
+        number of variables the models assign, such as the number declared by a DIMACS file, which must cover every
+        variable of the CNF, the variables up to it that occur in no clause doubling the count.
+        Defaults to the variables occurring in the CNF
+
+    Returns
+    -------
+    int
+        returns the exact number of models, or None if the budget ran out first.
+        The number of decisions, conflicts and components counted, along with the cache hits, misses and evictions,
+        are available as attributes afterwards, along with the SolverStatistics of the count as the statistics attribute.
+
+    See Also
+    --------
+    count_branch : function running the search over branches and components
+    """
+    self.reset()
+    start_time = time.perf_counter()
+
+    if isinstance(cnf, ClauseStore):
+      cnf = cnf.to_lists()
+
+    cnf = [[int(literal) for literal in clause] for clause in cnf]
+    occurring = self.get_variables(cnf)
+
+    if variables is None:
+      variables = len(occurring)
+    elif not isinstance(variables, int) or variables < max(occurring, default = 0):
+      raise TypeError('Invalid number of variables provided as input.')
+
+    started = self.budget is not None and self.budget.start()
+
+    try:
+      count = self.count_branch(cnf, list(), variables)
+    finally:
+      if started:
+        self.budget.stop()
+
+    statistics = self.statistics
+    statistics.decisions = self.decisions
+    statistics.conflicts = self.conflicts
+    statistics.total_time = time.perf_counter() - start_time
+
+    return count
+
+  def count_branch(self, cnf: list, literals: list, variables: int) -> int:
+    """
+    Counts the models of a CNF in which the given literals are True, over the given number of variables
+
+    The search alternates between branches, whose count is the product of the counts of their components, and
+    components, whose count is the sum of the counts of both branches on their next variable. Both are kept on an
+    explicit stack rather than the call stack, so a long chain of decisions cannot exceed the recursion limit.
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses of integer literals
+    literals : list
+        the literals set to True before propagating, empty at the root
+    variables : int
+        number of variables of the CNF, including the ones that occur in no clause
+
+    Returns
+    -------
+    int
+        returns the number of models, or None if the budget ran out first
+
+    See Also
+    --------
+    open_branch : function propagating a branch and splitting what is left into components
+    """
+    # a branch holds its count so far, its components and the next of them to count, while a component holds its
+    # cache key, its clauses, the variable branched on, its number of variables, the branches counted and their sum
+    stack = [self.open_branch(cnf, literals, variables)]
+    # the count of the frame popped last, None while descending
+    counted = None
+
+    while True:
+      frame = stack[-1]
+
+      if frame[0] == BRANCH:
+        if counted is not None:
+          frame[1] *= counted
+          counted = None
+
+        _, count, components, index = frame
+
+        # the smallest components come first, so a component without models is found early
+        if count == 0 or index == len(components):
+          stack.pop()
+
+          if len(stack) == 0:
+            return count
+
+          counted = count
+          continue
+
+        frame[3] += 1
+        component = components[index]
+        self.components += 1
+        key = self.get_key(component)
+        counted = self.cache.get(key)
+
+        if counted is not None:
+          self.cache_hits += 1
+          self.cache.move_to_end(key)
+          continue
+
+        self.cache_misses += 1
+
+        if self.budget is not None and self.budget.exhausted(self.decisions, self.conflicts):
+          return None
+
+        self.decisions += 1
+        start_time = time.perf_counter()
+        variable = self.next_variable(component)
+        component_variables = len(self.get_variables(component))
+        self.statistics.branching_time += time.perf_counter() - start_time
+
+        stack.append([COMPONENT, key, component, variable, component_variables, 0, 0])
+        continue
+
+      if counted is not None:
+        frame[6] += counted
+        counted = None
+
+      _, key, component, variable, component_variables, branches, count = frame
+
+      if branches == 2:
+        stack.pop()
+        self.store(key, count)
+        counted = count
+        continue
+
+      # both branches assign the variable, so the other variables of the component are left to count
+      frame[5] += 1
+      stack.append(self.open_branch(component, [variable if branches == 0 else -variable], component_variables))
+
+  def open_branch(self, cnf: list, literals: list, variables: int) -> list:
+    """
+    Propagates the literals of a branch and splits the clauses left into components, to be counted one by one
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses of integer literals
+    literals : list
+        the literals set to True before propagating
+    variables : int
+        number of variables of the CNF, including the ones that occur in no clause
+
+    Returns
+    -------
+    list
+        returns the frame of the branch: its count so far, which is 0 after a conflict and otherwise doubles for every
+        free variable, its components and the index of the next component to count
+    """
+    statistics = self.statistics
+    start_time = time.perf_counter()
+    clauses, assigned = self.propagate(cnf, literals)
+    statistics.propagation_time += time.perf_counter() - start_time
+
+    if clauses is None:
+      self.conflicts += 1
+      return [BRANCH, 0, list(), 0]
+
+    statistics.propagations += len(assigned) - len(literals)
+
+    start_time = time.perf_counter()
+    components = self.splitter.split(clauses)
+    free = variables - len(assigned) - sum(len(self.get_variables(component)) for component in components)
+    statistics.simplification_time += time.perf_counter() - start_time
+
+    return [BRANCH, 1 << free, components, 0]
+
+  def propagate(self, cnf: list, literals: list) -> [list, set]:
+    """
+    Sets the given literals to True and propagates the unit clauses that follow, in passes over the clauses
+
+    Components are small, so a few passes over their clauses cost less than indexing the occurrences of every literal.
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses of integer literals
+    literals : list
+        the literals to set to True first
+
+    Returns
+    -------
+    [list, set]
+        returns the clauses left, without the literals set to False, along with every literal set to True,
+        or None and None if a clause was falsified
+    """
+    assigned = set(literals)
+    clauses = cnf
+    pending = True
+
+    while pending:
+      pending = False
+      reduced = list()
+
+      for clause in clauses:
+        if not assigned.isdisjoint(clause):
+          continue
+
+        clause = [literal for literal in clause if -literal not in assigned]
+
+        if len(clause) == 0:
+          return None, None
+
+        if len(clause) == 1:
+          assigned.add(clause[0])
+          pending = True
+          continue
+
+        reduced.append(clause)
+
+      clauses = reduced
+
+    return clauses, assigned
+
+  def next_variable(self, component: list) -> int:
+    """
+    Returns the variable occurring in the most clauses of the component, which splits it the most once assigned
+
+    Parameters
+    ----------
+    component : list
+        a list of clauses of integer literals
+
+    Returns
+    -------
+    int
+        returns the variable to branch on
+    """
+    occurrences = dict()
+
+    for clause in component:
+      for literal in clause:
+        variable = abs(literal)
+        occurrences[variable] = occurrences.get(variable, 0) + 1
+
+    return max(occurrences, key = occurrences.get)
+
+  def get_variables(self, component: list) -> set:
+    """
+    Returns the variables occurring in the clauses of a component
+
+    Parameters
+    ----------
+    component : list
+        a list of clauses of integer literals
+
+    Returns
+    -------
+    set
+        returns the set of variables
+    """
+    return {abs(literal) for clause in component for literal in clause}
+
+  def get_key(self, component: list) -> bytes:
+    """
+    Returns the canonical encoding of a component, which does not depend on the order of its clauses or of their literals
+
+    Parameters
+    ----------
+    component : list
+        a list of clauses of integer literals
+
+    Returns
+    -------
+    bytes
+        returns the sorted clauses packed as 32 bit integers, every clause followed by 0
+    """
+    literals = array('i')
+
+    for clause in sorted(sorted(clause) for clause in component):
+      literals.extend(clause)
+      literals.append(0)
+
+    return literals.tobytes()
+
+  def store(self, key: bytes, count: int) -> None:
+    """
+    Caches the count of a component, then evicts the least recently used counts if the cache grew too large
+
+    Parameters
+    ----------
+    key : bytes
+        the canonical encoding of the component
+    count : int
+        the number of models of the component
+
+    Returns
+    -------
+    None
+    """
+    size = sys.getsizeof(key) + sys.getsizeof(count) + ENTRY_OVERHEAD
+
+    # a count larger than the whole cache would only evict everything else before being evicted itself
+    if size > self.max_cache_size:
+      return
+
+    self.cache[key] = count
+    self.cache_size += size
+
+    while self.cache_size > self.max_cache_size:
+      key, count = self.cache.popitem(last = False)
+      self.cache_size -= sys.getsizeof(key) + sys.getsizeof(count) + ENTRY_OVERHEAD
+      self.cache_evictions += 1
+
+  def clear(self) -> None:
+    """
+    Empties the cache of component counts
+
+    Returns
+    -------
+    None
+    """
+    self.cache.clear()
+    self.cache_size = 0
@@ -0,0 +1,234 @@
+"""
+Class checking that models satisfy a CNF, independently of the engine that found them.
+
+The clauses are kept flat, the way a ClauseStore holds them: every literal back to back in a single array, and the
+offset at which every clause starts. A model is turned into a truth table indexed by literal, so with NumPy checking
+it takes a single gather of the truth value of every literal of the CNF, and a single reduction of those values over
+every clause, without a Python loop over clauses or literals. A batch of models is checked the same way, one row of
+the truth table per model, in chunks bounded by MAX_BATCH_CELLS.
+
+NumPy is optional. Without it, the clauses are checked one by one against the set of literals set to True, which
+gives the same answers.
+
+A model lists the literals it sets to True, as a dictionary mapping them to True like the solvers return them, or as a
+list of literals like the `.out` files hold them. A clause is satisfied when one of its literals is set to True, so a
+variable the model leaves out satisfies none of its literals, and an empty clause is never satisfied. Tautological
+clauses, holding a literal along with its negation, are satisfied by any model though: the engines drop them before
+searching, so the variables only occurring in them may be left out of the models they find.
+"""
+
+from pydoku.ClauseStore import ClauseStore
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+# largest number of literal truth values gathered at once when checking a batch of models
+MAX_BATCH_CELLS = 1 << 25
+
+class ModelVerifier:
+
+  def __init__(self, cnf):
+    """
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses with literals given as integers or strings, or a ClauseStore holding them.
+        The clauses are copied, so the CNF may be changed or closed afterwards
+    """
+    store = cnf if isinstance(cnf, ClauseStore) else ClauseStore.from_clauses(cnf)
+    self.clauses = len(store)
+
+    if numpy is None:
+      self.literals = list(store.literals)
+      self.offsets = list(store.offsets)
+      self.variables = max((abs(literal) for literal in self.literals), default = 0)
+      self.tautologies = {index for index, clause in enumerate(store) if any(-literal in clause for literal in clause)}
+      return
+
+    literals = numpy.frombuffer(store.literals, dtype = numpy.int32)
+    offsets = numpy.frombuffer(store.offsets, dtype = numpy.int64)
+    self.variables = int(numpy.abs(literals).max()) if len(literals) != 0 else 0
+
+    # literal l sits at index l + variables of the truth table, so negative literals need no special case, and the
+    # last column is always False: it ends the literals, so the start of every clause, even an empty one, is within them
+    sentinel = 2 * self.variables + 1
+    self.indices = numpy.append(literals.astype(numpy.int32 if sentinel < 1 << 31 else numpy.int64) + self.variables, sentinel)
+    # copied rather than viewed, so the buffers of the store can still be released
+    self.starts = offsets[:-1].copy()
+    self.empty = offsets[1:] == offsets[:-1]
+
+    # a clause is a tautology if the negation of one of its literals, keyed by clause, is among the literals keyed the same way
+    clause_indices = numpy.repeat(numpy.arange(self.clauses, dtype = numpy.int64), numpy.diff(offsets))
+    keys = clause_indices * (sentinel + 1) + self.variables
+    negated = numpy.isin(keys - literals, keys + literals)
+    self.tautologies = numpy.zeros(self.clauses, dtype = bool)
+    self.tautologies[clause_indices[negated]] = True
+
+  def check(self, model) -> int:
+    """
+    Returns the first clause the model does not satisfy
+
+    Parameters
+    ----------
+    model : dict or list
+        a dictionary mapping the literals set to True, as strings or integers, to True, or a list of those literals
+
+    Returns
+    -------
+    int
+        returns the index of the first clause not satisfied, or None if the model satisfies every clause
+
+    Raises
+    ------
+    TypeError
+        if the model sets a variable both True and False
+    """
+    if numpy is None:
+      true = self.get_literals(model)
+      literals = self.literals
+      offsets = self.offsets
+
+      for index in range(self.clauses):
+        if true.isdisjoint(literals[offsets[index]:offsets[index + 1]]) and index not in self.tautologies:
+          return index
+
+      return None
+
+    return self.check_table(self.get_table([model]))[0]
+
+  def check_all(self, models: list) -> list:
+    """
+    Returns the first clause every model of a batch does not satisfy, checking the whole batch at once
+
+    Parameters
+    ----------
+    models : list
+        the models, each a dictionary mapping the literals set to True to True, or a list of those literals
+
+    Returns
+    -------
+    list
+        returns the index of the first clause not satisfied by every model, None for the models satisfying every clause
+
+    Raises
+    ------
+    TypeError
+        if a model sets a variable both True and False
+    """
+    models = list(models)
+
+    if numpy is None:
+      return [self.check(model) for model in models]
+
+    chunk = max(MAX_BATCH_CELLS // max(len(self.indices), 1), 1)
+    falsified = list()
+
+    for start in range(0, len(models), chunk):
+      falsified += self.check_table(self.get_table(models[start:start + chunk]))
+
+    return falsified
+
+  def verify(self, model) -> bool:
+    """
+    Returns whether the model satisfies every clause
+
+    Parameters
+    ----------
+    model : dict or list
+        a dictionary mapping the literals set to True, as strings or integers, to True, or a list of those literals
+
+    Returns
+    -------
+    bool
+        returns true if the model satisfies every clause
+    """
+    return self.check(model) is None
+
+  def get_literals(self, model) -> set:
+    """
+    Returns the literals set to True by a model
+
+    Parameters
+    ----------
+    model : dict or list
+        a dictionary mapping the literals set to True, as strings or integers, to True, or a list of those literals
+
+    Returns
+    -------
+    set
+        returns the integer literals
+
+    Raises
+    ------
+    TypeError
+        if the model sets a variable both True and False
+    """
+    if isinstance(model, dict):
+      true = {int(literal) if value else -int(literal) for literal, value in model.items()}
+    else:
+      true = {int(literal) for literal in model}
+
+    if any(-literal in true for literal in true):
+      raise TypeError('Invalid model provided as input, it sets a variable both True and False.')
+
+    return true
+
+  def get_table(self, models: list):
+    """
+    Returns the truth table of a batch of models, with a row per model and a column per literal of the CNF
+
+    Parameters
+    ----------
+    models : list
+        the models, each a dictionary mapping the literals set to True to True, or a list of those literals
+
+    Returns
+    -------
+    numpy.ndarray
+        returns the booleans telling whether every model sets every literal to True, literal l in column l + variables,
+        followed by a column that is always False
+
+    Raises
+    ------
+    TypeError
+        if a model sets a variable both True and False
+    """
+    variables = self.variables
+    table = numpy.zeros((len(models), 2 * variables + 2), dtype = bool)
+
+    for row, model in enumerate(models):
+      literals = numpy.fromiter(self.get_literals(model), dtype = numpy.int64)
+
+      # variables the CNF does not hold cannot satisfy any of its clauses
+      table[row, literals[numpy.abs(literals) <= variables] + variables] = True
+
+    return table
+
+  def check_table(self, table) -> list:
+    """
+    Returns the first clause not satisfied by every row of a truth table
+
+    Parameters
+    ----------
+    table : numpy.ndarray
+        the truth table of a batch of models
+
+    Returns
+    -------
+    list
+        returns the index of the first clause not satisfied by every model, None for the models satisfying every clause
+    """
+    if self.clauses == 0:
+      return [None] * len(table)
+
+    # reduceat takes the single element at the start of an empty clause instead of nothing
+    satisfied = numpy.logical_or.reduceat(table[:, self.indices], self.starts, axis = 1)
+    satisfied[:, self.empty] = False
+    satisfied[:, self.tautologies] = True
+
+    unsatisfied = ~satisfied
+    first = unsatisfied.argmax(axis = 1)
+
+    return [int(index) if unsatisfied[row, index] else None for row, index in enumerate(first)]
@@ -0,0 +1,250 @@
+"""
+Class maintaining literal occurrence and clause size counters of a CNF as literals are assigned and unassigned.
+
+Branching heuristics such as MOMS, Jeroslow-Wang and DLIS only look at the clauses that are not satisfied yet, and at
+how many of their literals are still unassigned. Instead of scanning the whole CNF at every decision, the counters
+are updated on every assignment, visiting only the clauses containing the literal or its negation.
+
+For every clause the counters keep the number of True literals, so a clause is satisfied when it has any, and its
+size, the number of its literals that are still unassigned. Unsatisfied clauses are kept in one bucket per size.
+For every literal they keep the number of unsatisfied clauses containing it (DLIS) and the Jeroslow-Wang weight,
+the sum of 2 ** -size over those clauses. Weights are stored as integers scaled by 2 ** max_size, which keeps them
+exact however many times they are updated.
+
+The counts also tell which literals are pure, occurring in unsatisfied clauses while their negation does not. A literal
+only becomes pure when the count of its negation drops to 0, so such literals are recorded as candidates, and only
+candidates are checked when looking for pure literals.
+
+Keeping the per literal counters up to date means visiting every literal of a clause whose state changes, so each of
+them is only kept when asked for: MOMS only needs the buckets, DLIS and pure literals the counts and Jeroslow-Wang the weights.
+
+Every counter only depends on the current assignment, so literals can be unassigned in any order.
+Tables indexed by literals use the same signed indexing as the watched literal engines.
+"""
+
+class OccurrenceCounters:
+
+  def __init__(self, clauses: list, max_variable: int, values: list, counts: bool = True, weights: bool = True):
+    """
+    Parameters
+    ----------
+    clauses : list
+        the clauses to count, as lists of integer literals without duplicates
+    max_variable : int
+        the largest variable of the CNF
+    values : list
+        the current value of every literal, True, False or None, indexed by literal
+    counts : bool
+        keep the number of unsatisfied clauses containing every literal, along with the pure literal candidates
+    weights : bool
+        keep the Jeroslow-Wang weight of every literal
+    """
+    size = 2 * max_variable + 1
+    self.track_counts = counts
+    self.track_weights = weights
+    self.clauses = clauses
+    self.max_size = max((len(clause) for clause in clauses), default = 0)
+    self.occurrences = [list() for _ in range(size)]
+    self.true_counts = [0] * len(clauses)
+    self.sizes = [0] * len(clauses)
+    self.counts = [0] * size
+    self.weights = [0] * size
+    self.buckets = [set() for _ in range(self.max_size + 1)]
+    # an insertion ordered set, every literal of the CNF may be pure to begin with
+    self.candidates = dict.fromkeys(literal for clause in clauses for literal in clause) if counts else dict()
+
+    for index, clause in enumerate(clauses):
+      for literal in clause:
+        self.occurrences[literal].append(index)
+
+        if values[literal] is True:
+          self.true_counts[index] += 1
+        elif values[literal] is None:
+          self.sizes[index] += 1
+
+      if self.true_counts[index] == 0:
+        self.add(index)
+
+  def add(self, index: int) -> None:
+    """
+    Counts a clause that just became unsatisfied
+
+    Parameters
+    ----------
+    index : int
+        the index of the clause
+
+    Returns
+    -------
+    None
+    """
+    size = self.sizes[index]
+    self.buckets[size].add(index)
+
+    if self.track_counts:
+      counts = self.counts
+
+      for literal in self.clauses[index]:
+        counts[literal] += 1
+
+    if self.track_weights:
+      weights = self.weights
+      weight = 1 << (self.max_size - size)
+
+      for literal in self.clauses[index]:
+        weights[literal] += weight
+
+  def remove(self, index: int) -> None:
+    """
+    Stops counting a clause that just became satisfied
+
+    Parameters
+    ----------
+    index : int
+        the index of the clause
+
+    Returns
+    -------
+    None
+    """
+    size = self.sizes[index]
+    self.buckets[size].discard(index)
+
+    if self.track_counts:
+      counts = self.counts
+
+      for literal in self.clauses[index]:
+        counts[literal] -= 1
+
+        if counts[literal] == 0:
+          self.candidates[-literal] = None
+
+    if self.track_weights:
+      weights = self.weights
+      weight = 1 << (self.max_size - size)
+
+      for literal in self.clauses[index]:
+        weights[literal] -= weight
+
+  def assign(self, literal: int) -> None:
+    """
+    Updates the counters once the literal is set to True
+
+    Clauses containing the literal become satisfied, clauses containing its negation shrink by one literal.
+
+    Parameters
+    ----------
+    literal : int
+        the literal set to True
+
+    Returns
+    -------
+    None
+    """
+    true_counts = self.true_counts
+    sizes = self.sizes
+    buckets = self.buckets
+    weights = self.weights if self.track_weights else None
+
+    for index in self.occurrences[literal]:
+      true_counts[index] += 1
+
+      if true_counts[index] == 1:
+        self.remove(index)
+
+      sizes[index] -= 1
+
+    for index in self.occurrences[-literal]:
+      size = sizes[index]
+
+      if true_counts[index] == 0:
+        buckets[size].discard(index)
+        buckets[size - 1].add(index)
+
+        if weights is not None:
+          # the weight of the clause doubles as it loses a literal
+          weight = 1 << (self.max_size - size)
+
+          for other in self.clauses[index]:
+            weights[other] += weight
+
+      sizes[index] = size - 1
+
+  def unassign(self, literal: int) -> None:
+    """
+    Updates the counters once the literal, which was True, is unassigned
+
+    Parameters
+    ----------
+    literal : int
+        the literal that was True
+
+    Returns
+    -------
+    None
+    """
+    true_counts = self.true_counts
+    sizes = self.sizes
+    buckets = self.buckets
+    weights = self.weights if self.track_weights else None
+
+    for index in self.occurrences[literal]:
+      sizes[index] += 1
+      true_counts[index] -= 1
+
+      if true_counts[index] == 0:
+        self.add(index)
+
+    for index in self.occurrences[-literal]:
+      size = sizes[index] + 1
+
+      if true_counts[index] == 0:
+        buckets[size - 1].discard(index)
+        buckets[size].add(index)
+
+        if weights is not None:
+          # the weight of the clause halves as it gets a literal back
+          weight = 1 << (self.max_size - size)
+
+          for other in self.clauses[index]:
+            weights[other] -= weight
+
+      sizes[index] = size
+
+  def pure_literals(self, values: list) -> list:
+    """
+    Returns the unassigned literals occurring in unsatisfied clauses whose negation does not, and clears the candidates
+
+    Candidates that are not pure are dropped: the search only backtracks to nodes whose pure literals were all assigned,
+    so a literal can only become pure again once its negation disappears from the unsatisfied clauses once more.
+
+    Parameters
+    ----------
+    values : list
+        the current value of every literal, True, False or None, indexed by literal
+
+    Returns
+    -------
+    list
+        returns the pure literals, in the order they became candidates
+    """
+    counts = self.counts
+    pure = [literal for literal in self.candidates if values[literal] is None and counts[literal] != 0 and counts[-literal] == 0]
+    self.candidates.clear()
+
+    return pure
+
+  def smallest_clauses(self) -> list:
+    """
+    Returns the unsatisfied clauses with the fewest unassigned literals
+
+    Returns
+    -------
+    list
+        returns the indices of the clauses in the order of the CNF, empty if every clause is satisfied
+    """
+    for bucket in self.buckets:
+      if len(bucket) != 0:
+        return sorted(bucket)
+
+    return list()
@@ -0,0 +1,98 @@
+"""
+Class counting the occurrences of every string literal in the clauses left in a CNF, to find pure literals in linear time.
+
+A literal is pure when it occurs in the CNF while its negation does not, so it can be set to True without falsifying
+any clause. Rather than comparing literals against lists of the ones seen so far, every literal gets an occurrence
+count, which the iterative DPLL engine keeps up to date as clauses are removed and restored.
+
+A literal can only become pure when the last occurrence of its negation goes away, so these are recorded as
+candidates, and only candidates are checked when looking for pure literals. Candidates that are not pure at that
+point are dropped: restoring clauses on backtrack only brings the CNF back to a node whose pure literals were
+already eliminated.
+"""
+
+class PolarityCounts:
+
+  def __init__(self, cnf: list):
+    """
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF
+    """
+    self.counts = dict()
+
+    for clause in cnf:
+      for literal in clause:
+        self.counts[literal] = self.counts.get(literal, 0) + 1
+
+    # an insertion ordered set, every literal of the CNF may be pure to begin with
+    self.candidates = dict.fromkeys(self.counts)
+
+  def add(self, literal: str) -> None:
+    """
+    Counts an occurrence of the literal restored in the CNF
+
+    Parameters
+    ----------
+    literal : str
+        the literal restored
+
+    Returns
+    -------
+    None
+    """
+    self.counts[literal] = self.counts.get(literal, 0) + 1
+
+  def remove(self, literal: str) -> None:
+    """
+    Stops counting an occurrence of the literal removed from the CNF, its negation may become pure
+
+    Parameters
+    ----------
+    literal : str
+        the literal removed
+
+    Returns
+    -------
+    None
+    """
+    self.counts[literal] -= 1
+
+    if self.counts[literal] == 0:
+      self.candidates[self.get_negation(literal)] = None
+
+  def pure_literals(self) -> list:
+    """
+    Returns the literals of the CNF whose negation does not occur in it, and clears the candidates
+
+    Returns
+    -------
+    list
+        returns a list containing pure literals, in the order they became candidates
+    """
+    counts = self.counts
+    pure = [literal for literal in self.candidates
+            if counts.get(literal, 0) != 0 and counts.get(self.get_negation(literal), 0) == 0]
+    self.candidates.clear()
+
+    return pure
+
+  def get_negation(self, literal: str) -> str:
+    """
+    Returns the negation of the literal provided as parameter
+
+    Parameters
+    ----------
+    literal : str
+       the literal whose negation you want to obtain
+
+    Returns
+    -------
+    str
+       returns the negation of the literal
+    """
+    if literal[0] == '-':
+      return literal[1:]
+
+    return f'-{literal}'
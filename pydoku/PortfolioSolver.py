@@ -0,0 +1,224 @@
+"""
+Class racing several solver configurations on the same CNF, each in its own process.
+
+Which heuristic solves an instance fastest varies a lot from instance to instance and cannot be known in advance.
+A portfolio runs a different configuration (heuristic, engine, restart policy and random seed) in every process,
+takes the answer of the first process to finish, and terminates all others.
+
+Processes running the CDCL engine share their short learned clauses through a ClauseExchange, so every process
+benefits from the clauses learned by the others, which makes the portfolio more than a plain race.
+
+Every process gets its own copy of the budget, if any. A process running out of it does not end the race, but once
+every process did without an answer, the portfolio gives up with an UNKNOWN status.
+"""
+
+import multiprocessing
+import os
+import queue
+import random
+from pydoku.CDCLSolver import CDCLSolver
+from pydoku.ClauseExchange import ClauseExchange
+from pydoku.ClauseStore import ClauseStore
+from pydoku.EngineType import EngineType
+from pydoku.HeuristicType import HeuristicType
+from pydoku.RestartType import RestartType
+from pydoku.SATSolver import SATSolver
+from pydoku.SolverBudget import SolverBudget
+from pydoku.StatusType import StatusType
+
+# configurations are handed out in this order, cycling with a new seed once every one of them is in use
+DEFAULT_CONFIGURATIONS = [
+  (HeuristicType.VSIDS, EngineType.CDCL, RestartType.LUBY),
+  (HeuristicType.VSIDS, EngineType.CDCL, RestartType.GLUCOSE),
+  (HeuristicType.MAX_OCCURRENCES_MIN_SIZE, EngineType.CDCL, RestartType.NONE),
+  (HeuristicType.RANDOM_LITERAL, EngineType.CDCL, RestartType.LUBY),
+  (HeuristicType.STANDARD_DPLL, EngineType.CDCL, RestartType.GEOMETRIC),
+  (HeuristicType.VSIDS, EngineType.CDCL, RestartType.NONE),
+  (HeuristicType.RANDOM_LITERAL, EngineType.CDCL, RestartType.GLUCOSE),
+  (HeuristicType.MAX_OCCURRENCES_MIN_SIZE, EngineType.CDCL, RestartType.LUBY)
+]
+
+# seconds between two checks that the processes yet to answer are still running
+POLL_INTERVAL = 0.5
+
+class PortfolioSolver:
+
+  def __init__(self, configurations: list = None, workers: int = None, share: bool = True, max_shared_size: int = 8,
+               budget: SolverBudget = None):
+    """
+    Parameters
+    ----------
+    configurations : list
+        the (heuristic, engine, restart, seed) tuple of every process, defaults to one of the default
+        configurations per worker
+    workers : int
+        number of processes when using the default configurations, defaults to the number of CPUs
+    share : bool
+        share short learned clauses between the processes running the CDCL engine
+    max_shared_size : int
+        only learned clauses with at most this many literals are shared
+    budget : SolverBudget
+        the limits of the search of every process, None to run until an answer is found
+    """
+    if configurations is None:
+      if workers is not None and workers < 1:
+        raise TypeError('Invalid number of workers provided as input.')
+
+      count = workers or os.cpu_count() or 1
+      configurations = [DEFAULT_CONFIGURATIONS[index % len(DEFAULT_CONFIGURATIONS)] + (index,) for index in range(count)]
+
+    if len(configurations) == 0:
+      raise TypeError('Invalid configurations provided as input.')
+
+    for heuristic, engine, restart, seed in configurations:
+      if heuristic not in HeuristicType or engine not in EngineType or restart not in RestartType:
+        raise TypeError('Invalid configurations provided as input.')
+
+    self.configurations = configurations
+    self.share = share
+    self.max_shared_size = max_shared_size
+    self.budget = budget
+    self.winner = None
+    self.status = None
+    self.backtracks = 0
+    self.splits = 0
+    self.conflicts = 0
+    self.learned_clauses = 0
+    self.restarts = 0
+    self.imported_clauses = 0
+
+  def solve(self, cnf: list) -> [bool, dict, int, int]:
+    """
+    Solves the CNF with every configuration in parallel and returns the first answer
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, or a ClauseStore holding them
+
+    Returns
+    -------
+    [bool, dict, int, int]
+        returns true if a satisfiable solution to the CNF was found along with a the valid assignments,
+        the number of backtracks, and number of splits of the winning process, or None if every process ran out of
+        its budget first. The StatusType of the solve, the winning configuration and its other statistics are
+        available as attributes afterwards.
+
+    Raises
+    ------
+    RuntimeError
+        if every process failed, or exited without an answer
+    """
+    if isinstance(cnf, ClauseStore):
+      cnf = cnf.to_lists()
+
+    sharing = self.share and sum(configuration[1] == EngineType.CDCL for configuration in self.configurations) > 1
+    exchange = ClauseExchange(max_size = self.max_shared_size) if sharing else None
+    results = multiprocessing.Queue()
+    processes = list()
+    self.winner = None
+    self.status = None
+    self.backtracks, self.splits, self.conflicts, self.learned_clauses, self.restarts, self.imported_clauses = 0, 0, 0, 0, 0, 0
+
+    for index, configuration in enumerate(self.configurations):
+      process = multiprocessing.Process(target = PortfolioSolver.run_worker, args = (index, configuration, cnf, exchange, results, self.budget), daemon = True)
+      processes.append(process)
+      process.start()
+
+    errors = list()
+    unknown = 0
+    remaining = set(range(len(processes)))
+
+    try:
+      while len(remaining) != 0:
+        # a process exits only once its outcome is in the queue, so one that exited before an empty poll never posted
+        # it, killed by the OOM killer for instance, and lost the race
+        exited = {index for index in remaining if processes[index].exitcode is not None}
+
+        try:
+          index, satisfied, assignments, statistics, message = results.get(timeout = POLL_INTERVAL)
+        except queue.Empty:
+          for index in exited:
+            errors.append(f'process exited with code {processes[index].exitcode}')
+
+          remaining -= exited
+          continue
+
+        remaining.discard(index)
+
+        if message is not None:
+          errors.append(message)
+          continue
+
+        if satisfied is None:
+          unknown += 1
+          continue
+
+        self.status = StatusType.SATISFIABLE if satisfied else StatusType.UNSATISFIABLE
+        self.winner = self.configurations[index]
+        self.backtracks, self.splits, self.conflicts, self.learned_clauses, self.restarts, self.imported_clauses = statistics
+
+        return satisfied, assignments, self.backtracks, self.splits
+    finally:
+      for process in processes:
+        if process.is_alive():
+          process.terminate()
+
+      for process in processes:
+        process.join()
+
+    if unknown != 0:
+      self.status = StatusType.UNKNOWN
+      return None, None, self.backtracks, self.splits
+
+    raise RuntimeError(f'Every process of the portfolio failed: {errors[0]}')
+
+  @staticmethod
+  def run_worker(index: int, configuration: tuple, cnf: list, exchange: ClauseExchange, results, budget: SolverBudget) -> None:
+    """
+    Solves the CNF with a single configuration and puts the outcome on the results queue
+
+    Parameters
+    ----------
+    index : int
+        the index of the configuration
+    configuration : tuple
+        the heuristic, engine, restart policy and random seed to use
+    cnf : list
+        a list of clauses that belong to the CNF
+    exchange : ClauseExchange
+        the buffer to share learned clauses through, None to not share
+    results : Queue
+        the queue receiving the index, satisfiability, assignments, statistics and error message of the process
+    budget : SolverBudget
+        the limits of the search, None for no limits
+
+    Returns
+    -------
+    None
+    """
+    heuristic, engine, restart, seed = configuration
+    random.seed(seed)
+
+    try:
+      if engine == EngineType.CDCL:
+        solver = CDCLSolver(restart, budget = budget)
+
+        if exchange is not None:
+          exchange.owner = index + 1
+          solver.exchange = exchange
+
+        satisfied, assignments, backtracks, splits = solver.solve(cnf, heuristic)
+        imported_clauses = solver.imported_clauses
+      else:
+        if engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL):
+          cnf = [[str(literal) for literal in clause] for clause in cnf]
+
+        solver = SATSolver(budget = budget)
+        satisfied, assignments, backtracks, splits = solver.solve(cnf, heuristic, engine, restart)
+        imported_clauses = 0
+
+      statistics = (backtracks, splits, solver.conflicts, solver.learned_clauses, solver.restarts, imported_clauses)
+      results.put((index, satisfied, assignments, statistics, None))
+    except Exception as exception:
+      results.put((index, None, None, None, str(exception) or type(exception).__name__))
@@ -0,0 +1,429 @@
+"""
+Class simplifying a CNF before the search starts, in the style of SatELite.
+
+The CNF goes through the following stages:
+1. Unit propagation at the root, removing satisfied clauses and falsified literals
+2. Backward subsumption, removing every clause that contains all literals of another clause
+3. Self-subsuming resolution, removing literal -l from clause D when D contains every other literal of a clause (C, l)
+4. Bounded variable elimination, replacing all clauses on a variable by their resolvents when that does not increase
+   the number of clauses, and keeping new resolvents only when they are not subsumed by an existing clause
+
+The clauses removed by variable elimination are kept on a reconstruction stack. Once the simplified CNF is solved,
+extend replays the stack backwards to assign the eliminated variables, giving a model of the original CNF.
+
+A budget handed to simplify is checked before every clause is added, every subsumption check and every variable
+elimination, so that a large CNF cannot use up the time of the solve before the search even starts.
+"""
+
+from collections import defaultdict, deque
+from pydoku.SolverBudget import SolverBudget
+
+class Preprocessor:
+
+  def __init__(self, max_occurrences: int = 16, max_resolvent_size: int = 24):
+    """
+    Parameters
+    ----------
+    max_occurrences : int
+        variables occurring in more clauses than this, in either polarity, are not eliminated
+    max_resolvent_size : int
+        variables whose elimination would produce a longer resolvent are not eliminated
+    """
+    self.max_occurrences = max_occurrences
+    self.max_resolvent_size = max_resolvent_size
+    self.reset()
+
+  def reset(self) -> None:
+    """
+    Clears the clauses, reconstruction stack and statistics
+
+    Returns
+    -------
+    None
+    """
+    self.clauses = list()
+    self.occurs = defaultdict(set)
+    self.variables = set()
+    self.fixed = dict()
+    self.units = list()
+    self.queue = deque()
+    self.queued = set()
+    self.stack = list()
+    self.eliminated = set()
+    self.inconsistent = False
+    self.budget = None
+    self.stopped = False
+    self.subsumed_clauses = 0
+    self.strengthened_clauses = 0
+    self.eliminated_variables = 0
+
+  def simplify(self, cnf: list, budget: SolverBudget = None) -> list:
+    """
+    Returns a simplified CNF that is satisfiable if and only if the given CNF is
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses, literals may be given as strings or integers
+    budget : SolverBudget
+        the running budget of the solve, None to always simplify until no clause changes anymore
+
+    Returns
+    -------
+    list
+        returns the simplified CNF as a list of clauses of integer literals,
+        holding a single empty clause if the CNF was found to be unsatisfiable, or None if the budget ran out first
+
+    See Also
+    --------
+    extend : function turning a model of the simplified CNF into a model of the given CNF
+    """
+    self.reset()
+    self.budget = budget
+
+    for clause in cnf:
+      if self.exhausted():
+        return None
+
+      literals = {int(literal) for literal in clause}
+
+      if any(-literal in literals for literal in literals):
+        continue
+
+      self.variables.update(abs(literal) for literal in literals)
+      self.add_clause(literals)
+
+    self.run_queue()
+
+    if not self.inconsistent and not self.stopped:
+      self.eliminate_variables()
+
+    if self.stopped:
+      return None
+
+    if self.inconsistent:
+      return [[]]
+
+    return [sorted(clause, key = abs) for clause in self.clauses if clause is not None]
+
+  def extend(self, assignments: dict) -> dict:
+    """
+    Turns a model of the simplified CNF into a complete model of the CNF given to simplify
+
+    Parameters
+    ----------
+    assignments : dict
+        a dictionary mapping the literals set to True in the simplified CNF to True, missing variables are False
+
+    Returns
+    -------
+    dict
+        returns a dictionary mapping the literal set to True of every variable of the original CNF to True
+    """
+    values = dict(self.fixed)
+
+    for literal, value in assignments.items():
+      literal = int(literal)
+
+      if value and abs(literal) not in values:
+        values[abs(literal)] = literal > 0
+
+    # clauses containing the negative literal are satisfied by their resolvents, so only the positive ones matter
+    for variable, clauses in reversed(self.stack):
+      values[variable] = False
+
+      for clause in clauses:
+        if variable in clause and not any(values.get(abs(literal), False) == (literal > 0) for literal in clause if literal != variable):
+          values[variable] = True
+          break
+
+    return {str(variable if values.get(variable, False) else -variable): True for variable in sorted(self.variables)}
+
+  def add_clause(self, literals: set) -> int:
+    """
+    Adds a clause and queues it for subsumption checks
+
+    Parameters
+    ----------
+    literals : set
+        the integer literals of the clause
+
+    Returns
+    -------
+    int
+        returns the index of the clause
+    """
+    index = len(self.clauses)
+    self.clauses.append(literals)
+
+    for literal in literals:
+      self.occurs[literal].add(index)
+
+    self.on_change(index)
+
+    return index
+
+  def remove_clause(self, index: int) -> None:
+    """
+    Removes a clause
+
+    Parameters
+    ----------
+    index : int
+        the index of the clause
+
+    Returns
+    -------
+    None
+    """
+    for literal in self.clauses[index]:
+      self.occurs[literal].discard(index)
+
+    self.clauses[index] = None
+
+  def strengthen(self, index: int, literal: int) -> None:
+    """
+    Removes a literal from a clause
+
+    Parameters
+    ----------
+    index : int
+        the index of the clause
+    literal : int
+        the literal to remove
+
+    Returns
+    -------
+    None
+    """
+    self.clauses[index].discard(literal)
+    self.occurs[literal].discard(index)
+    self.on_change(index)
+
+  def on_change(self, index: int) -> None:
+    """
+    Records a new or shortened clause: units are queued for propagation and every clause for subsumption checks
+
+    Parameters
+    ----------
+    index : int
+        the index of the clause
+
+    Returns
+    -------
+    None
+    """
+    clause = self.clauses[index]
+
+    if len(clause) == 0:
+      self.inconsistent = True
+    elif len(clause) == 1:
+      self.units.append(next(iter(clause)))
+
+    if index not in self.queued:
+      self.queued.add(index)
+      self.queue.append(index)
+
+  def propagate(self) -> None:
+    """
+    Assigns every queued unit literal, removing the clauses it satisfies and its negation from the other clauses
+
+    Returns
+    -------
+    None
+    """
+    while len(self.units) != 0 and not self.inconsistent:
+      literal = self.units.pop()
+      variable = abs(literal)
+
+      if variable in self.fixed:
+        if self.fixed[variable] != (literal > 0):
+          self.inconsistent = True
+        continue
+
+      self.fixed[variable] = literal > 0
+
+      for index in list(self.occurs[literal]):
+        self.remove_clause(index)
+
+      for index in list(self.occurs[-literal]):
+        self.strengthen(index, -literal)
+
+  def run_queue(self) -> None:
+    """
+    Propagates units and runs subsumption and self-subsuming resolution until no clause changes anymore
+
+    Returns
+    -------
+    None
+    """
+    while not self.inconsistent:
+      self.propagate()
+
+      if len(self.queue) == 0 or self.inconsistent or self.exhausted():
+        return
+
+      index = self.queue.popleft()
+      self.queued.discard(index)
+
+      if self.clauses[index] is not None:
+        self.backward_subsume(index)
+
+  def backward_subsume(self, index: int) -> None:
+    """
+    Removes the clauses subsumed by the given clause and strengthens the clauses it self-subsumes
+
+    Parameters
+    ----------
+    index : int
+        the index of the clause
+
+    Returns
+    -------
+    None
+    """
+    clause = self.clauses[index]
+    occurs = self.occurs
+
+    # every clause containing this one contains its least frequent literal
+    rarest = min(clause, key = lambda literal: len(occurs[literal]))
+
+    for other in list(occurs[rarest]):
+      candidate = self.clauses[other]
+
+      if other != index and len(candidate) >= len(clause) and clause <= candidate:
+        self.remove_clause(other)
+        self.subsumed_clauses += 1
+
+    for literal in list(clause):
+      rest = clause - {literal}
+
+      for other in list(occurs[-literal]):
+        candidate = self.clauses[other]
+
+        if candidate is not None and len(candidate) >= len(clause) and rest <= candidate:
+          self.strengthen(other, -literal)
+          self.strengthened_clauses += 1
+
+      if self.clauses[index] is None or self.inconsistent:
+        return
+
+  def is_subsumed(self, literals: set) -> bool:
+    """
+    Returns whether an existing clause subsumes the given literals (forward subsumption)
+
+    Parameters
+    ----------
+    literals : set
+        the integer literals of a candidate clause
+
+    Returns
+    -------
+    bool
+        returns true if some clause only contains literals from the given ones
+    """
+    for literal in literals:
+      for index in self.occurs[literal]:
+        clause = self.clauses[index]
+
+        if len(clause) <= len(literals) and clause <= literals:
+          return True
+
+    return False
+
+  def eliminate_variables(self) -> None:
+    """
+    Eliminates variables by distribution, least frequent first, as long as the number of clauses does not grow
+
+    Returns
+    -------
+    None
+    """
+    occurs = self.occurs
+    candidates = sorted(self.variables, key = lambda variable: len(occurs[variable]) + len(occurs[-variable]))
+
+    for variable in candidates:
+      if self.inconsistent or self.exhausted():
+        return
+
+      if variable in self.fixed or variable in self.eliminated:
+        continue
+
+      positive = list(occurs[variable])
+      negative = list(occurs[-variable])
+
+      if len(positive) + len(negative) == 0 or len(positive) > self.max_occurrences or len(negative) > self.max_occurrences:
+        continue
+
+      resolvents = self.get_resolvents(variable, positive, negative)
+
+      if resolvents is None:
+        continue
+
+      self.stack.append((variable, [list(self.clauses[index]) for index in positive + negative]))
+      self.eliminated.add(variable)
+      self.eliminated_variables += 1
+
+      for index in positive + negative:
+        self.remove_clause(index)
+
+      for resolvent in resolvents:
+        if not self.is_subsumed(resolvent):
+          self.add_clause(resolvent)
+
+      self.run_queue()
+
+  def exhausted(self) -> bool:
+    """
+    Checks the budget of the solve, remembering that simplification stopped once it ran out
+
+    Returns
+    -------
+    bool
+        returns true if simplification must stop
+    """
+    if self.budget is not None and not self.stopped:
+      # no search has started yet, so only the time, memory and interruption limits can be reached
+      self.stopped = self.budget.exhausted(0, 0)
+
+    return self.stopped
+
+  def get_resolvents(self, variable: int, positive: list, negative: list) -> list:
+    """
+    Returns the non-tautological resolvents on a variable, or None if eliminating it is not worth it
+
+    Parameters
+    ----------
+    variable : int
+        the variable to resolve on
+    positive : list
+        indices of the clauses containing the variable
+    negative : list
+        indices of the clauses containing its negation
+
+    Returns
+    -------
+    list
+        returns the resolvents, or None if there are more of them than clauses they replace or one is too long
+    """
+    resolvents = list()
+    limit = len(positive) + len(negative)
+
+    for first in positive:
+      base = self.clauses[first] - {variable}
+
+      for second in negative:
+        resolvent = base | (self.clauses[second] - {-variable})
+
+        if any(-literal in resolvent for literal in resolvent):
+          continue
+
+        if len(resolvent) > self.max_resolvent_size:
+          return None
+
+        resolvents.append(resolvent)
+
+        if len(resolvents) > limit:
+          return None
+
+    return resolvents
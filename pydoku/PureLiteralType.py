@@ -0,0 +1,10 @@
+"""
+The class contains enums defining when the solver looks for pure literals
+"""
+from enum import IntEnum, unique
+
+@unique
+class PureLiteralType(IntEnum):
+  NONE = 1
+  ROOT = 2
+  ALL = 3
@@ -0,0 +1,140 @@
+"""
+Class deciding when the CDCL engine should restart its search.
+
+Static policies restart after a number of conflicts that is either fixed, grows geometrically or follows the Luby
+sequence (1, 1, 2, 1, 1, 2, 4, ...), always scaled by the base interval. The glucose-style dynamic policy instead
+restarts as soon as the literal block distance (LBD) of recently learned clauses is clearly worse than the average
+over the whole run, which signals that the search has wandered into an unproductive part of the search space.
+"""
+
+from collections import deque
+from pydoku.RestartType import RestartType
+
+class RestartPolicy:
+
+  def __init__(self, restart: RestartType, interval: int = 100, factor: float = 1.5, window: int = 50, margin: float = 0.8):
+    """
+    Parameters
+    ----------
+    restart : RestartType
+        the restart policy to follow
+    interval : int
+        number of conflicts before the first restart of the static policies
+    factor : float
+        growth of the interval after every restart of the geometric policy
+    window : int
+        number of recent learned clauses whose LBD is compared to the global average by the glucose policy
+    margin : float
+        the glucose policy restarts once the recent average LBD times this margin exceeds the global average
+    """
+    if restart not in RestartType:
+      raise TypeError('Invalid restart policy provided as input.')
+
+    self.restart = restart
+    self.interval = interval
+    self.factor = factor
+    self.margin = margin
+    self.restarts = 0
+    self.conflicts = 0
+    self.limit = self.next_limit()
+    self.recent = deque(maxlen = window)
+    self.lbd_sum = 0
+    self.lbd_count = 0
+
+  def on_conflict(self, lbd: int) -> None:
+    """
+    Records a conflict along with the literal block distance of the clause learned from it
+
+    Parameters
+    ----------
+    lbd : int
+        the number of distinct decision levels in the learned clause
+
+    Returns
+    -------
+    None
+    """
+    self.conflicts += 1
+    self.recent.append(lbd)
+    self.lbd_sum += lbd
+    self.lbd_count += 1
+
+  def should_restart(self) -> bool:
+    """
+    Returns whether the search should restart now
+
+    Returns
+    -------
+    bool
+        returns true if the policy asks for a restart
+    """
+    if self.restart == RestartType.NONE:
+      return False
+
+    if self.restart == RestartType.GLUCOSE:
+      if len(self.recent) < self.recent.maxlen:
+        return False
+
+      return sum(self.recent) * self.margin / len(self.recent) > self.lbd_sum / self.lbd_count
+
+    return self.conflicts >= self.limit
+
+  def on_restart(self) -> None:
+    """
+    Starts counting towards the next restart
+
+    Returns
+    -------
+    None
+    """
+    self.restarts += 1
+    self.conflicts = 0
+    self.limit = self.next_limit()
+    self.recent.clear()
+
+  def next_limit(self) -> float:
+    """
+    Returns the number of conflicts allowed before the next restart of the static policies
+
+    Returns
+    -------
+    float
+        returns the conflict limit for the current restart
+    """
+    if self.restart == RestartType.GEOMETRIC:
+      return self.interval * self.factor ** self.restarts
+    elif self.restart == RestartType.LUBY:
+      return self.interval * RestartPolicy.luby(self.restarts + 1)
+
+    return self.interval
+
+  @staticmethod
+  def luby(index: int) -> int:
+    """
+    Returns the element at the given position of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ...
+
+    Parameters
+    ----------
+    index : int
+        the position in the sequence, starting at 1
+
+    Returns
+    -------
+    int
+        returns the element of the sequence
+    """
+    # find the smallest complete subsequence 2^k - 1 long containing the position, then descend into it
+    position = index - 1
+    size = 1
+    exponent = 0
+
+    while size < position + 1:
+      exponent += 1
+      size = 2 * size + 1
+
+    while size - 1 != position:
+      size = (size - 1) >> 1
+      exponent -= 1
+      position = position % size
+
+    return 2 ** exponent
@@ -0,0 +1,12 @@
+"""
+The class contains enums defining the available restart policies for the CDCL engine
+"""
+from enum import IntEnum, unique
+
+@unique
+class RestartType(IntEnum):
+  NONE = 1
+  FIXED = 2
+  GEOMETRIC = 3
+  LUBY = 4
+  GLUCOSE = 5
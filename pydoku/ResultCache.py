@@ -0,0 +1,303 @@
+"""
+Class keeping the results of solved CNFs in an SQLite database on disk, so repeated CNFs are answered without searching.
+
+Results are keyed by a canonical hash of the CNF: the literals of every clause and the clauses themselves are sorted
+and deduplicated before hashing, so the same CNF written with its clauses or literals in another order gets the same
+key. Every entry holds the verdict and, for a satisfiable CNF, the model found the first time it was solved.
+
+Files can also be linked to the key of their CNF by a digest of their bytes. Hashing the bytes of a file is much
+cheaper than parsing it, so a file seen before is answered without parsing it at all.
+
+The cache is bounded in size: every hit marks the entry as used, and once the entries take more than the maximum
+size, the least recently used ones are evicted. SQLite locks the database around every write, so worker processes
+can share a cache, each of them opening its own connection the first time it uses the cache.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+
+DEFAULT_MAX_SIZE = 64 << 20
+DIGEST_CHUNK_SIZE = 1 << 20
+
+# seconds a process waits for another one to release the database before giving up
+LOCK_TIMEOUT = 30.0
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+  key TEXT PRIMARY KEY,
+  satisfiable INTEGER NOT NULL,
+  model TEXT NOT NULL,
+  size INTEGER NOT NULL,
+  used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_used ON results (used);
+CREATE TABLE IF NOT EXISTS files (
+  digest TEXT PRIMARY KEY,
+  key TEXT NOT NULL
+);
+'''
+
+class ResultCache:
+
+  def __init__(self, path: str, max_size: int = DEFAULT_MAX_SIZE):
+    """
+    Parameters
+    ----------
+    path : str
+        the path of the database file, created if it does not exist
+    max_size : int
+        the number of bytes the keys and models stored may take before the least recently used ones are evicted
+    """
+    if not isinstance(max_size, int) or max_size <= 0:
+      raise TypeError('Invalid cache size provided as input.')
+
+    self.path = path
+    self.max_size = max_size
+    self.hits = 0
+    self.misses = 0
+    self.connection = None
+    self.pid = None
+
+  def __getstate__(self) -> dict:
+    # connections cannot be sent to other processes, which open their own
+    state = dict(self.__dict__)
+    state['connection'] = None
+    state['pid'] = None
+
+    return state
+
+  def connect(self) -> sqlite3.Connection:
+    """
+    Returns the connection of the current process to the database, opening it and creating the tables if needed
+
+    A forked process inherits the connection of its parent, which must not be used from two processes,
+    so a new connection is opened whenever the process changed.
+
+    Returns
+    -------
+    sqlite3.Connection
+        returns a connection in autocommit mode, writes spanning several statements open their own transaction
+    """
+    if self.connection is None or self.pid != os.getpid():
+      connection = sqlite3.connect(self.path, timeout = LOCK_TIMEOUT, isolation_level = None)
+      # write-ahead logging lets processes keep reading while another one writes
+      connection.execute('PRAGMA journal_mode = WAL')
+      connection.executescript(SCHEMA)
+      self.connection = connection
+      self.pid = os.getpid()
+
+    return self.connection
+
+  def close(self) -> None:
+    """
+    Closes the connection of the current process, the next use of the cache opens a new one
+
+    Returns
+    -------
+    None
+    """
+    if self.connection is not None and self.pid == os.getpid():
+      self.connection.close()
+
+    self.connection = None
+    self.pid = None
+
+  @staticmethod
+  def key(cnf) -> str:
+    """
+    Returns the canonical hash of a CNF, which does not depend on the order of its clauses or of their literals
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses, or a ClauseStore holding them, literals may be given as strings or integers
+
+    Returns
+    -------
+    str
+        returns the hexadecimal SHA-256 digest of the sorted clauses
+    """
+    clauses = sorted(set(tuple(sorted(set(int(literal) for literal in clause))) for clause in cnf))
+    text = '\n'.join(' '.join(str(literal) for literal in clause) for clause in clauses)
+
+    return hashlib.sha256(text.encode()).hexdigest()
+
+  @staticmethod
+  def file_digest(filepath: str) -> str:
+    """
+    Returns the digest of the bytes of a file, read in large chunks
+
+    Parameters
+    ----------
+    filepath : str
+        the path of the file
+
+    Returns
+    -------
+    str
+        returns the hexadecimal SHA-256 digest of the file
+    """
+    digest = hashlib.sha256()
+
+    with open(filepath, 'rb') as file:
+      for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b''):
+        digest.update(chunk)
+
+    return digest.hexdigest()
+
+  def get(self, key: str) -> [bool, dict]:
+    """
+    Returns the result stored for a CNF and marks it as used
+
+    Parameters
+    ----------
+    key : str
+        the canonical hash of the CNF
+
+    Returns
+    -------
+    [bool, dict]
+        returns true if the CNF is satisfiable along with its model, or None if the CNF is not in the cache
+    """
+    row = self.connect().execute('SELECT key, satisfiable, model FROM results WHERE key = ?', (key,)).fetchone()
+
+    return self.use(row)
+
+  def get_file(self, digest: str) -> [bool, dict]:
+    """
+    Returns the result stored for the CNF of a file linked by the digest of its bytes, and marks it as used
+
+    Parameters
+    ----------
+    digest : str
+        the digest of the file
+
+    Returns
+    -------
+    [bool, dict]
+        returns true if the CNF is satisfiable along with its model, or None if the file is not in the cache
+    """
+    row = self.connect().execute(
+      'SELECT results.key, satisfiable, model FROM files JOIN results ON files.key = results.key WHERE digest = ?',
+      (digest,)
+    ).fetchone()
+
+    return self.use(row)
+
+  def use(self, row: tuple) -> [bool, dict]:
+    """
+    Counts a lookup and turns the row found into a result, marking it as the most recently used entry
+
+    Parameters
+    ----------
+    row : tuple
+        the key, verdict and model of the entry found, None if there was none
+
+    Returns
+    -------
+    [bool, dict]
+        returns true if the CNF is satisfiable along with its model, or None if no entry was found
+    """
+    if row is None:
+      self.misses += 1
+      return None
+
+    key, satisfiable, model = row
+    self.hits += 1
+    self.connect().execute('UPDATE results SET used = ? WHERE key = ?', (time.time(), key))
+
+    if not satisfiable:
+      return [False, None]
+
+    return [True, dict.fromkeys(model.split(), True)]
+
+  def put(self, key: str, satisfiable: bool, assignments: dict) -> None:
+    """
+    Stores the result of a CNF, then evicts the least recently used entries if the cache grew too large
+
+    Parameters
+    ----------
+    key : str
+        the canonical hash of the CNF
+    satisfiable : bool
+        whether the CNF is satisfiable
+    assignments : dict
+        the model of a satisfiable CNF, mapping every literal set to True to True
+
+    Returns
+    -------
+    None
+    """
+    model = ' '.join(literal for literal, value in assignments.items() if value) if satisfiable else ''
+    size = len(key) + len(model)
+
+    # an entry larger than the whole cache would only evict everything else before being evicted itself
+    if size > self.max_size:
+      return
+
+    connection = self.connect()
+    connection.execute('BEGIN IMMEDIATE')
+
+    try:
+      connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)', (key, int(satisfiable), model, size, time.time()))
+      self.evict(connection)
+      connection.execute('COMMIT')
+    except BaseException:
+      connection.execute('ROLLBACK')
+      raise
+
+  def link(self, digest: str, key: str) -> None:
+    """
+    Links a file, by the digest of its bytes, to the key of its CNF
+
+    Parameters
+    ----------
+    digest : str
+        the digest of the file
+    key : str
+        the canonical hash of the CNF read from the file
+
+    Returns
+    -------
+    None
+    """
+    self.connect().execute('INSERT OR REPLACE INTO files VALUES (?, ?)', (digest, key))
+
+  def evict(self, connection: sqlite3.Connection) -> None:
+    """
+    Deletes the least recently used entries until the cache fits in its maximum size, along with the files linked to them
+
+    Must be called within a write transaction, so no other process changes the entries in the meantime.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        the connection holding the transaction
+
+    Returns
+    -------
+    None
+    """
+    total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    if total <= self.max_size:
+      return
+
+    evicted = list()
+    cursor = connection.execute('SELECT key, size FROM results ORDER BY used')
+
+    for key, size in cursor:
+      if total <= self.max_size:
+        break
+
+      evicted.append((key,))
+      total -= size
+
+    cursor.close()
+    connection.executemany('DELETE FROM results WHERE key = ?', evicted)
+    connection.executemany('DELETE FROM files WHERE key = ?', evicted)
+
+  def __len__(self) -> int:
+    return self.connect().execute('SELECT COUNT(*) FROM results').fetchone()[0]
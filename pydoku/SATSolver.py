@@ -1,57 +1,629 @@
 """
 Class containing the algorithmic logic to solve Boolean Satisfiability Problems.
 
-The current implementation supports 3 heuristics:
+The current implementation supports 7 heuristics:
 1. The standard Davis-Putnam-Logemann-Loveland (DPLL)
 2. DPLL using the random literal (RAND) branching heuristic
 3. DPLL using the maximum occurences in minimal size clauses (MOMS) branching heuristic
+4. Activity based branching (VSIDS), only available with the integer literal engines
+5. The one-sided Jeroslow-Wang heuristic, picking the literal with the highest sum of 2 ** -size over its clauses
+6. The two-sided Jeroslow-Wang heuristic, picking the variable with the highest sum over both of its literals
+7. The dynamic largest individual sum (DLIS) heuristic, picking the literal occurring in the most clauses
+
+The integer literal engines compute every heuristic but VSIDS from OccurrenceCounters kept up to date on every
+assignment, while the string literal engines, which rewrite the CNF at every step anyway, count in a single pass.
+
+Each heuristic can be run by one of the following engines:
+1. The recursive DPLL implementation working on string literals in this class
+2. An integer literal DPLL using two watched literals per clause (WatchedLiteralSolver)
+3. An iterative version of the string literal DPLL that undoes changes on backtrack instead of copying the CNF
+4. Conflict-driven clause learning (CDCL) with non-chronological backjumping (CDCLSolver)
+
+Pure literals are found from the number of occurrences of every literal, which the iterative DPLL engine and the
+integer literal engines keep up to date as clauses are satisfied and restored. They are looked for after every
+decision by default with the string literal engines, and optionally at the root only, or not at all. The integer
+literal engines do not look for them by default, and the CDCL engine only supports looking for them at the root.
+
+Any engine can optionally run on a CNF simplified by the Preprocessor first, the model found is then extended back
+to every variable of the original CNF.
+
+A solve can split the CNF into components sharing no variable with each other, once the root is simplified by unit
+propagation and pure literal elimination, and solve every component on its own, one after the other or in a pool of
+worker processes. The models of the components are merged into a single model of the CNF. The recursive DPLL engine
+can also split the CNF it is left with after every decision, so a conflict in one component never undoes the
+decisions made in another one.
+
+Given a ResultCache, a solve first looks the CNF up by its canonical hash and returns the stored result without
+searching, and stores the result of every solve that reached an answer.
+
+Every solve collects SolverStatistics, and the SolverHooks given to the solver are invoked by whichever engine runs.
+A SolverBudget limits the time, decisions, conflicts and memory of every solve, which ends with an UNKNOWN status
+once the budget runs out or the solve is interrupted.
 """
 
 from copy import copy, deepcopy
+from pydoku.CDCLSolver import CDCLSolver
+from pydoku.ClauseStore import ClauseStore
+from pydoku.ComponentSplitter import ComponentSplitter
+from pydoku.DecompositionType import DecompositionType
+from pydoku.EngineType import EngineType
 from pydoku.HeuristicType import HeuristicType
-from random import choice
+from pydoku.PolarityCounts import PolarityCounts
+from pydoku.Preprocessor import Preprocessor
+from pydoku.PureLiteralType import PureLiteralType
+from pydoku.RestartType import RestartType
+from pydoku.ResultCache import ResultCache
+from pydoku.SolverBudget import SolverBudget
+from pydoku.SolverHooks import SolverHooks
+from pydoku.SolverStatistics import SolverStatistics
+from pydoku.StatusType import StatusType
+from pydoku.WatchedLiteralSolver import WatchedLiteralSolver
+from random import randrange
+import multiprocessing
+import time
+
+# seconds between two checks of the budget while waiting for the components solved by worker processes
+POLL_INTERVAL = 0.1
 
 class SATSolver:
 
-  def __init__(self):
-    self.backtracks = 0
-    self.splits = 0
-
-
-  def solve(self, cnf: list, heuristic: HeuristicType) -> [bool, dict, int, int]:
+  def __init__(self, hooks: SolverHooks = None, budget: SolverBudget = None, cache: ResultCache = None):
+    """
+    Parameters
+    ----------
+    hooks : SolverHooks
+        the callbacks to invoke while searching, None for no callbacks
+    budget : SolverBudget
+        the limits of every solve, defaults to no limits, which still allows interrupting a solve
+    cache : ResultCache
+        the results of the CNFs solved before, None to always search
+    """
+    self.hooks = hooks
+    self.budget = budget if budget is not None else SolverBudget()
+    self.cache = cache
+    self.file_digest = None
+    self.pure_literals = PureLiteralType.ALL
+    self.decomposition = DecompositionType.NONE
+    self.workers = None
+    self.reset()
+
+  def solve(self, cnf: list, heuristic: HeuristicType, engine: EngineType = EngineType.RECURSIVE_DPLL,
+            restart: RestartType = RestartType.NONE, reduce_interval: int = 2000, reduce_increment: int = 300,
+            preprocess: bool = False, pure_literals: PureLiteralType = None, decompose: DecompositionType = DecompositionType.NONE,
+            workers: int = None) -> [bool, dict, int, int]:
     """
     Solves a boolean satisfiability problem represented in conjunctive normal form (CNF)
 
     Parameters
     ----------
     cnf : list
-        a list of clauses that belong to the CNF
+        a list of clauses that belong to the CNF, or a ClauseStore holding them
     heuristic : HeuristicType
       an Enum value giving us an indication of the branching heuristic to use while running DPLL
+    engine : EngineType
+      an Enum value selecting the search engine, defaults to the recursive DPLL implementation
+    restart : RestartType
+      an Enum value selecting the restart policy of the CDCL engine, defaults to never restarting
+    reduce_interval : int
+      number of conflicts before the CDCL engine first deletes the least useful half of its learned clauses
+    reduce_increment : int
+      growth of the number of conflicts between two reductions of the learned clauses
+    preprocess : bool
+      simplify the CNF with subsumption and bounded variable elimination before searching, defaults to False
+    pure_literals : PureLiteralType
+      an Enum value selecting where pure literals are set to True, defaults to after every decision with the string
+      literal engines and to nowhere with the integer literal engines
+    decompose : DecompositionType
+      an Enum value selecting where the CNF is split into independent components, defaults to nowhere
+    workers : int
+      number of worker processes solving the components found at the root, None to solve them in this process
 
     Returns
     -------
     [bool, dict, int, int]
-        returns true if a satisfiable solution to the CNF was found along with a the valid assignments,
-        the number of backtracks, and number of splits.
+        returns true if the CNF is satisfiable, false if it is unsatisfiable, or None if the budget ran out first,
+        along with the valid assignments, the number of backtracks and the number of splits.
+        The solver keeps the following attributes afterwards:
+
+        - status: the StatusType of the solve, with the limit that stopped an UNKNOWN solve as budget.reason
+        - cached: whether the result came from the cache, under the canonical hash of the CNF kept as cache_key
+        - conflicts, restarts: the number of conflicts and restarts of the search
+        - learned_clauses, live_learned_clauses, deleted_learned_clauses: the clauses learned in total, still live
+          and deleted
+        - eliminated_variables, subsumed_clauses, strengthened_clauses: the preprocessing statistics
+        - components, largest_component: the number of components found at the root and the number of clauses of the
+          largest one
+        - statistics: the SolverStatistics of the solve
 
     See Also
     --------
     dpll : function implementing the logic for Davis–Putnam–Logemann–Loveland (DPLL) algorithm
+    iterative_dpll : function implementing the same search without recursion or copies of the CNF
+    WatchedLiteralSolver : class implementing DPLL over integer literals with two watched literals
+    CDCLSolver : class implementing conflict-driven clause learning on top of the watched literals
+    Preprocessor : class simplifying the CNF and extending the model back to the eliminated variables
+    solve_components : function solving the components of the CNF on their own
     """
-    self.backtracks = 0
-    self.splits = 0
+    self.reset()
 
     if heuristic not in HeuristicType:
       raise TypeError('Invalid heuristic provided as input.')
 
-    satisfied, assignments = self.dpll(cnf, dict(), heuristic)
+    if engine not in EngineType:
+      raise TypeError('Invalid engine provided as input.')
 
-    if not satisfied:
-      self.backtracks -= 1
+    if restart not in RestartType:
+      raise TypeError('Invalid restart policy provided as input.')
+
+    if restart != RestartType.NONE and engine != EngineType.CDCL:
+      raise TypeError('Restarts are only supported by the CDCL engine.')
+
+    if heuristic == HeuristicType.VSIDS and engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL):
+      raise TypeError('Heuristic provided is not supported by the engine provided.')
+
+    if pure_literals is None:
+      pure_literals = PureLiteralType.NONE if engine in (EngineType.WATCHED_LITERALS, EngineType.CDCL) else PureLiteralType.ALL
+
+    if pure_literals not in PureLiteralType:
+      raise TypeError('Invalid pure literal mode provided as input.')
+
+    if pure_literals == PureLiteralType.ALL and engine == EngineType.CDCL:
+      raise TypeError('Pure literals below the root are not supported by the CDCL engine.')
+
+    if decompose not in DecompositionType:
+      raise TypeError('Invalid decomposition mode provided as input.')
+
+    if decompose == DecompositionType.ALL and engine != EngineType.RECURSIVE_DPLL:
+      raise TypeError('Decomposition below the root is only supported by the recursive DPLL engine.')
+
+    if workers is not None and workers < 1:
+      raise TypeError('Invalid number of workers provided as input.')
+
+    self.pure_literals = pure_literals
+    self.decomposition = decompose
+    self.workers = workers
+
+    if self.cache is not None:
+      self.cache_key = self.cache.key(cnf)
+      result = self.cache.get(self.cache_key)
+
+      if result is not None:
+        return self.recall(result)
+
+    started = self.budget.start()
+
+    try:
+      satisfied, assignments = self.search(cnf, heuristic, engine, restart, reduce_interval, reduce_increment, preprocess)
+    finally:
+      if started:
+        self.budget.stop()
+
+    if satisfied is None:
+      self.status = StatusType.UNKNOWN
+    else:
+      self.status = StatusType.SATISFIABLE if satisfied else StatusType.UNSATISFIABLE
+
+      if self.cache is not None:
+        self.cache.put(self.cache_key, satisfied, assignments)
 
     return satisfied, assignments, self.backtracks, self.splits
 
+  def recall(self, result: list) -> [bool, dict, int, int]:
+    """
+    Ends the solve with a result found in the cache, without searching
+
+    Parameters
+    ----------
+    result : list
+        the verdict and the model stored in the cache
+
+    Returns
+    -------
+    [bool, dict, int, int]
+        returns the verdict and the model along with no backtracks and no splits, like solve
+    """
+    satisfied, assignments = result
+    self.cached = True
+    self.status = StatusType.SATISFIABLE if satisfied else StatusType.UNSATISFIABLE
+    self.update_statistics()
+
+    return satisfied, assignments, self.backtracks, self.splits
+
+  def recall_file(self, filepath: str) -> [bool, dict, int, int]:
+    """
+    Looks a DIMACS file up in the cache by the digest of its bytes, so a file solved before is not even parsed
+
+    Parameters
+    ----------
+    filepath : str
+        the path of the file
+
+    Returns
+    -------
+    [bool, dict, int, int]
+        returns the stored result like solve, or None if there is no cache or the file is not in it.
+        The digest of the file is available as the file_digest attribute afterwards, for link_file.
+
+    See Also
+    --------
+    link_file : function linking the file to the result of the last solve
+    """
+    self.reset()
+    self.file_digest = None
+
+    if self.cache is None:
+      return None
+
+    self.file_digest = ResultCache.file_digest(filepath)
+    result = self.cache.get_file(self.file_digest)
+
+    if result is None:
+      return None
+
+    return self.recall(result)
+
+  def link_file(self) -> None:
+    """
+    Links the file last looked up with recall_file to the result of the last solve, if the solve reached an answer
+
+    Returns
+    -------
+    None
+    """
+    if self.file_digest is not None and self.cache_key is not None and self.status != StatusType.UNKNOWN:
+      self.cache.link(self.file_digest, self.cache_key)
+
+  def reset(self) -> None:
+    """
+    Clears the counters, statistics and cache lookups of the previous solve, and starts timing a new one
+
+    The digest of the file looked up last is kept, so it can still be linked to the result of the solve that follows.
+
+    Returns
+    -------
+    None
+    """
+    self.backtracks = 0
+    self.splits = 0
+    self.conflicts = 0
+    self.learned_clauses = 0
+    self.live_learned_clauses = 0
+    self.deleted_learned_clauses = 0
+    self.restarts = 0
+    self.eliminated_variables = 0
+    self.subsumed_clauses = 0
+    self.strengthened_clauses = 0
+    self.components = 0
+    self.largest_component = 0
+    self.status = None
+    self.cached = False
+    self.cache_key = None
+    self.statistics = SolverStatistics()
+    self.start_time = time.perf_counter()
+
+  def search(self, cnf: list, heuristic: HeuristicType, engine: EngineType, restart: RestartType, reduce_interval: int,
+             reduce_increment: int, preprocess: bool) -> [bool, dict]:
+    """
+    Runs the engine on the CNF, simplified first and split into components if asked to, within the budget of the solve
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, or a ClauseStore holding them
+    heuristic : HeuristicType
+      an Enum value giving us an indication of the branching heuristic to use while running DPLL
+    engine : EngineType
+      an Enum value selecting the search engine
+    restart : RestartType
+      an Enum value selecting the restart policy of the CDCL engine
+    reduce_interval : int
+      number of conflicts before the CDCL engine first deletes the least useful half of its learned clauses
+    reduce_increment : int
+      growth of the number of conflicts between two reductions of the learned clauses
+    preprocess : bool
+      simplify the CNF with subsumption and bounded variable elimination before searching
+
+    Returns
+    -------
+    [bool, dict]
+        returns true if a satisfiable solution to the CNF was found, or None if the budget ran out first,
+        along with the valid assignments
+    """
+    if preprocess:
+      start_time = time.perf_counter()
+      preprocessor = Preprocessor()
+      simplified = preprocessor.simplify(cnf, self.budget)
+      simplification_time = time.perf_counter() - start_time
+
+      # the budget ran out while simplifying, which leaves nothing to extend
+      if simplified is None:
+        self.eliminated_variables = preprocessor.eliminated_variables
+        self.subsumed_clauses = preprocessor.subsumed_clauses
+        self.strengthened_clauses = preprocessor.strengthened_clauses
+        self.statistics.simplification_time += simplification_time
+        self.statistics.total_time = time.perf_counter() - start_time
+        return None, None
+
+      if engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL):
+        simplified = [[str(literal) for literal in clause] for clause in simplified]
+
+      satisfied, assignments = self.search(simplified, heuristic, engine, restart, reduce_interval, reduce_increment, False)
+      self.eliminated_variables = preprocessor.eliminated_variables
+      self.subsumed_clauses = preprocessor.subsumed_clauses
+      self.strengthened_clauses = preprocessor.strengthened_clauses
+
+      if satisfied:
+        assignments = preprocessor.extend(assignments)
+
+      self.statistics.simplification_time += simplification_time
+      self.statistics.total_time = time.perf_counter() - start_time
+
+      return satisfied, assignments
+
+    if self.decomposition != DecompositionType.NONE:
+      return self.solve_components(cnf, heuristic, engine, restart, reduce_interval, reduce_increment)
+
+    return self.run_engine(cnf, heuristic, engine, restart, reduce_interval, reduce_increment)
+
+  def run_engine(self, cnf: list, heuristic: HeuristicType, engine: EngineType, restart: RestartType, reduce_interval: int,
+                 reduce_increment: int) -> [bool, dict]:
+    """
+    Runs the engine on the CNF as it is, within the budget of the solve
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, or a ClauseStore holding them
+    heuristic : HeuristicType
+      an Enum value giving us an indication of the branching heuristic to use while running DPLL
+    engine : EngineType
+      an Enum value selecting the search engine
+    restart : RestartType
+      an Enum value selecting the restart policy of the CDCL engine
+    reduce_interval : int
+      number of conflicts before the CDCL engine first deletes the least useful half of its learned clauses
+    reduce_increment : int
+      growth of the number of conflicts between two reductions of the learned clauses
+
+    Returns
+    -------
+    [bool, dict]
+        returns true if a satisfiable solution to the CNF was found, or None if the budget ran out first,
+        along with the valid assignments
+    """
+    if engine in (EngineType.WATCHED_LITERALS, EngineType.CDCL):
+      if engine == EngineType.CDCL:
+        solver = CDCLSolver(restart, reduce_interval, reduce_increment, self.hooks, self.budget, self.pure_literals)
+      else:
+        solver = WatchedLiteralSolver(self.hooks, self.budget, self.pure_literals)
+
+      satisfied, assignments, self.backtracks, self.splits = solver.solve(cnf, heuristic)
+      self.conflicts = solver.conflicts
+      self.statistics = solver.statistics
+
+      if engine == EngineType.CDCL:
+        self.learned_clauses = solver.learned_clauses
+        self.live_learned_clauses = len(solver.database)
+        self.deleted_learned_clauses = solver.database.deleted
+        self.restarts = solver.restarts
+
+      return satisfied, assignments
+
+    if isinstance(cnf, ClauseStore):
+      cnf = cnf.to_lists(strings = True)
+
+    if engine == EngineType.ITERATIVE_DPLL:
+      satisfied, assignments = self.iterative_dpll(cnf, heuristic)
+    else:
+      satisfied, assignments = self.dpll(cnf, dict(), heuristic)
+
+    # every backtrack of the string literal engines is caused by an empty clause, but the last one has nowhere to go
+    if satisfied is False:
+      self.backtracks -= 1
+
+    self.update_statistics()
+
+    return satisfied, assignments
+
+  def solve_components(self, cnf: list, heuristic: HeuristicType, engine: EngineType, restart: RestartType,
+                       reduce_interval: int, reduce_increment: int) -> [bool, dict]:
+    """
+    Simplifies the root of the CNF, splits what is left into independent components and solves each of them on its own
+
+    Components are solved with the fewest clauses first, so a small unsatisfiable component ends the solve early.
+    Without workers, every component is solved in this process by a solver sharing the hooks and the budget of this
+    one. With workers, components are solved in a pool of processes, which do not invoke the hooks, each of them with
+    its own copy of the budget limited to the time left. Either way, the decision and conflict limits of the budget
+    apply to every component separately.
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, or a ClauseStore holding them
+    heuristic : HeuristicType
+      an Enum value giving us an indication of the branching heuristic to use while running DPLL
+    engine : EngineType
+      an Enum value selecting the search engine
+    restart : RestartType
+      an Enum value selecting the restart policy of the CDCL engine
+    reduce_interval : int
+      number of conflicts before the CDCL engine first deletes the least useful half of its learned clauses
+    reduce_increment : int
+      growth of the number of conflicts between two reductions of the learned clauses
+
+    Returns
+    -------
+    [bool, dict]
+        returns true if every component is satisfiable, or None if the budget ran out first,
+        along with the literals set at the root merged with the models of every component
+
+    See Also
+    --------
+    ComponentSplitter : class simplifying the root and finding the components
+    solve_component : function solving a single component in a worker process
+    """
+    if isinstance(cnf, ClauseStore):
+      cnf = cnf.to_lists(strings = engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL))
+
+    statistics = self.statistics
+    start_time = time.perf_counter()
+    splitter = ComponentSplitter(self.pure_literals != PureLiteralType.NONE)
+    cnf, assignments = splitter.simplify(cnf)
+    components = splitter.split(cnf) if cnf is not None else list()
+    statistics.propagations += splitter.propagations
+    statistics.pure_literals += splitter.pure_literals
+    statistics.simplification_time += time.perf_counter() - start_time
+
+    if cnf is None:
+      self.conflicts += 1
+      statistics.conflicts += 1
+      statistics.total_time = time.perf_counter() - self.start_time
+      return False, None
+
+    self.components = len(components)
+    self.largest_component = len(components[-1]) if len(components) != 0 else 0
+    settings = (heuristic, engine, restart, reduce_interval, reduce_increment, self.pure_literals, self.decomposition)
+
+    if self.workers is not None and len(components) > 1:
+      results = self.solve_components_in_parallel(components, settings)
+    else:
+      results = (self.solve_component((component, settings, self.budget), self.hooks) for component in components)
+
+    satisfied = True
+
+    for component_satisfied, component_assignments, solver in results:
+      self.backtracks += solver.backtracks
+      self.splits += solver.splits
+      self.conflicts += solver.conflicts
+      self.learned_clauses += solver.learned_clauses
+      self.live_learned_clauses += solver.live_learned_clauses
+      self.deleted_learned_clauses += solver.deleted_learned_clauses
+      self.restarts += solver.restarts
+      statistics.add(solver.statistics)
+
+      if not component_satisfied:
+        satisfied = component_satisfied
+        self.budget.reason = solver.budget.reason
+        break
+
+      assignments.update(component_assignments)
+
+    statistics.total_time = time.perf_counter() - self.start_time
+
+    if not satisfied:
+      return satisfied, None
+
+    return satisfied, assignments
+
+  def solve_components_in_parallel(self, components: list, settings: tuple):
+    """
+    Solves the components in a pool of worker processes, yielding the outcome of every component as soon as it is solved
+
+    The pool is terminated once the caller stops asking for outcomes, as it does after the first unsatisfiable one.
+
+    Parameters
+    ----------
+    components : list
+        the components of the CNF, each a list of clauses
+    settings : tuple
+        the heuristic, engine, restart policy, reduction interval and increment, pure literal and decomposition modes
+
+    Returns
+    -------
+    Iterator[tuple]
+        yields whether every component is satisfiable along with its model and the solver that solved it,
+        in the order they finish, and the outcome of an unknown component if the budget of this solve runs out first
+    """
+    budget = self.budget
+    time_limit = None
+
+    if budget.deadline is not None:
+      time_limit = budget.deadline - time.perf_counter()
+
+      if time_limit <= 0:
+        budget.exhausted(0, 0)
+        yield None, None, SATSolver(budget = budget)
+        return
+
+    # every worker gets its own budget, limited to the time left of this one
+    worker_budget = SolverBudget(time_limit, budget.decision_limit, budget.conflict_limit, budget.memory_limit)
+    tasks = [(component, settings, worker_budget) for component in components]
+
+    with multiprocessing.Pool(min(self.workers, len(tasks))) as pool:
+      results = pool.imap_unordered(SATSolver.solve_component, tasks)
+
+      for _ in tasks:
+        while True:
+          try:
+            result = results.next(timeout = POLL_INTERVAL)
+            break
+          except multiprocessing.TimeoutError:
+            # only the time, memory and interruption are checked here, decisions and conflicts are per component
+            if budget.exhausted(0, 0):
+              yield None, None, SATSolver(budget = budget)
+              return
+
+        yield result
+
+  @staticmethod
+  def solve_component(task: tuple, hooks: SolverHooks = None) -> [bool, dict, 'SATSolver']:
+    """
+    Solves a single component with a new solver, in this process or in a worker process
+
+    Parameters
+    ----------
+    task : tuple
+        the component, a list of clauses, along with the settings of the solve and its budget,
+        which is started if it is not running yet
+    hooks : SolverHooks
+        the callbacks to invoke while searching, None for no callbacks
+
+    Returns
+    -------
+    [bool, dict, SATSolver]
+        returns whether the component is satisfiable, or None if the budget ran out first, along with its model
+        and the solver holding its counters and statistics
+    """
+    component, (heuristic, engine, restart, reduce_interval, reduce_increment, pure_literals, decomposition), budget = task
+    solver = SATSolver(hooks, budget)
+    solver.pure_literals = pure_literals
+    solver.decomposition = decomposition
+    started = budget.start()
+
+    try:
+      satisfied, assignments = solver.run_engine(component, heuristic, engine, restart, reduce_interval, reduce_increment)
+    finally:
+      if started:
+        budget.stop()
+
+    return satisfied, assignments, solver
+
+  def interrupt(self) -> None:
+    """
+    Asks the running solve to stop as soon as possible, it then returns with an UNKNOWN status
+
+    Only sets a flag checked by the engines, so it is safe to call from another thread or from a signal handler.
+
+    Returns
+    -------
+    None
+    """
+    self.budget.interrupt()
+
+  def update_statistics(self) -> None:
+    """
+    Copies the counters of the string literal engines and the time elapsed since the start of the solve into the statistics
+
+    Returns
+    -------
+    None
+    """
+    statistics = self.statistics
+    statistics.decisions = self.splits
+    statistics.conflicts = self.conflicts
+    statistics.backtracks = self.backtracks
+    statistics.total_time = time.perf_counter() - self.start_time
+
   def dpll(self, cnf: list, assignments: dict, heuristic: HeuristicType) -> [bool, dict]:
     """
     Solves a boolean satisfiability problem represented in conjunctive normal form (CNF)
@@ -72,7 +644,8 @@ class SATSolver:
     Returns
     -------
     [bool, dict]
-        returns true if a satisfiable solution to the CNF was found along with a dictionary containing assignments
+        returns true if a satisfiable solution to the CNF was found, or None if the budget ran out,
+        along with a dictionary containing assignments
 
     See Also
     --------
@@ -80,42 +653,333 @@ class SATSolver:
     next_unit_literal : function implementing the logic to find the next unit literal for unit propagation
     transform : function implementing the logic to transform the CNF
     """
+    if self.budget.exhausted(self.splits, self.conflicts):
+      return None, None
+
+    statistics = self.statistics
+    start_time = time.perf_counter()
     literal = self.next_unit_literal(cnf)
 
     # implement unit propagation
     while literal is not None:
+      statistics.propagations += 1
       cnf, assignments = self.transform(literal, deepcopy(cnf), deepcopy(assignments))
       literal = self.next_unit_literal(cnf)
 
-    # assign pure literals appropriate values
-    cnf, assignments = self.eliminate_pure_literals(cnf, deepcopy(assignments))
+    statistics.propagation_time += time.perf_counter() - start_time
+
+    # assign pure literals appropriate values, before the first decision only when limited to the root
+    if self.pure_literals == PureLiteralType.ALL or (self.pure_literals == PureLiteralType.ROOT and self.splits == 0):
+      start_time = time.perf_counter()
+      cnf, assignments = self.eliminate_pure_literals(cnf, deepcopy(assignments))
+      statistics.simplification_time += time.perf_counter() - start_time
 
     # check for presence of empty clause
     if [] in cnf:
       self.backtracks += 1
+      self.conflicts += 1
+
+      if self.hooks is not None:
+        self.update_statistics()
+        self.hooks.conflict(None, statistics)
       return False, None
 
     # check if all clauses are satisfied
     if len(cnf) == 0:
       return True, assignments
 
+    # solve the components of the CNF one after the other, so a conflict in one of them never undoes decisions in another
+    if self.decomposition == DecompositionType.ALL:
+      start_time = time.perf_counter()
+      components = ComponentSplitter().split(cnf)
+      statistics.simplification_time += time.perf_counter() - start_time
+
+      if len(components) > 1:
+        for component in components:
+          satisfied, component_assignments = self.dpll(component, dict(), heuristic)
+
+          if not satisfied:
+            return satisfied, None
+
+          assignments.update(component_assignments)
+
+        return True, assignments
+
     # At this point, we have gone through the list of all available unit literals in the current version of the CNF
     # This means that we now need to pick the next literal from clauses with two or more unassigned literals
     self.splits += 1
-    literal = self.next_literal(deepcopy(cnf), heuristic)
+    start_time = time.perf_counter()
+    literal = self.next_literal(cnf, heuristic)
+    statistics.branching_time += time.perf_counter() - start_time
+
+    if self.hooks is not None:
+      self.update_statistics()
+      self.hooks.decision(literal, statistics)
+
     new_cnf, new_assignments = self.transform(literal, deepcopy(cnf), deepcopy(assignments))
     result_satisfiable, result_assignments = self.dpll(deepcopy(new_cnf), deepcopy(new_assignments), heuristic)
 
-    if not result_satisfiable:
+    if result_satisfiable is False:
       negation = self.get_negation(literal)
       new_cnf, new_assignments = self.transform(negation, deepcopy(cnf), deepcopy(assignments))
       return self.dpll(deepcopy(new_cnf), deepcopy(new_assignments), heuristic)
 
     return result_satisfiable, result_assignments
 
+  def iterative_dpll(self, cnf: list, heuristic: HeuristicType) -> [bool, dict]:
+    """
+    Solves a boolean satisfiability problem represented in conjunctive normal form (CNF) without recursion
+
+    Runs exactly the same search as dpll, so the number of backtracks and splits are identical, but the CNF
+    is copied once instead of at every node. Clauses are removed by marking them inactive and literals are removed
+    in place, and every change is recorded on an undo trail. Each decision stores the position of the undo and
+    assignment trails, so backtracking restores the parent node by replaying the undo trail down to that position.
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF
+    heuristic : HeuristicType
+        an Enum value giving us an indication of the branching heuristic to use while running DPLL
+
+    Returns
+    -------
+    [bool, dict]
+        returns true if a satisfiable solution to the CNF was found, or None if the budget ran out,
+        along with a dictionary containing assignments
+
+    See Also
+    --------
+    dpll : function implementing the recursive version of the same search
+    apply_literal : function applying a literal to the CNF while recording the changes on the undo trail
+    undo_changes : function reverting the changes on the undo trail
+    """
+    clauses = [list(clause) for clause in cnf]
+    active = [True] * len(clauses)
+    changes = list()
+    assigned = list()
+    # the occurrence counts are only kept up to date when pure literals are looked for after every decision
+    counts = PolarityCounts(clauses) if self.pure_literals == PureLiteralType.ALL else None
+
+    # every entry holds the undo and assignment trail lengths before the decision, the literal and whether it was flipped
+    decisions = list()
+
+    statistics = self.statistics
+    hooks = self.hooks
+    budget = self.budget
+
+    while True:
+      if budget.exhausted(self.splits, self.conflicts):
+        return None, None
+
+      start_time = time.perf_counter()
+      view = self.active_clauses(clauses, active)
+      literal = self.next_unit_literal(view)
+
+      # implement unit propagation
+      while literal is not None:
+        statistics.propagations += 1
+        assigned.append(literal)
+        self.apply_literal(literal, clauses, active, changes, counts)
+        view = self.active_clauses(clauses, active)
+        literal = self.next_unit_literal(view)
+
+      statistics.propagation_time += time.perf_counter() - start_time
+
+      # assign pure literals appropriate values, before the first decision only when limited to the root
+      start_time = time.perf_counter()
+
+      if counts is not None:
+        pure_literals = counts.pure_literals()
+      elif self.pure_literals == PureLiteralType.ROOT and self.splits == 0:
+        pure_literals = self.get_pure_literals(view)
+      else:
+        pure_literals = list()
+
+      if len(pure_literals) != 0:
+        statistics.pure_literals += len(pure_literals)
+        assigned.extend(pure_literals)
+        pure = set(pure_literals)
+
+        for index, clause in enumerate(clauses):
+          if active[index] and not pure.isdisjoint(clause):
+            self.remove_clause(index, clauses, active, changes, counts)
+
+        view = self.active_clauses(clauses, active)
+
+      statistics.simplification_time += time.perf_counter() - start_time
+
+      # check for presence of empty clause, and go back to the last decision whose negation was not tried yet
+      if [] in view:
+        self.backtracks += 1
+        self.conflicts += 1
+
+        if hooks is not None:
+          self.update_statistics()
+          hooks.conflict(None, statistics)
+
+        while len(decisions) != 0 and decisions[-1][3]:
+          decisions.pop()
+
+        if len(decisions) == 0:
+          return False, None
+
+        decision = decisions[-1]
+        decision[3] = True
+        self.undo_changes(decision[0], clauses, active, changes, counts)
+        del assigned[decision[1]:]
+
+        negation = self.get_negation(decision[2])
+        assigned.append(negation)
+        self.apply_literal(negation, clauses, active, changes, counts)
+        continue
+
+      # check if all clauses are satisfied
+      if len(view) == 0:
+        return True, dict.fromkeys(assigned, True)
+
+      self.splits += 1
+      start_time = time.perf_counter()
+      literal = self.next_literal(view, heuristic)
+      statistics.branching_time += time.perf_counter() - start_time
+
+      if hooks is not None:
+        self.update_statistics()
+        hooks.decision(literal, statistics)
+
+      decisions.append([len(changes), len(assigned), literal, False])
+      assigned.append(literal)
+      self.apply_literal(literal, clauses, active, changes, counts)
+
+  def active_clauses(self, clauses: list, active: list) -> list:
+    """
+    Returns the clauses that are still part of the CNF, in their original order
+
+    Parameters
+    ----------
+    clauses : list
+        every clause of the CNF, including the ones removed from it
+    active : list
+        a flag for each clause telling whether it is still part of the CNF
+
+    Returns
+    -------
+    list
+        returns the current CNF as a list of clauses
+    """
+    return [clause for index, clause in enumerate(clauses) if active[index]]
+
+  def apply_literal(self, literal: str, clauses: list, active: list, changes: list, counts: PolarityCounts = None) -> None:
+    """
+    Removes the clauses containing the literal and the negation of the literal from the remaining clauses
+
+    This is the in place equivalent of transform. Removed clauses are recorded on the undo trail as
+    (index, None, None), removed literals as (index, position, literal).
+
+    Parameters
+    ----------
+    literal : str
+        the literal set to True
+    clauses : list
+        every clause of the CNF, including the ones removed from it
+    active : list
+        a flag for each clause telling whether it is still part of the CNF
+    changes : list
+        the undo trail
+    counts : PolarityCounts
+        the occurrence counts of the literals left in the CNF, None if they are not kept
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    transform : function implementing the same logic on a copy of the CNF
+    """
+    negation = self.get_negation(literal)
+
+    for index, clause in enumerate(clauses):
+      if not active[index]:
+        continue
+
+      if literal in clause:
+        self.remove_clause(index, clauses, active, changes, counts)
+      elif negation in clause:
+        position = clause.index(negation)
+        del clause[position]
+        changes.append((index, position, negation))
+
+        if counts is not None:
+          counts.remove(negation)
+
+  def remove_clause(self, index: int, clauses: list, active: list, changes: list, counts: PolarityCounts = None) -> None:
+    """
+    Marks a satisfied clause inactive, recording it on the undo trail
+
+    Parameters
+    ----------
+    index : int
+        the index of the clause
+    clauses : list
+        every clause of the CNF, including the ones removed from it
+    active : list
+        a flag for each clause telling whether it is still part of the CNF
+    changes : list
+        the undo trail
+    counts : PolarityCounts
+        the occurrence counts of the literals left in the CNF, None if they are not kept
+
+    Returns
+    -------
+    None
+    """
+    active[index] = False
+    changes.append((index, None, None))
+
+    if counts is not None:
+      for literal in clauses[index]:
+        counts.remove(literal)
+
+  def undo_changes(self, mark: int, clauses: list, active: list, changes: list, counts: PolarityCounts = None) -> None:
+    """
+    Reverts every change recorded on the undo trail after the given position, most recent first
+
+    Parameters
+    ----------
+    mark : int
+        length of the undo trail to go back to
+    clauses : list
+        every clause of the CNF, including the ones removed from it
+    active : list
+        a flag for each clause telling whether it is still part of the CNF
+    changes : list
+        the undo trail
+    counts : PolarityCounts
+        the occurrence counts of the literals left in the CNF, None if they are not kept
+
+    Returns
+    -------
+    None
+    """
+    while len(changes) > mark:
+      index, position, literal = changes.pop()
+
+      if position is None:
+        active[index] = True
+
+        if counts is not None:
+          for restored in clauses[index]:
+            counts.add(restored)
+      else:
+        clauses[index].insert(position, literal)
+
+        if counts is not None:
+          counts.add(literal)
+
   def eliminate_pure_literals(self, cnf: list, assignments: dict) -> [bool, dict]:
     """
-    Deletes any clause in the CNF that contains a pure literal
+    Deletes any clause in the CNF that contains a pure literal, in a single pass over the CNF
 
     Parameters
     ----------
@@ -135,15 +999,17 @@ class SATSolver:
     next_literal : function implementing the logic to find the next literal to branch on
     """
     pure_literals = self.get_pure_literals(cnf)
+    self.statistics.pure_literals += len(pure_literals)
+
+    if len(pure_literals) == 0:
+      return cnf, assignments
 
     for literal in pure_literals:
-        assignments[literal] = True
+      assignments[literal] = True
 
-        for clause in copy(cnf):
-          if literal in clause:
-            cnf.remove(clause)
+    pure = set(pure_literals)
 
-    return cnf, assignments
+    return [clause for clause in cnf if pure.isdisjoint(clause)], assignments
 
   def transform(self, literal: str, cnf: list,  assignments: dict) -> [list, dict]:
     """
@@ -212,6 +1078,10 @@ class SATSolver:
       return self.random_literal(cnf)
     elif heuristic == HeuristicType.MAX_OCCURRENCES_MIN_SIZE:
       return self.max_occurences_minimal_size_literal(cnf)
+    elif heuristic in (HeuristicType.JEROSLOW_WANG, HeuristicType.JEROSLOW_WANG_TWO_SIDED):
+      return self.jeroslow_wang_literal(cnf, heuristic == HeuristicType.JEROSLOW_WANG_TWO_SIDED)
+    elif heuristic == HeuristicType.DYNAMIC_LARGEST_INDIVIDUAL_SUM:
+      return self.largest_individual_sum_literal(cnf)
 
     return cnf[0][0]
 
@@ -237,7 +1107,7 @@ class SATSolver:
     minimal_clause_size = None
     literals = list()
 
-    for clause in copy(cnf):
+    for clause in cnf:
       if minimal_clause_size is None:
         minimal_clause_size = len(clause)
 
@@ -264,11 +1134,77 @@ class SATSolver:
 
     return max_occurring
 
+  def jeroslow_wang_literal(self, cnf: list, two_sided: bool = False) -> str:
+    """
+    Returns the literal with the highest Jeroslow-Wang weight, the sum of 2 ** -size over the clauses it occurs in
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF
+    two_sided : bool
+        pick the variable with the highest weight summed over both of its literals, then its literal with the
+        highest weight
+
+    Returns
+    -------
+    str
+        returns the literal to branch on
+
+    See Also
+    --------
+    next_literal : function fetching the next literal based on the heuristc type supplied to it
+    """
+    weights = dict()
+
+    for clause in cnf:
+      weight = 2.0 ** -len(clause)
+
+      for literal in clause:
+        weights[literal] = weights.get(literal, 0.0) + weight
+
+    if not two_sided:
+      return max(weights, key = weights.get)
+
+    combined = lambda literal: weights[literal] + weights.get(self.get_negation(literal), 0.0)
+    literal = max(weights, key = combined)
+    negation = self.get_negation(literal)
+
+    return literal if weights[literal] >= weights.get(negation, 0.0) else negation
+
+  def largest_individual_sum_literal(self, cnf: list) -> str:
+    """
+    Returns the literal occurring in the most clauses (DLIS)
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF
+
+    Returns
+    -------
+    str
+        returns the literal to branch on
+
+    See Also
+    --------
+    next_literal : function fetching the next literal based on the heuristc type supplied to it
+    """
+    counts = dict()
+
+    for clause in cnf:
+      for literal in clause:
+        counts[literal] = counts.get(literal, 0) + 1
+
+    return max(counts, key = counts.get)
 
   def random_literal(self, cnf: list) -> str:
     """
     Returns a randomly selected literal from the current CNF
 
+    Every occurrence of a literal is equally likely, the position of the occurrence is drawn first so the clauses
+    never need to be flattened into a single list.
+
     Parameters
     ----------
     cnf : list
@@ -284,13 +1220,19 @@ class SATSolver:
     next_literal : function fetching the next literal based on the heuristc type supplied to it
     dpll : function implementing Davis-Putnam-Logemann-Loveland (DPLL) algorithm
     """
-    literals = [literal for clause in cnf for literal in clause]
+    position = randrange(sum(len(clause) for clause in cnf))
 
-    return choice(literals)
+    for clause in cnf:
+      if position < len(clause):
+        return clause[position]
+
+      position -= len(clause)
 
   def get_pure_literals(self, cnf: list) -> list:
     """
-    Returns a list containing all literals that occur either only positively or negatively is calculated.
+    Returns a list containing all literals that occur either only positively or only negatively in the CNF
+
+    Every literal of the CNF is counted once, so this takes time linear in the size of the CNF.
 
     Parameters
     ----------
@@ -305,22 +1247,9 @@ class SATSolver:
     See Also
     --------
     eliminate_pure_literals : function implementing the logic to eliminate pure literals from the CNF
+    PolarityCounts : class counting the occurrences of every literal
     """
-    pure = []
-    impure = []
-
-    for clause in cnf:
-      for literal in clause:
-        if literal in impure:
-          continue
-
-        if literal not in pure:
-          pure.append(literal)
-        else:
-          pure.remove(literal)
-          impure.append(literal)
-
-    return pure
+    return PolarityCounts(cnf).pure_literals()
 
   def next_unit_literal(self, cnf: list) -> str:
     """
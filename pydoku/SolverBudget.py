@@ -0,0 +1,170 @@
+"""
+Class limiting how long a solve may run, after which the solver gives up and reports an UNKNOWN status.
+
+A budget can limit the wall-clock time, the number of decisions and conflicts, and the resident set size (RSS) of the
+process. The engines check the budget on every decision and conflict, so a solve stops within one step of the search
+once any limit is reached. The memory usage is only sampled every MEMORY_CHECK_INTERVAL seconds since reading it costs
+a system call.
+
+A solve can also be stopped from outside with interrupt, which only sets a flag the engines check cooperatively and
+is therefore safe to call from another thread or from a signal handler.
+
+The budget covers everything between start and stop. Starting a budget that is already running does nothing, so
+when a SATSolver hands its budget to an engine, preprocessing and search share the same limits.
+"""
+
+import sys
+import time
+
+try:
+  import resource
+except ImportError:
+  resource = None
+
+MEMORY_CHECK_INTERVAL = 0.1
+
+REASON_INTERRUPTED = 'interrupted'
+REASON_TIME = 'time'
+REASON_DECISIONS = 'decisions'
+REASON_CONFLICTS = 'conflicts'
+REASON_MEMORY = 'memory'
+
+class SolverBudget:
+
+  def __init__(self, time_limit: float = None, decision_limit: int = None, conflict_limit: int = None, memory_limit: int = None):
+    """
+    Parameters
+    ----------
+    time_limit : float
+        number of seconds a solve may run, None for no limit
+    decision_limit : int
+        number of decisions a solve may make, None for no limit
+    conflict_limit : int
+        number of conflicts a solve may run into, None for no limit
+    memory_limit : int
+        number of bytes the RSS of the process may reach, None for no limit
+    """
+    for limit in (time_limit, decision_limit, conflict_limit, memory_limit):
+      if limit is not None and limit <= 0:
+        raise TypeError('Invalid budget provided as input.')
+
+    self.time_limit = time_limit
+    self.decision_limit = decision_limit
+    self.conflict_limit = conflict_limit
+    self.memory_limit = memory_limit
+    self.running = False
+    self.interrupted = False
+    self.reason = None
+    self.deadline = None
+    self.decisions = 0
+    self.conflicts = 0
+    self.next_memory_check = 0.0
+
+  def start(self, decisions: int = 0, conflicts: int = 0) -> bool:
+    """
+    Starts the budget of a new solve, clearing any earlier interruption, unless it is already running
+
+    Parameters
+    ----------
+    decisions : int
+        number of decisions the engine already made, which do not count against this solve
+    conflicts : int
+        number of conflicts the engine already ran into, which do not count against this solve
+
+    Returns
+    -------
+    bool
+        returns true if the budget was started, in which case the caller must stop it once the solve is over
+    """
+    if self.running:
+      return False
+
+    now = time.perf_counter()
+    self.running = True
+    self.interrupted = False
+    self.reason = None
+    self.deadline = now + self.time_limit if self.time_limit is not None else None
+    self.decisions = decisions
+    self.conflicts = conflicts
+    self.next_memory_check = now
+
+    return True
+
+  def stop(self) -> None:
+    """
+    Stops the budget once the solve that started it is over
+
+    Returns
+    -------
+    None
+    """
+    self.running = False
+
+  def interrupt(self) -> None:
+    """
+    Asks the running solve to stop at its next decision or conflict
+
+    Returns
+    -------
+    None
+    """
+    self.interrupted = True
+
+  def exhausted(self, decisions: int, conflicts: int) -> bool:
+    """
+    Checks every limit of the budget, recording the first one reached as the reason
+
+    Parameters
+    ----------
+    decisions : int
+        number of decisions made by the engine so far
+    conflicts : int
+        number of conflicts the engine ran into so far
+
+    Returns
+    -------
+    bool
+        returns true if the solve must stop
+    """
+    if self.interrupted:
+      self.reason = REASON_INTERRUPTED
+    elif self.decision_limit is not None and decisions - self.decisions >= self.decision_limit:
+      self.reason = REASON_DECISIONS
+    elif self.conflict_limit is not None and conflicts - self.conflicts >= self.conflict_limit:
+      self.reason = REASON_CONFLICTS
+    elif self.deadline is not None or self.memory_limit is not None:
+      now = time.perf_counter()
+
+      if self.deadline is not None and now >= self.deadline:
+        self.reason = REASON_TIME
+      elif self.memory_limit is not None and now >= self.next_memory_check:
+        self.next_memory_check = now + MEMORY_CHECK_INTERVAL
+
+        if SolverBudget.memory_usage() >= self.memory_limit:
+          self.reason = REASON_MEMORY
+
+    return self.reason is not None
+
+  @staticmethod
+  def memory_usage() -> int:
+    """
+    Returns the resident set size of the current process
+
+    Returns
+    -------
+    int
+        returns the current RSS in bytes where the platform reports it, otherwise the peak RSS, or 0 if neither is known
+    """
+    try:
+      with open('/proc/self/statm', 'r') as file:
+        return int(file.read().split()[1]) * resource.getpagesize()
+    except (OSError, AttributeError):
+      pass
+
+    if resource is None:
+      return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes and macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
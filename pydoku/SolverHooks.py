@@ -0,0 +1,119 @@
+"""
+Class holding the optional callbacks a solver invokes while searching, to trace or monitor a solve.
+
+Every callback is optional and receives the SolverStatistics of the solve, up to date at the time of the call:
+  - on_decision(literal, statistics) after every decision, with the literal decided
+  - on_conflict(clause, statistics) after every conflict, with the falsified clause, or None for the string literal
+    engines which remove falsified literals from their clauses
+  - on_restart(statistics) after every restart of the CDCL engine
+  - on_progress(statistics) at most once every progress_interval seconds, checked on every decision and conflict
+
+Callbacks run inside the search, so they should return quickly.
+"""
+
+import time
+
+class SolverHooks:
+
+  def __init__(self, on_decision = None, on_conflict = None, on_restart = None, on_progress = None, progress_interval: float = 1.0):
+    """
+    Parameters
+    ----------
+    on_decision : callable
+        called with the literal decided and the statistics after every decision
+    on_conflict : callable
+        called with the falsified clause and the statistics after every conflict
+    on_restart : callable
+        called with the statistics after every restart
+    on_progress : callable
+        called with the statistics periodically
+    progress_interval : float
+        minimal number of seconds between two calls to on_progress
+    """
+    if progress_interval <= 0:
+      raise TypeError('Invalid progress interval provided as input.')
+
+    self.on_decision = on_decision
+    self.on_conflict = on_conflict
+    self.on_restart = on_restart
+    self.on_progress = on_progress
+    self.progress_interval = progress_interval
+    self.last_progress = time.perf_counter()
+
+  def decision(self, literal, statistics) -> None:
+    """
+    Invokes the decision callback, and the progress callback if it is due
+
+    Parameters
+    ----------
+    literal : int or str
+        the literal decided
+    statistics : SolverStatistics
+        the statistics of the solve
+
+    Returns
+    -------
+    None
+    """
+    if self.on_decision is not None:
+      self.on_decision(literal, statistics)
+
+    self.progress(statistics)
+
+  def conflict(self, clause: list, statistics) -> None:
+    """
+    Invokes the conflict callback, and the progress callback if it is due
+
+    Parameters
+    ----------
+    clause : list
+        the falsified clause, or None if it is not known
+    statistics : SolverStatistics
+        the statistics of the solve
+
+    Returns
+    -------
+    None
+    """
+    if self.on_conflict is not None:
+      self.on_conflict(clause, statistics)
+
+    self.progress(statistics)
+
+  def restart(self, statistics) -> None:
+    """
+    Invokes the restart callback
+
+    Parameters
+    ----------
+    statistics : SolverStatistics
+        the statistics of the solve
+
+    Returns
+    -------
+    None
+    """
+    if self.on_restart is not None:
+      self.on_restart(statistics)
+
+  def progress(self, statistics) -> None:
+    """
+    Invokes the progress callback if at least progress_interval seconds went by since the last call
+
+    Parameters
+    ----------
+    statistics : SolverStatistics
+        the statistics of the solve
+
+    Returns
+    -------
+    None
+    """
+    if self.on_progress is None:
+      return
+
+    now = time.perf_counter()
+
+    if now - self.last_progress >= self.progress_interval:
+      self.last_progress = now
+      self.on_progress(statistics)
@@ -0,0 +1,714 @@
+"""
+Class running the solver as a long-lived service, answering requests over a Unix socket or HTTP on localhost.
+
+Solving a small CNF from the command line mostly pays for starting the interpreter, importing the CLI and parsing the
+rule files again. The server pays those costs once: its worker processes start with every rule base already loaded
+into an IncrementalSolver, and stay up between requests, so a request only carries the clauses specific to it, such
+as the givens of a puzzle, and learned clauses carry over from one request to the next.
+
+Requests are JSON objects holding either a CNF in DIMACS format or a Sudoku puzzle:
+
+  {"dimacs": "p cnf 3 2\\n1 -3 0\\n2 3 -1 0\\n", "heuristic": 4, "engine": "cdcl", "timeout": 5}
+  {"dimacs": "168 0\\n175 0\\n...", "rules": "pydoku/test_files/9x9/rules.txt"}
+  {"sudoku": "...3..4114..3..."}
+
+A CNF naming a rule base is solved along with the rules loaded by the server under that name: its unit clauses are
+assumed and its other clauses only hold for that request. Sudoku puzzles are solved against the rules of their board,
+which every worker generates once per board size. Any other CNF is solved from scratch by a SATSolver with the given
+heuristic and engine. Every request can give a time limit, which the time limit of the server caps.
+
+The answer is a JSON object with the status of the request, SAT, UNSAT, UNKNOWN, ERROR or BUSY, the literals set to
+True by the model or the solution of the puzzle, and the statistics of the search. Over the Unix socket, requests and
+answers are single lines, and a connection can send any number of requests one after the other. Over HTTP, requests
+are POSTed to /solve.
+
+An asyncio event loop reads the requests and hands them to a pool of worker processes, so slow searches never hold up
+the other connections. At most queue_size requests are queued or being solved at once: any request beyond that is
+answered BUSY straight away, with a 503 status over HTTP, so clients back off instead of piling up work the server
+cannot keep up with.
+"""
+
+import asyncio
+import errno
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import tempfile
+import time
+from pydoku.BatchSolver import STATUS_SATISFIABLE, STATUS_UNSATISFIABLE, STATUS_UNKNOWN, STATUS_ERROR
+from pydoku.DIMACSError import DIMACSError
+from pydoku.EngineType import EngineType
+from pydoku.FileHandler import FileHandler
+from pydoku.HeuristicType import HeuristicType
+from pydoku.IncrementalSolver import IncrementalSolver
+from pydoku.SATSolver import SATSolver
+from pydoku.SolverBudget import SolverBudget
+from pydoku.Sudoku import Sudoku
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'pydoku.sock')
+HOST = '127.0.0.1'
+
+# largest request accepted, which also bounds the line a Unix socket client may send
+MAX_REQUEST_SIZE = 64 << 20
+
+STATUS_BUSY = 'BUSY'
+
+ENGINE_NAMES = {
+  'dpll': EngineType.RECURSIVE_DPLL,
+  'iterative': EngineType.ITERATIVE_DPLL,
+  'watched': EngineType.WATCHED_LITERALS,
+  'cdcl': EngineType.CDCL
+}
+
+HTTP_CODES = {
+  STATUS_ERROR: 400,
+  STATUS_BUSY: 503
+}
+
+HTTP_REASONS = {
+  200: 'OK',
+  400: 'Bad Request',
+  404: 'Not Found',
+  405: 'Method Not Allowed',
+  413: 'Payload Too Large',
+  503: 'Service Unavailable'
+}
+
+class SolverServer:
+
+  # rule bases of the worker process, mapping every name to an IncrementalSolver and the number of variables of the rules
+  rule_bases = dict()
+
+  # rules of every Sudoku board the worker process solved a puzzle on, by box size
+  boards = dict()
+
+  def __init__(self, path: str = None, port: int = None, workers: int = None, queue_size: int = None, rules: list = None,
+               timeout: float = None):
+    """
+    Parameters
+    ----------
+    path : str
+        path of the Unix socket to listen on, defaults to pydoku.sock in the temporary directory unless a port is given
+    port : int
+        port to listen on for HTTP requests on localhost, None to listen on the Unix socket
+    workers : int
+        number of worker processes, defaults to the number of CPUs
+    queue_size : int
+        number of requests that may be queued or solved at once before new ones are answered BUSY,
+        defaults to four per worker
+    rules : list
+        paths of the DIMACS files to load as rule bases, each named after its path
+    timeout : float
+        time limit of every request in seconds, None for no limit
+
+    Raises
+    ------
+    DIMACSError
+        if a rule file does not define a valid CNF
+    """
+    if path is not None and port is not None:
+      raise TypeError('Invalid address provided as input.')
+
+    if port is not None and (not isinstance(port, int) or not 0 < port < 65536):
+      raise TypeError('Invalid port provided as input.')
+
+    if workers is not None and workers < 1:
+      raise TypeError('Invalid number of workers provided as input.')
+
+    if queue_size is not None and queue_size < 1:
+      raise TypeError('Invalid queue size provided as input.')
+
+    if timeout is not None and timeout <= 0:
+      raise TypeError('Invalid timeout provided as input.')
+
+    self.path = path if path is not None or port is not None else DEFAULT_SOCKET_PATH
+    self.port = port
+    self.workers = workers or os.cpu_count() or 1
+    self.queue_size = queue_size or 4 * self.workers
+    self.timeout = timeout
+    self.pending = 0
+    self.requests = 0
+    self.rejected = 0
+    self.pool = None
+    self.stopping = None
+
+    # the rules are parsed once here, so a broken file is reported before any worker starts
+    self.rules = {name: FileHandler.parse(name, integers = True) for name in dict.fromkeys(rules or list())}
+
+  @property
+  def address(self) -> str:
+    """
+    Returns the address the server listens on
+
+    Returns
+    -------
+    str
+        returns the path of the Unix socket, or the URL requests are POSTed to
+    """
+    return self.path if self.port is None else f'http://{HOST}:{self.port}/solve'
+
+  def run(self) -> None:
+    """
+    Serves requests until the process receives SIGINT or SIGTERM
+
+    Returns
+    -------
+    None
+    """
+    asyncio.run(self.serve())
+
+  async def serve(self) -> None:
+    """
+    Starts the worker pool and listens for requests until stopped, then removes the Unix socket
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    handle_stream : function answering the requests of a Unix socket connection
+    handle_http : function answering the requests of an HTTP connection
+    """
+    loop = asyncio.get_running_loop()
+
+    # a socket left behind by a server that did not shut down cleanly is replaced, one still answering is not
+    if self.port is None and os.path.exists(self.path):
+      with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        if probe.connect_ex(self.path) == 0:
+          raise OSError(errno.EADDRINUSE, f'Another server is listening on {self.path}')
+
+      os.unlink(self.path)
+
+    if self.port is None:
+      server = await asyncio.start_unix_server(self.handle_stream, self.path, limit = MAX_REQUEST_SIZE)
+    else:
+      server = await asyncio.start_server(self.handle_http, HOST, self.port, limit = MAX_REQUEST_SIZE)
+
+    self.stopping = asyncio.Event()
+    self.pool = multiprocessing.Pool(self.workers, SolverServer.initialize, (self.rules,))
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+      loop.add_signal_handler(signum, self.stopping.set)
+
+    try:
+      async with server:
+        await self.stopping.wait()
+    finally:
+      for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.remove_signal_handler(signum)
+
+      # requests still being solved are dropped along with their connections
+      self.pool.terminate()
+      self.pool.join()
+
+      if self.port is None and os.path.exists(self.path):
+        os.unlink(self.path)
+
+  def stop(self) -> None:
+    """
+    Asks a running server to stop, from the thread running its event loop
+
+    Returns
+    -------
+    None
+    """
+    if self.stopping is not None:
+      self.stopping.set()
+
+  async def handle_stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Answers the requests sent over a Unix socket connection, one JSON object per line, in the order they come in
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+        the stream the requests are read from
+    writer : asyncio.StreamWriter
+        the stream the answers are written to
+
+    Returns
+    -------
+    None
+    """
+    try:
+      while True:
+        line = await reader.readline()
+
+        if len(line) == 0:
+          break
+
+        if line.strip() == b'':
+          continue
+
+        answer = await self.answer(line)
+        writer.write(json.dumps(answer).encode() + b'\n')
+        await writer.drain()
+    except (ConnectionError, ValueError):
+      # the client went away, or sent a line longer than MAX_REQUEST_SIZE
+      pass
+    finally:
+      writer.close()
+
+  async def handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Answers the HTTP/1.1 requests of a connection, keeping it open between requests unless the client closes it
+
+    Parameters
+    ----------
+    reader : asyncio.StreamReader
+        the stream the requests are read from
+    writer : asyncio.StreamWriter
+        the stream the answers are written to
+
+    Returns
+    -------
+    None
+    """
+    try:
+      while True:
+        request_line = await reader.readline()
+
+        if len(request_line) == 0:
+          break
+
+        headers = dict()
+
+        while True:
+          line = await reader.readline()
+
+          if line.strip() == b'':
+            break
+
+          name, _, value = line.decode('latin-1').partition(':')
+          headers[name.strip().lower()] = value.strip()
+
+        parts = request_line.decode('latin-1').split()
+        length = headers.get('content-length', '0')
+        close = headers.get('connection', '').lower() == 'close' or parts[-1:] == ['HTTP/1.0']
+
+        if len(parts) != 3 or not length.isdigit():
+          code, answer, close = 400, {'status': STATUS_ERROR, 'error': 'Invalid HTTP request.'}, True
+        elif int(length) > MAX_REQUEST_SIZE:
+          code, answer, close = 413, {'status': STATUS_ERROR, 'error': 'Request too large.'}, True
+        else:
+          body = await reader.readexactly(int(length))
+
+          if parts[1] != '/solve':
+            code, answer = 404, {'status': STATUS_ERROR, 'error': f'No such path: {parts[1]}'}
+          elif parts[0] != 'POST':
+            code, answer = 405, {'status': STATUS_ERROR, 'error': 'Requests must be POSTed.'}
+          else:
+            answer = await self.answer(body)
+            code = HTTP_CODES.get(answer['status'], 200)
+
+        body = json.dumps(answer).encode()
+        head = f'HTTP/1.1 {code} {HTTP_REASONS[code]}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n'
+
+        if code == 503:
+          head += 'Retry-After: 1\r\n'
+
+        if close:
+          head += 'Connection: close\r\n'
+
+        writer.write(head.encode() + b'\r\n' + body)
+        await writer.drain()
+
+        if close:
+          break
+    except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+      pass
+    finally:
+      writer.close()
+
+  async def answer(self, request: bytes) -> dict:
+    """
+    Answers a single request, solving it in the worker pool unless it is invalid or the queue is full
+
+    Parameters
+    ----------
+    request : bytes
+        the JSON object of the request
+
+    Returns
+    -------
+    dict
+        returns the answer to send back
+    """
+    self.requests += 1
+
+    try:
+      job = self.read_job(request)
+    except (ValueError, TypeError) as exception:
+      return {'status': STATUS_ERROR, 'error': str(exception)}
+
+    if self.pending >= self.queue_size:
+      self.rejected += 1
+      return {'status': STATUS_BUSY, 'error': 'The server is busy, try again later.'}
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result):
+      if not future.done():
+        future.set_result(result)
+
+    def fail(exception):
+      settle({'status': STATUS_ERROR, 'error': str(exception) or type(exception).__name__})
+
+    self.pending += 1
+
+    try:
+      # the pool calls back from its own thread, which must hand the result over to the event loop
+      self.pool.apply_async(SolverServer.solve_job, (job,), callback = lambda result: loop.call_soon_threadsafe(settle, result),
+                            error_callback = lambda exception: loop.call_soon_threadsafe(fail, exception))
+
+      return await future
+    finally:
+      self.pending -= 1
+
+  def read_job(self, request: bytes) -> dict:
+    """
+    Checks a request and turns it into the job handed to a worker
+
+    Parameters
+    ----------
+    request : bytes
+        the JSON object of the request
+
+    Returns
+    -------
+    dict
+        returns the job, with every setting filled in
+
+    Raises
+    ------
+    ValueError
+        if the request is not a JSON object
+    TypeError
+        if the request does not hold a valid job
+    """
+    try:
+      request = json.loads(request)
+    except ValueError:
+      raise ValueError('Invalid request provided as input, it must be a JSON object.') from None
+
+    if not isinstance(request, dict):
+      raise TypeError('Invalid request provided as input, it must be a JSON object.')
+
+    dimacs = request.get('dimacs')
+    puzzle = request.get('sudoku')
+    rules = request.get('rules')
+    heuristic = request.get('heuristic', HeuristicType.VSIDS)
+    engine = request.get('engine')
+    timeout = request.get('timeout')
+
+    if (dimacs is None) == (puzzle is None) or not isinstance(dimacs if puzzle is None else puzzle, str):
+      raise TypeError('Invalid request provided as input, it must hold either a CNF or a Sudoku puzzle.')
+
+    if rules is not None and (puzzle is not None or rules not in self.rules):
+      raise TypeError('Invalid rule base provided as input.')
+
+    if not isinstance(heuristic, int) or heuristic not in list(HeuristicType):
+      raise TypeError('Invalid heuristic provided as input.')
+
+    heuristic = HeuristicType(heuristic)
+
+    if engine is not None and (dimacs is None or rules is not None or engine not in ENGINE_NAMES):
+      raise TypeError('Invalid engine provided as input.')
+
+    # the same defaults as the command line: VSIDS runs with the cdcl engine, any other heuristic with dpll
+    if engine is None:
+      engine = EngineType.CDCL if heuristic == HeuristicType.VSIDS else EngineType.RECURSIVE_DPLL
+    else:
+      engine = ENGINE_NAMES[engine]
+
+    if heuristic == HeuristicType.VSIDS and engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL):
+      raise TypeError('VSIDS is only supported by the watched and cdcl engines.')
+
+    if timeout is not None and (not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0):
+      raise TypeError('Invalid timeout provided as input.')
+
+    if self.timeout is not None:
+      timeout = min(timeout or self.timeout, self.timeout)
+
+    return {'dimacs': dimacs, 'sudoku': puzzle, 'rules': rules, 'heuristic': heuristic, 'engine': engine, 'timeout': timeout}
+
+  @staticmethod
+  def initialize(rules: dict) -> None:
+    """
+    Loads every rule base into an IncrementalSolver when a worker process starts, along with the rules of 9x9 boards
+
+    Parameters
+    ----------
+    rules : dict
+        the clauses of every rule base, by name
+
+    Returns
+    -------
+    None
+    """
+    # Ctrl-C reaches the whole process group, but only the server decides when its workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for name, cnf in rules.items():
+      solver = IncrementalSolver()
+      solver.add_clauses(cnf)
+      SolverServer.rule_bases[name] = solver, max((abs(literal) for clause in cnf for literal in clause), default = 0)
+
+    SolverServer.get_board(3)
+
+  @staticmethod
+  def get_board(box: int) -> IncrementalSolver:
+    """
+    Returns the IncrementalSolver holding the rules of a Sudoku board, generating them the first time
+
+    Parameters
+    ----------
+    box : int
+        the number of rows and columns of a box of the board
+
+    Returns
+    -------
+    IncrementalSolver
+        returns the solver of the board
+    """
+    solver = SolverServer.boards.get(box)
+
+    if solver is None:
+      solver = IncrementalSolver()
+      solver.add_clauses(Sudoku(box).rules())
+      SolverServer.boards[box] = solver
+
+    return solver
+
+  @staticmethod
+  def solve_job(job: dict) -> dict:
+    """
+    Solves a single job inside a worker process
+
+    Parameters
+    ----------
+    job : dict
+        the job, as returned by read_job
+
+    Returns
+    -------
+    dict
+        returns the answer to the request, with its status, the model or the solution if it is satisfiable,
+        the number of backtracks, splits and conflicts of the search, and its run time
+    """
+    start_time = time.perf_counter()
+    budget = SolverBudget(time_limit = job['timeout']) if job['timeout'] is not None else None
+
+    try:
+      if job['sudoku'] is not None:
+        answer = SolverServer.solve_sudoku(job['sudoku'], job['heuristic'], budget)
+      elif job['rules'] is not None:
+        answer = SolverServer.solve_with_rules(job['dimacs'], job['rules'], job['heuristic'], budget)
+      else:
+        answer = SolverServer.solve_dimacs(job['dimacs'], job['heuristic'], job['engine'], budget)
+    except (DIMACSError, TypeError) as exception:
+      answer = {'status': STATUS_ERROR, 'error': str(exception)}
+
+    answer['run_time'] = time.perf_counter() - start_time
+
+    return answer
+
+  @staticmethod
+  def solve_sudoku(puzzle: str, heuristic: HeuristicType, budget: SolverBudget) -> dict:
+    """
+    Solves a Sudoku puzzle against the rules of its board, assuming its givens
+
+    Parameters
+    ----------
+    puzzle : str
+        the symbols of every cell, row by row
+    heuristic : HeuristicType
+        the branching heuristic to search with
+    budget : SolverBudget
+        the limits of the search, None for no limits
+
+    Returns
+    -------
+    dict
+        returns the answer, holding the solution written as a puzzle if there is one
+    """
+    grid = Sudoku.parse(puzzle)
+    sudoku = Sudoku.for_grid(grid)
+    solver = SolverServer.get_board(sudoku.box)
+    answer = SolverServer.solve_incremental(solver, sudoku.givens(grid), heuristic, budget)
+
+    if answer['status'] == STATUS_SATISFIABLE:
+      answer['solution'] = Sudoku.format(sudoku.decode(answer.pop('assignments'), grid))
+
+    return answer
+
+  @staticmethod
+  def solve_with_rules(dimacs: str, name: str, heuristic: HeuristicType, budget: SolverBudget) -> dict:
+    """
+    Solves a CNF along with a rule base, assuming its unit clauses and adding its other clauses for this job only
+
+    The other clauses all hold the negation of a new selector variable, which is assumed True while solving and set to
+    False afterwards, so they no longer restrict later jobs.
+
+    Parameters
+    ----------
+    dimacs : str
+        the CNF in DIMACS format, over the variables of the rule base
+    name : str
+        the name of the rule base
+    heuristic : HeuristicType
+        the branching heuristic to search with
+    budget : SolverBudget
+        the limits of the search, None for no limits
+
+    Returns
+    -------
+    dict
+        returns the answer, holding the literals of the model over the variables of the rule base if there is one
+
+    Raises
+    ------
+    TypeError
+        if the CNF holds a variable the rule base does not
+    """
+    solver, variables = SolverServer.rule_bases[name]
+    cnf = FileHandler.parse_text(dimacs, integers = True)
+
+    # selectors of earlier jobs are allocated past the rules, so the CNF must stay within them
+    if any(abs(literal) > variables for clause in cnf for literal in clause):
+      raise TypeError('Invalid CNF provided as input, it holds variables the rule base does not.')
+
+    assumptions = [clause[0] for clause in cnf if len(clause) == 1]
+    clauses = [clause for clause in cnf if len(clause) > 1]
+    selector = None
+
+    if len(clauses) != 0:
+      selector = len(solver.activity)
+      solver.reserve(selector)
+      assumptions.insert(0, selector)
+
+      for clause in clauses:
+        solver.add_clause([-selector] + clause)
+
+    try:
+      answer = SolverServer.solve_incremental(solver, assumptions, heuristic, budget)
+    finally:
+      if selector is not None:
+        solver.add_clause([-selector])
+
+    if answer['status'] == STATUS_SATISFIABLE:
+      assignments = answer.pop('assignments')
+      answer['model'] = SolverServer.get_model({literal: value for literal, value in assignments.items() if abs(int(literal)) <= variables})
+
+    return answer
+
+  @staticmethod
+  def solve_incremental(solver: IncrementalSolver, assumptions: list, heuristic: HeuristicType, budget: SolverBudget) -> dict:
+    """
+    Solves the clauses of an IncrementalSolver under the given assumptions
+
+    Parameters
+    ----------
+    solver : IncrementalSolver
+        the solver holding the rules
+    assumptions : list
+        the integer literals that must be True in this job only
+    heuristic : HeuristicType
+        the branching heuristic to search with
+    budget : SolverBudget
+        the limits of the search, None for no limits
+
+    Returns
+    -------
+    dict
+        returns the answer, holding the assignments of the model if there is one
+    """
+    conflicts = solver.conflicts
+    solver.budget = budget
+    satisfied, assignments, backtracks, splits = solver.solve(assumptions, heuristic)
+    answer = SolverServer.get_answer(satisfied, backtracks, splits, solver.conflicts - conflicts)
+
+    if satisfied:
+      answer['assignments'] = assignments
+
+    return answer
+
+  @staticmethod
+  def solve_dimacs(dimacs: str, heuristic: HeuristicType, engine: EngineType, budget: SolverBudget) -> dict:
+    """
+    Solves a CNF from scratch with a SATSolver
+
+    Parameters
+    ----------
+    dimacs : str
+        the CNF in DIMACS format
+    heuristic : HeuristicType
+        the branching heuristic to search with
+    engine : EngineType
+        the search engine to run the heuristic with
+    budget : SolverBudget
+        the limits of the search, None for no limits
+
+    Returns
+    -------
+    dict
+        returns the answer, holding the literals of the model if there is one
+    """
+    cnf = FileHandler.parse_text(dimacs, integers = engine in (EngineType.WATCHED_LITERALS, EngineType.CDCL))
+    solver = SATSolver(budget = budget)
+    satisfied, assignments, backtracks, splits = solver.solve(cnf, heuristic, engine)
+    answer = SolverServer.get_answer(satisfied, backtracks, splits, solver.conflicts)
+
+    if satisfied:
+      answer['model'] = SolverServer.get_model(assignments)
+
+    return answer
+
+  @staticmethod
+  def get_answer(satisfied: bool, backtracks: int, splits: int, conflicts: int) -> dict:
+    """
+    Returns the answer to a job that was searched
+
+    Parameters
+    ----------
+    satisfied : bool
+        whether the search found a model, None if it ran out of budget first
+    backtracks : int
+        number of backtracks of the search
+    splits : int
+        number of splits of the search
+    conflicts : int
+        number of conflicts of the search
+
+    Returns
+    -------
+    dict
+        returns the status of the job along with the statistics of the search
+    """
+    if satisfied is None:
+      status = STATUS_UNKNOWN
+    else:
+      status = STATUS_SATISFIABLE if satisfied else STATUS_UNSATISFIABLE
+
+    return {'status': status, 'backtracks': backtracks, 'splits': splits, 'conflicts': conflicts}
+
+  @staticmethod
+  def get_model(assignments: dict) -> list:
+    """
+    Returns the literals set to True by a model, ordered by variable
+
+    Parameters
+    ----------
+    assignments : dict
+        a dictionary mapping the literals set to True, as strings or integers, to True
+
+    Returns
+    -------
+    list
+        returns the integer literals
+    """
+    return sorted((int(literal) for literal, value in assignments.items() if value is True), key = abs)
@@ -0,0 +1,120 @@
+"""
+Class collecting the statistics of a single solve: how much search work was done and where the time went.
+
+Counters cover the decisions, the literals implied by unit propagation, the conflicts, backtracks, restarts, learned
+clauses and the pure literals eliminated. Timers split the wall-clock time of the solve between propagation
+(unit propagation and applying decisions), branching (picking the next literal) and simplification (preprocessing
+and pure literal elimination). The remaining time is spent loading the CNF and, for the string literal engines,
+copying it.
+"""
+
+class SolverStatistics:
+
+  def __init__(self):
+    self.decisions = 0
+    self.propagations = 0
+    self.conflicts = 0
+    self.backtracks = 0
+    self.restarts = 0
+    self.learned_clauses = 0
+    self.pure_literals = 0
+    self.propagation_time = 0.0
+    self.branching_time = 0.0
+    self.simplification_time = 0.0
+    self.total_time = 0.0
+
+  @property
+  def propagations_per_second(self) -> float:
+    """
+    Returns the number of literals implied per second spent propagating
+
+    Returns
+    -------
+    float
+        returns the propagation rate, 0 if no time was spent propagating
+    """
+    return self.propagations / self.propagation_time if self.propagation_time > 0 else 0.0
+
+  @property
+  def other_time(self) -> float:
+    """
+    Returns the time spent outside propagation, branching and simplification
+
+    Returns
+    -------
+    float
+        returns the remaining time in seconds
+    """
+    return max(self.total_time - self.propagation_time - self.branching_time - self.simplification_time, 0.0)
+
+  def add(self, other: 'SolverStatistics') -> None:
+    """
+    Adds the counters and timers of another solve, except for its total time, to these statistics
+
+    Parameters
+    ----------
+    other : SolverStatistics
+        the statistics of a solve that was part of this one, such as the solve of one of its components
+
+    Returns
+    -------
+    None
+    """
+    self.decisions += other.decisions
+    self.propagations += other.propagations
+    self.conflicts += other.conflicts
+    self.backtracks += other.backtracks
+    self.restarts += other.restarts
+    self.learned_clauses += other.learned_clauses
+    self.pure_literals += other.pure_literals
+    self.propagation_time += other.propagation_time
+    self.branching_time += other.branching_time
+    self.simplification_time += other.simplification_time
+
+  def to_dict(self) -> dict:
+    """
+    Returns every counter and timer, along with the propagation rate, as a dictionary that can be stored as JSON
+
+    Returns
+    -------
+    dict
+        returns a dictionary mapping the name of every statistic to its value, times in seconds
+    """
+    return {
+      'decisions': self.decisions,
+      'propagations': self.propagations,
+      'conflicts': self.conflicts,
+      'backtracks': self.backtracks,
+      'restarts': self.restarts,
+      'learned_clauses': self.learned_clauses,
+      'pure_literals': self.pure_literals,
+      'propagations_per_second': self.propagations_per_second,
+      'propagation_time': self.propagation_time,
+      'branching_time': self.branching_time,
+      'simplification_time': self.simplification_time,
+      'other_time': self.other_time,
+      'total_time': self.total_time
+    }
+
+  def lines(self) -> list:
+    """
+    Returns the statistics as human readable lines
+
+    Returns
+    -------
+    list
+        returns a list of strings, one per group of statistics
+    """
+    total = self.total_time or 1.0
+
+    return [
+      f'Decisions: {self.decisions}',
+      f'Propagations: {self.propagations} ({self.propagations_per_second:,.0f} per second)',
+      f'Conflicts: {self.conflicts} ({self.backtracks} backtracks, {self.restarts} restarts, {self.learned_clauses} learned clauses)',
+      f'Pure literals eliminated: {self.pure_literals}',
+      f'Time: {self.total_time:.3f} seconds, '
+      f'propagation {self.propagation_time:.3f} ({self.propagation_time / total:.1%}), '
+      f'branching {self.branching_time:.3f} ({self.branching_time / total:.1%}), '
+      f'simplification {self.simplification_time:.3f} ({self.simplification_time / total:.1%}), '
+      f'other {self.other_time:.3f} ({self.other_time / total:.1%})'
+    ]
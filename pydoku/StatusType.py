@@ -0,0 +1,10 @@
+"""
+The class contains enums defining the possible outcomes of a solve
+"""
+from enum import IntEnum, unique
+
+@unique
+class StatusType(IntEnum):
+  SATISFIABLE = 1
+  UNSATISFIABLE = 2
+  UNKNOWN = 3
@@ -0,0 +1,384 @@
+"""
+Class encoding Sudoku puzzles of any size as CNFs and decoding models back into grids.
+
+A board with boxes of b x b cells has n = b * b rows, columns and values. Every (row, column, value) triple gets its
+own variable (row * n + column) * n + value, with rows and columns counted from 0 and values from 1, so the n ** 3
+variables never collide whatever the size of the board. The rules are the extended encoding: every cell holds
+exactly one value, and every row, column and box holds every value exactly once.
+
+Instead of the full rules, encode generates the rules simplified against the givens of a puzzle: given cells are
+left out, and so are the values ruled out by a given in the same row, column or box. Only the remaining candidates
+get clauses, which keeps even 25x25 boards small.
+
+Puzzles are written as strings of n * n symbols, row by row, using 1-9 and then A-Z for the values and '.' or '0'
+for empty cells. Grids are lists of rows holding the value of every cell, or 0 for empty cells.
+"""
+
+from itertools import combinations
+from pydoku.EngineType import EngineType
+from pydoku.HeuristicType import HeuristicType
+from pydoku.IncrementalSolver import IncrementalSolver
+from pydoku.SATSolver import SATSolver
+from typing import Iterator
+
+SYMBOLS = '123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+EMPTY_SYMBOLS = '.0'
+
+class Sudoku:
+
+  def __init__(self, box: int = 3):
+    """
+    Parameters
+    ----------
+    box : int
+        the number of rows and columns of a box, the board has box * box rows and columns
+    """
+    if not isinstance(box, int) or box < 1:
+      raise TypeError('Invalid box size provided as input.')
+
+    self.box = box
+    self.side = box * box
+
+  @staticmethod
+  def parse(puzzle: str) -> list:
+    """
+    Parses a puzzle written as a string of symbols into a grid
+
+    Parameters
+    ----------
+    puzzle : str
+        the symbols of every cell, row by row
+
+    Returns
+    -------
+    list
+        returns the grid as a list of rows, holding 0 for empty cells
+    """
+    puzzle = puzzle.strip()
+    box = round(len(puzzle) ** 0.25)
+    side = box * box
+
+    if side * side != len(puzzle) or len(puzzle) == 0:
+      raise TypeError('Invalid puzzle provided as input.')
+
+    values = list()
+
+    for symbol in puzzle.upper():
+      if symbol in EMPTY_SYMBOLS:
+        values.append(0)
+      elif symbol in SYMBOLS[:side]:
+        values.append(SYMBOLS.index(symbol) + 1)
+      else:
+        raise TypeError('Invalid puzzle provided as input.')
+
+    return [values[row * side:(row + 1) * side] for row in range(side)]
+
+  @staticmethod
+  def format(grid: list) -> str:
+    """
+    Writes a grid as a string of symbols, the inverse of parse
+
+    Parameters
+    ----------
+    grid : list
+        the grid as a list of rows
+
+    Returns
+    -------
+    str
+        returns the symbols of every cell, row by row, with '.' for empty cells
+    """
+    return ''.join(SYMBOLS[value - 1] if value != 0 else '.' for row in grid for value in row)
+
+  @staticmethod
+  def for_grid(grid: list) -> 'Sudoku':
+    """
+    Returns the board matching the size of a grid
+
+    Parameters
+    ----------
+    grid : list
+        the grid as a list of rows
+
+    Returns
+    -------
+    Sudoku
+        returns the board the grid fits on
+    """
+    box = round(len(grid) ** 0.5)
+
+    if box * box != len(grid):
+      raise TypeError('Invalid grid provided as input.')
+
+    return Sudoku(box)
+
+  def variable(self, row: int, column: int, value: int) -> int:
+    """
+    Returns the variable stating that a cell holds a value
+
+    Parameters
+    ----------
+    row : int
+        the row of the cell, counted from 0
+    column : int
+        the column of the cell, counted from 0
+    value : int
+        the value, counted from 1
+
+    Returns
+    -------
+    int
+        returns the variable, between 1 and side ** 3
+    """
+    return (row * self.side + column) * self.side + value
+
+  def cell(self, variable: int) -> [int, int, int]:
+    """
+    Returns the row, column and value a variable stands for, the inverse of variable
+
+    Parameters
+    ----------
+    variable : int
+        the variable
+
+    Returns
+    -------
+    [int, int, int]
+        returns the row and column, counted from 0, and the value, counted from 1
+    """
+    index, value = divmod(variable - 1, self.side)
+    row, column = divmod(index, self.side)
+
+    return row, column, value + 1
+
+  def units(self) -> list:
+    """
+    Returns the cells of every row, column and box
+
+    Returns
+    -------
+    list
+        returns a list of units, each holding the (row, column) pairs of its cells
+    """
+    side = self.side
+    box = self.box
+    units = [[(row, column) for column in range(side)] for row in range(side)]
+    units += [[(row, column) for row in range(side)] for column in range(side)]
+    units += [[(top + row, left + column) for row in range(box) for column in range(box)]
+              for top in range(0, side, box) for left in range(0, side, box)]
+
+    return units
+
+  def rules(self) -> list:
+    """
+    Returns the rules of the board as a CNF, without any givens
+
+    Returns
+    -------
+    list
+        returns a list of clauses of integer literals
+    """
+    side = self.side
+    values = range(1, side + 1)
+    cnf = list()
+
+    for row in range(side):
+      for column in range(side):
+        cnf += self.exactly_one([self.variable(row, column, value) for value in values])
+
+    for unit in self.units():
+      for value in values:
+        cnf += self.exactly_one([self.variable(row, column, value) for row, column in unit])
+
+    return cnf
+
+  def givens(self, grid: list) -> list:
+    """
+    Returns the literals stating the givens of a grid, to use as unit clauses or assumptions along with the rules
+
+    Parameters
+    ----------
+    grid : list
+        the grid as a list of rows
+
+    Returns
+    -------
+    list
+        returns the positive literal of every given
+    """
+    self.check(grid)
+
+    return [self.variable(row, column, value) for row, values in enumerate(grid) for column, value in enumerate(values) if value != 0]
+
+  def encode(self, grid: list) -> list:
+    """
+    Returns the rules simplified against the givens of a grid
+
+    The givens and every candidate they rule out are left out, so the CNF only holds the candidates left: every
+    empty cell holds exactly one of its candidates, and every value missing from a unit is placed exactly once
+    among the cells of the unit where it is still a candidate.
+
+    Parameters
+    ----------
+    grid : list
+        the grid as a list of rows
+
+    Returns
+    -------
+    list
+        returns a list of clauses of integer literals, holding an empty clause if the givens contradict each other
+
+    See Also
+    --------
+    decode : function reading the solution out of a model of the CNF
+    """
+    self.check(grid)
+    side = self.side
+    units = self.units()
+    candidates = [[set(range(1, side + 1)) if grid[row][column] == 0 else set() for column in range(side)] for row in range(side)]
+
+    for unit in units:
+      placed = [grid[row][column] for row, column in unit if grid[row][column] != 0]
+
+      if len(placed) != len(set(placed)):
+        return [[]]
+
+      for row, column in unit:
+        candidates[row][column].difference_update(placed)
+
+    cnf = list()
+
+    for row in range(side):
+      for column in range(side):
+        if grid[row][column] == 0:
+          cnf += self.exactly_one([self.variable(row, column, value) for value in sorted(candidates[row][column])])
+
+    for unit in units:
+      placed = {grid[row][column] for row, column in unit}
+
+      for value in range(1, side + 1):
+        if value not in placed:
+          cnf += self.exactly_one([self.variable(row, column, value) for row, column in unit if value in candidates[row][column]])
+
+    return cnf
+
+  def decode(self, assignments: dict, grid: list = None) -> list:
+    """
+    Reads the solution out of a model, filling in the empty cells of a grid
+
+    Parameters
+    ----------
+    assignments : dict
+        a dictionary mapping the literals set to True, as strings or integers, to True
+    grid : list
+        the grid holding the givens, None for an empty grid
+
+    Returns
+    -------
+    list
+        returns the completed grid as a list of rows
+    """
+    solution = [list(row) for row in grid] if grid is not None else [[0] * self.side for _ in range(self.side)]
+
+    for literal, value in assignments.items():
+      literal = int(literal)
+
+      if value and 0 < literal <= self.side ** 3:
+        row, column, number = self.cell(literal)
+        solution[row][column] = number
+
+    return solution
+
+  def solve(self, grid: list, heuristic: HeuristicType = HeuristicType.VSIDS, engine: EngineType = EngineType.CDCL) -> list:
+    """
+    Solves a puzzle, encoding it simplified against its givens
+
+    Parameters
+    ----------
+    grid : list
+        the grid as a list of rows
+    heuristic : HeuristicType
+        an Enum value giving us an indication of the branching heuristic to use while searching
+    engine : EngineType
+        an Enum value selecting the search engine
+
+    Returns
+    -------
+    list
+        returns the completed grid, or None if the puzzle has no solution
+    """
+    cnf = self.encode(grid)
+
+    if engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL):
+      cnf = [[str(literal) for literal in clause] for clause in cnf]
+
+    satisfied, assignments, _, _ = SATSolver().solve(cnf, heuristic, engine)
+
+    return self.decode(assignments, grid) if satisfied else None
+
+  def solutions(self, grid: list, limit: int = None) -> Iterator[list]:
+    """
+    Yields the solutions of a puzzle one at a time, enumerating the models of its encoding
+
+    A well-formed puzzle has exactly one solution, which asking for at most two solutions checks:
+    len(list(sudoku.solutions(grid, limit = 2))) == 1.
+
+    Parameters
+    ----------
+    grid : list
+        the grid as a list of rows
+    limit : int
+        number of solutions after which the enumeration stops, None for every solution
+
+    Returns
+    -------
+    Iterator[list]
+        yields every completed grid as a list of rows
+
+    See Also
+    --------
+    IncrementalSolver.enumerate : function enumerating the models of a CNF
+    """
+    cnf = self.encode(grid)
+    solver = IncrementalSolver()
+    solver.add_clauses(cnf)
+
+    # the candidates ruled out by the givens have no clauses, so they would only multiply the models
+    variables = sorted({abs(literal) for clause in cnf for literal in clause})
+    candidates = set(variables)
+
+    for assignments in solver.enumerate(limit = limit, projection = variables):
+      yield self.decode({literal: True for literal in assignments if int(literal) in candidates}, grid)
+
+  def check(self, grid: list) -> None:
+    """
+    Raises a TypeError unless the grid fits the board
+
+    Parameters
+    ----------
+    grid : list
+        the grid as a list of rows
+
+    Returns
+    -------
+    None
+    """
+    if len(grid) != self.side or any(len(row) != self.side or any(not 0 <= value <= self.side for value in row) for row in grid):
+      raise TypeError('Invalid grid provided as input.')
+
+  @staticmethod
+  def exactly_one(variables: list) -> list:
+    """
+    Returns the clauses stating that exactly one of the variables is True
+
+    Parameters
+    ----------
+    variables : list
+        the variables
+
+    Returns
+    -------
+    list
+        returns a clause holding every variable followed by a binary clause for every pair of them
+    """
+    return [list(variables)] + [[-first, -second] for first, second in combinations(variables, 2)]
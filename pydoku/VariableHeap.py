@@ -0,0 +1,147 @@
+"""
+Class containing an indexed binary max-heap of variables ordered by their activity.
+
+The position of every variable in the heap is tracked, so a variable whose activity was increased can be moved up
+in O(log n) and membership can be checked in O(1). Variables are popped in order of decreasing activity.
+"""
+
+class VariableHeap:
+
+  def __init__(self, activity: list):
+    self.activity = activity
+    self.heap = list()
+    self.positions = [-1] * len(activity)
+
+  def __len__(self) -> int:
+    return len(self.heap)
+
+  def __contains__(self, variable: int) -> bool:
+    return self.positions[variable] != -1
+
+  def push(self, variable: int) -> None:
+    """
+    Inserts the variable into the heap, if it is not already present
+
+    Parameters
+    ----------
+    variable : int
+        the variable to insert
+
+    Returns
+    -------
+    None
+    """
+    if self.positions[variable] != -1:
+      return
+
+    self.positions[variable] = len(self.heap)
+    self.heap.append(variable)
+    self.sift_up(len(self.heap) - 1)
+
+  def pop(self) -> int:
+    """
+    Removes and returns the variable with the highest activity
+
+    Returns
+    -------
+    int
+        returns the variable with the highest activity
+    """
+    heap = self.heap
+    top = heap[0]
+    last = heap.pop()
+    self.positions[top] = -1
+
+    if len(heap) != 0:
+      heap[0] = last
+      self.positions[last] = 0
+      self.sift_down(0)
+
+    return top
+
+  def increase(self, variable: int) -> None:
+    """
+    Restores the heap order after the activity of the variable was increased
+
+    Parameters
+    ----------
+    variable : int
+        the variable whose activity was increased
+
+    Returns
+    -------
+    None
+    """
+    position = self.positions[variable]
+
+    if position != -1:
+      self.sift_up(position)
+
+  def sift_up(self, position: int) -> None:
+    """
+    Moves the variable at the given position up until its parent has a higher or equal activity
+
+    Parameters
+    ----------
+    position : int
+        the position of the variable in the heap
+
+    Returns
+    -------
+    None
+    """
+    heap = self.heap
+    positions = self.positions
+    activity = self.activity
+    variable = heap[position]
+
+    while position > 0:
+      parent = (position - 1) >> 1
+
+      if activity[heap[parent]] >= activity[variable]:
+        break
+
+      heap[position] = heap[parent]
+      positions[heap[position]] = position
+      position = parent
+
+    heap[position] = variable
+    positions[variable] = position
+
+  def sift_down(self, position: int) -> None:
+    """
+    Moves the variable at the given position down until both of its children have a lower or equal activity
+
+    Parameters
+    ----------
+    position : int
+        the position of the variable in the heap
+
+    Returns
+    -------
+    None
+    """
+    heap = self.heap
+    positions = self.positions
+    activity = self.activity
+    variable = heap[position]
+    size = len(heap)
+
+    while True:
+      child = 2 * position + 1
+
+      if child >= size:
+        break
+
+      if child + 1 < size and activity[heap[child + 1]] > activity[heap[child]]:
+        child += 1
+
+      if activity[heap[child]] <= activity[variable]:
+        break
+
+      heap[position] = heap[child]
+      positions[heap[position]] = position
+      position = child
+
+    heap[position] = variable
+    positions[variable] = position
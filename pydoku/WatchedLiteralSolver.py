@@ -0,0 +1,771 @@
+"""
+Class containing a Davis-Putnam-Logemann-Loveland (DPLL) search built on integer literals and two watched literals.
+
+Literals are stored as signed integers instead of strings, and every clause watches two of its literals.
+Assigning a literal therefore only visits the clauses watching its negation instead of rescanning the whole CNF,
+and backtracking simply unassigns the literals on the trail since clauses are never modified by the search.
+
+Lookup tables are indexed directly by signed literals: a table of size 2n + 1 maps literal x to index x
+and literal -x to index 2n + 1 - x, which keeps every literal in its own slot without any encoding step.
+
+Every solve collects SolverStatistics, timing propagation and branching. Optional SolverHooks are invoked on every
+decision and conflict, their statistics being brought up to date right before. An optional SolverBudget is checked
+at the same points, and the search gives up, returning None instead of a bool, once it is exhausted.
+
+The heuristics looking at the unsatisfied clauses (RAND, MOMS, Jeroslow-Wang and DLIS) read OccurrenceCounters,
+which are kept up to date on every assignment, instead of scanning the CNF at every decision. The same counters find
+pure literals, which the search optionally sets to True at the root only or after the propagation of every decision.
+"""
+
+from pydoku.ClauseStore import ClauseStore
+from pydoku.HeuristicType import HeuristicType
+from pydoku.OccurrenceCounters import OccurrenceCounters
+from pydoku.PureLiteralType import PureLiteralType
+from pydoku.SolverBudget import SolverBudget
+from pydoku.SolverHooks import SolverHooks
+from pydoku.SolverStatistics import SolverStatistics
+from pydoku.VariableHeap import VariableHeap
+from random import choices
+import time
+
+ACTIVITY_DECAY = 0.95
+ACTIVITY_LIMIT = 1e100
+
+# heuristics reading the occurrence counters, which are only maintained while one of them is in use
+COUNTED_HEURISTICS = (
+  HeuristicType.RANDOM_LITERAL,
+  HeuristicType.MAX_OCCURRENCES_MIN_SIZE,
+  HeuristicType.JEROSLOW_WANG,
+  HeuristicType.JEROSLOW_WANG_TWO_SIDED,
+  HeuristicType.DYNAMIC_LARGEST_INDIVIDUAL_SUM
+)
+
+class WatchedLiteralSolver:
+
+  def __init__(self, hooks: SolverHooks = None, budget: SolverBudget = None,
+               pure_literals: PureLiteralType = PureLiteralType.NONE):
+    """
+    Parameters
+    ----------
+    hooks : SolverHooks
+        the callbacks to invoke while searching, None for no callbacks
+    budget : SolverBudget
+        the limits of every solve, None to always run until an answer is found
+    pure_literals : PureLiteralType
+        where the search sets pure literals to True: nowhere, at the root only, or after every decision
+    """
+    if pure_literals not in PureLiteralType:
+      raise TypeError('Invalid pure literal mode provided as input.')
+
+    self.hooks = hooks
+    self.budget = budget
+    self.pure_literals = pure_literals
+    self.statistics = SolverStatistics()
+    self.start_time = time.perf_counter()
+    self.backtracks = 0
+    self.splits = 0
+    self.conflicts = 0
+    self.clauses = list()
+    self.watches = list()
+    self.values = list()
+    self.trail = list()
+    self.propagated = 0
+    self.inconsistent = False
+    self.activity = list()
+    self.heap = VariableHeap(self.activity)
+    self.bump_increment = 1.0
+    self.counters = None
+
+  def solve(self, cnf: list, heuristic: HeuristicType) -> [bool, dict, int, int]:
+    """
+    Solves a boolean satisfiability problem represented in conjunctive normal form (CNF)
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, literals may be given as strings or integers
+    heuristic : HeuristicType
+        an Enum value giving us an indication of the branching heuristic to use while searching
+
+    Returns
+    -------
+    [bool, dict, int, int]
+        returns true if a satisfiable solution to the CNF was found, or None if the budget ran out first,
+        along with a the valid assignments, the number of backtracks, and number of splits.
+        The statistics of the solve are available as the statistics attribute afterwards.
+
+    See Also
+    --------
+    search : function implementing the logic for the DPLL search over the watched clauses
+    """
+    self.backtracks = 0
+    self.splits = 0
+    self.conflicts = 0
+    self.statistics = SolverStatistics()
+    self.start_time = time.perf_counter()
+
+    if heuristic not in HeuristicType:
+      raise TypeError('Invalid heuristic provided as input.')
+
+    started = self.budget is not None and self.budget.start(self.splits, self.conflicts)
+
+    try:
+      self.load(cnf)
+      satisfied = self.search(heuristic)
+    finally:
+      if started:
+        self.budget.stop()
+
+    assignments = self.get_assignments() if satisfied else None
+    self.update_statistics()
+
+    return satisfied, assignments, self.backtracks, self.splits
+
+  def load(self, cnf: list) -> None:
+    """
+    Converts the CNF to integer literals and sets up the watches, assignments and trail
+
+    Duplicate literals are dropped and tautological clauses are skipped since neither affects satisfiability.
+    Every variable of the remaining clauses is put in the activity heap used by VSIDS.
+
+    Parameters
+    ----------
+    cnf : list
+        a list of clauses that belong to the CNF, or a ClauseStore holding them
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    load_store : function reading the clauses straight from the buffers of a ClauseStore
+    """
+    if isinstance(cnf, ClauseStore):
+      self.load_store(cnf)
+      return
+
+    clauses = list()
+    variables = set()
+
+    for clause in cnf:
+      literals = list(dict.fromkeys(int(literal) for literal in clause))
+      unique = set(literals)
+
+      if any(-literal in unique for literal in literals):
+        continue
+
+      variables.update(abs(literal) for literal in literals)
+      clauses.append(literals)
+
+    self.allocate(max(variables, default = 0))
+
+    for literals in clauses:
+      self.add_clause(literals)
+
+    for variable in sorted(variables):
+      self.heap.push(variable)
+
+  def load_store(self, store: ClauseStore) -> None:
+    """
+    Sets up the watches, assignments and trail from a ClauseStore, reading its literal and offset buffers directly
+
+    The largest variable is found in the literal buffer first, so every clause is added as soon as it is read, without
+    building a list of every clause beforehand.
+
+    Parameters
+    ----------
+    store : ClauseStore
+        the store holding the clauses of the CNF
+
+    Returns
+    -------
+    None
+    """
+    literals = store.literals
+    offsets = store.offsets
+    variables = set()
+    self.allocate(max(max(literals, default = 0), -min(literals, default = 0)))
+
+    for index in range(len(offsets) - 1):
+      clause = list(dict.fromkeys(literals[offsets[index]:offsets[index + 1]]))
+      unique = set(clause)
+
+      if any(-literal in unique for literal in clause):
+        continue
+
+      variables.update(abs(literal) for literal in clause)
+      self.add_clause(clause)
+
+    for variable in sorted(variables):
+      self.heap.push(variable)
+
+  def allocate(self, max_variable: int) -> None:
+    """
+    Creates empty watches, assignments and trail for variables up to the given one
+
+    Parameters
+    ----------
+    max_variable : int
+        the largest variable occurring in the CNF
+
+    Returns
+    -------
+    None
+    """
+    size = 2 * max_variable + 1
+    self.clauses = list()
+    self.watches = [list() for _ in range(size)]
+    self.values = [None] * size
+    self.trail = list()
+    self.propagated = 0
+    self.inconsistent = False
+    self.activity = [0.0] * (max_variable + 1)
+    self.heap = VariableHeap(self.activity)
+    self.bump_increment = 1.0
+    self.counters = None
+
+  def add_clause(self, literals: list) -> None:
+    """
+    Adds a clause at the root of the search, watching its first two literals
+
+    Parameters
+    ----------
+    literals : list
+        the integer literals of the clause
+
+    Returns
+    -------
+    None
+    """
+    if len(literals) == 0:
+      self.inconsistent = True
+      return
+
+    if len(literals) == 1:
+      value = self.values[literals[0]]
+
+      if value is False:
+        self.inconsistent = True
+      elif value is None:
+        self.assign(literals[0])
+      return
+
+    self.clauses.append(literals)
+    self.watches[literals[0]].append(literals)
+    self.watches[literals[1]].append(literals)
+
+  def assign(self, literal: int, reason: list = None) -> None:
+    """
+    Sets the literal to True and pushes it on the trail
+
+    Parameters
+    ----------
+    literal : int
+        the literal to set to True
+    reason : list
+        the clause that implied the literal, None for decisions
+
+    Returns
+    -------
+    None
+    """
+    self.values[literal] = True
+    self.values[-literal] = False
+    self.trail.append(literal)
+
+    if self.counters is not None:
+      self.counters.assign(literal)
+
+  def propagate(self) -> list:
+    """
+    Runs unit propagation over every literal on the trail that has not been propagated yet
+
+    Only the clauses watching the negation of a newly assigned literal are visited. Each of those clauses
+    either finds another literal to watch, becomes unit and implies its other watch, or is falsified.
+
+    Returns
+    -------
+    list
+        returns the falsified clause if a conflict was found, otherwise None
+    """
+    start_time = time.perf_counter()
+    values = self.values
+    watches = self.watches
+    trail = self.trail
+    implied = 0
+
+    while self.propagated < len(trail):
+      false_literal = -trail[self.propagated]
+      self.propagated += 1
+      watching = watches[false_literal]
+      kept = list()
+
+      for index, clause in enumerate(watching):
+        if clause[0] == false_literal:
+          clause[0], clause[1] = clause[1], false_literal
+
+        other = clause[0]
+        if values[other] is True:
+          kept.append(clause)
+          continue
+
+        for position in range(2, len(clause)):
+          candidate = clause[position]
+          if values[candidate] is not False:
+            clause[1], clause[position] = candidate, false_literal
+            watches[candidate].append(clause)
+            break
+        else:
+          kept.append(clause)
+
+          if values[other] is False:
+            kept.extend(watching[index + 1:])
+            watches[false_literal] = kept
+            self.statistics.propagations += implied
+            self.statistics.propagation_time += time.perf_counter() - start_time
+            return clause
+
+          implied += 1
+          self.assign(other, clause)
+
+      watches[false_literal] = kept
+
+    self.statistics.propagations += implied
+    self.statistics.propagation_time += time.perf_counter() - start_time
+
+    return None
+
+  def backtrack_to(self, mark: int) -> None:
+    """
+    Unassigns every literal that was pushed on the trail after the given position and puts its variable back in the heap
+
+    Parameters
+    ----------
+    mark : int
+        length of the trail to go back to
+
+    Returns
+    -------
+    None
+    """
+    values = self.values
+    heap = self.heap
+    counters = self.counters
+
+    for literal in self.trail[mark:]:
+      values[literal] = None
+      values[-literal] = None
+      heap.push(abs(literal))
+
+      if counters is not None:
+        counters.unassign(literal)
+
+    del self.trail[mark:]
+    self.propagated = min(self.propagated, mark)
+
+  def search(self, heuristic: HeuristicType) -> bool:
+    """
+    Runs a chronological DPLL search, branching first on the chosen literal and then on its negation
+
+    Parameters
+    ----------
+    heuristic : HeuristicType
+        the type of heuristic to use while picking the next literal
+
+    Returns
+    -------
+    bool
+        returns true if the CNF is satisfiable, or None if the budget ran out
+
+    See Also
+    --------
+    propagate : function implementing unit propagation over the watched literals
+    next_literal : function implementing the logic to find the next literal to branch on
+    """
+    self.count_occurrences(heuristic)
+
+    if self.inconsistent or self.propagate() is not None:
+      self.conflicts += 1
+      return False
+
+    if self.pure_literals != PureLiteralType.NONE:
+      self.assign_pure_literals()
+
+    # the counters are only needed at the root when the heuristic does not read them
+    if self.pure_literals == PureLiteralType.ROOT and heuristic not in COUNTED_HEURISTICS:
+      self.counters = None
+
+    # every entry holds the trail length before the decision, the decision literal, and whether it was flipped
+    decisions = list()
+    hooks = self.hooks
+    budget = self.budget
+    statistics = self.statistics
+
+    while True:
+      if budget is not None and budget.exhausted(self.splits, self.conflicts):
+        return None
+
+      start_time = time.perf_counter()
+      literal = self.next_literal(heuristic)
+      statistics.branching_time += time.perf_counter() - start_time
+
+      if literal is None:
+        return True
+
+      self.splits += 1
+      decisions.append([len(self.trail), literal, False])
+      self.assign(literal)
+
+      if hooks is not None:
+        self.update_statistics()
+        hooks.decision(literal, statistics)
+
+      conflict = self.propagate()
+
+      while conflict is not None:
+        self.conflicts += 1
+
+        if hooks is not None:
+          self.update_statistics()
+          hooks.conflict(conflict, statistics)
+
+        if budget is not None and budget.exhausted(self.splits, self.conflicts):
+          return None
+
+        self.bump_clause(conflict)
+        self.decay_activity()
+
+        while len(decisions) != 0 and decisions[-1][2]:
+          decisions.pop()
+
+        if len(decisions) == 0:
+          return False
+
+        self.backtracks += 1
+        decision = decisions[-1]
+        decision[2] = True
+        self.backtrack_to(decision[0])
+        self.assign(-decision[1])
+        conflict = self.propagate()
+
+      if self.pure_literals == PureLiteralType.ALL:
+        self.assign_pure_literals()
+
+  def update_statistics(self) -> None:
+    """
+    Copies the counters of the search and the time elapsed since the start of the solve into the statistics
+
+    Returns
+    -------
+    None
+    """
+    statistics = self.statistics
+    statistics.decisions = self.splits
+    statistics.conflicts = self.conflicts
+    statistics.backtracks = self.backtracks
+    statistics.total_time = time.perf_counter() - self.start_time
+
+  def count_occurrences(self, heuristic: HeuristicType) -> None:
+    """
+    Sets up the occurrence counters for the current assignment if the heuristic or the pure literal search reads them,
+    drops them otherwise
+
+    Parameters
+    ----------
+    heuristic : HeuristicType
+        the heuristic the search is about to use
+
+    Returns
+    -------
+    None
+    """
+    pure = self.pure_literals != PureLiteralType.NONE
+
+    if heuristic in COUNTED_HEURISTICS or pure:
+      counts = pure or heuristic in (HeuristicType.RANDOM_LITERAL, HeuristicType.DYNAMIC_LARGEST_INDIVIDUAL_SUM)
+      weights = heuristic in (HeuristicType.JEROSLOW_WANG, HeuristicType.JEROSLOW_WANG_TWO_SIDED)
+      self.counters = OccurrenceCounters(self.clauses, len(self.activity) - 1, self.values, counts, weights)
+    else:
+      self.counters = None
+
+  def assign_pure_literals(self) -> None:
+    """
+    Sets every pure literal to True, until none is left
+
+    A literal is pure when its negation only occurs in satisfied clauses, so setting it only satisfies clauses and never
+    implies or falsifies anything. Pure literals are pushed on the trail without a reason, and get propagated along
+    with the next decision like any other literal.
+
+    Returns
+    -------
+    None
+    """
+    start_time = time.perf_counter()
+    counters = self.counters
+    values = self.values
+    pure = counters.pure_literals(values)
+
+    while len(pure) != 0:
+      self.statistics.pure_literals += len(pure)
+
+      for literal in pure:
+        self.assign(literal)
+
+      pure = counters.pure_literals(values)
+
+    self.statistics.simplification_time += time.perf_counter() - start_time
+
+  def unsatisfied_clauses(self) -> list:
+    """
+    Yields the unassigned literals of every clause that is not yet satisfied
+
+    Returns
+    -------
+    list
+        yields a list of unassigned literals for each unsatisfied clause
+    """
+    values = self.values
+
+    for clause in self.clauses:
+      unassigned = list()
+
+      for literal in clause:
+        value = values[literal]
+
+        if value is True:
+          break
+
+        if value is None:
+          unassigned.append(literal)
+      else:
+        yield unassigned
+
+  def next_literal(self, heuristic: HeuristicType) -> int:
+    """
+    Returns the next literal to branch on
+
+    Parameters
+    ----------
+    heuristic : HeuristicType
+        the type of heuristic to use while picking the next literal
+
+    Returns
+    -------
+    int
+        returns the literal to branch on, or None if every clause is satisfied
+    """
+    if heuristic == HeuristicType.RANDOM_LITERAL:
+      return self.random_literal()
+    elif heuristic == HeuristicType.MAX_OCCURRENCES_MIN_SIZE:
+      return self.max_occurences_minimal_size_literal()
+    elif heuristic == HeuristicType.VSIDS:
+      return self.highest_activity_literal()
+    elif heuristic == HeuristicType.JEROSLOW_WANG:
+      return self.highest_score_literal(self.counters.weights)
+    elif heuristic == HeuristicType.JEROSLOW_WANG_TWO_SIDED:
+      return self.jeroslow_wang_two_sided_literal()
+    elif heuristic == HeuristicType.DYNAMIC_LARGEST_INDIVIDUAL_SUM:
+      return self.highest_score_literal(self.counters.counts)
+
+    for clause in self.unsatisfied_clauses():
+      return clause[0]
+
+    return None
+
+  def max_occurences_minimal_size_literal(self) -> int:
+    """
+    Returns the unassigned literal occurring the most times in unsatisfied clauses of minimal size
+
+    Only the clauses in the smallest bucket of the occurrence counters are visited.
+
+    Returns
+    -------
+    int
+        returns the literal to branch on, or None if every clause is satisfied
+    """
+    values = self.values
+    clauses = self.counters.clauses
+    literals = [literal for index in self.counters.smallest_clauses() for literal in clauses[index] if values[literal] is None]
+    max_occurrences = 0
+    literal_counts = dict()
+    max_occurring = None
+
+    for literal in literals:
+      literal_counts[literal] = literal_counts.get(literal, 0) + 1
+
+      if literal_counts[literal] > max_occurrences:
+        max_occurrences = literal_counts[literal]
+        max_occurring = literal
+
+    return max_occurring
+
+  def random_literal(self) -> int:
+    """
+    Returns a random unassigned literal, each one weighted by the number of unsatisfied clauses it occurs in
+
+    This picks a literal exactly like picking one of the unassigned literals of the unsatisfied clauses at random.
+
+    Returns
+    -------
+    int
+        returns the literal to branch on, or None if every clause is satisfied
+    """
+    counts = self.counters.counts
+    literals = [literal for literal in self.unassigned_literals() if counts[literal] != 0]
+
+    if len(literals) == 0:
+      return None
+
+    return choices(literals, [counts[literal] for literal in literals])[0]
+
+  def highest_score_literal(self, scores: list) -> int:
+    """
+    Returns the unassigned literal with the highest score, the first one in case of a tie
+
+    Parameters
+    ----------
+    scores : list
+        the score of every literal, indexed by literal, such as the Jeroslow-Wang weights or the DLIS counts
+
+    Returns
+    -------
+    int
+        returns the literal to branch on, or None if every unassigned literal scores 0, so every clause is satisfied
+    """
+    best = None
+    best_score = 0
+
+    for literal in self.unassigned_literals():
+      if scores[literal] > best_score:
+        best = literal
+        best_score = scores[literal]
+
+    return best
+
+  def jeroslow_wang_two_sided_literal(self) -> int:
+    """
+    Returns a literal of the unassigned variable with the highest combined Jeroslow-Wang weight of both its literals,
+    picking the literal with the highest weight of the two
+
+    Returns
+    -------
+    int
+        returns the literal to branch on, or None if every clause is satisfied
+    """
+    values = self.values
+    weights = self.counters.weights
+    best = None
+    best_score = 0
+
+    for variable in range(1, len(self.activity)):
+      if values[variable] is None and weights[variable] + weights[-variable] > best_score:
+        best = variable
+        best_score = weights[variable] + weights[-variable]
+
+    if best is None:
+      return None
+
+    return best if weights[best] >= weights[-best] else -best
+
+  def unassigned_literals(self) -> list:
+    """
+    Yields both literals of every unassigned variable, positive first
+
+    Returns
+    -------
+    list
+        yields the unassigned literals
+    """
+    values = self.values
+
+    for variable in range(1, len(self.activity)):
+      if values[variable] is None:
+        yield variable
+        yield -variable
+
+  def highest_activity_literal(self) -> int:
+    """
+    Returns the negative literal of the unassigned variable with the highest activity
+
+    Assigned variables are dropped from the heap as they are popped, they are put back when unassigned on backtrack.
+
+    Returns
+    -------
+    int
+        returns the literal to branch on, or None if every variable is assigned
+    """
+    values = self.values
+    heap = self.heap
+
+    while len(heap) != 0:
+      variable = heap.pop()
+
+      if values[variable] is None:
+        return -variable
+
+    return None
+
+  def bump(self, variable: int) -> None:
+    """
+    Increases the activity of the variable by the current increment
+
+    Once an activity grows too large, every activity and the increment are scaled down together,
+    which keeps their relative order intact.
+
+    Parameters
+    ----------
+    variable : int
+        the variable involved in a conflict
+
+    Returns
+    -------
+    None
+    """
+    activity = self.activity
+    activity[variable] += self.bump_increment
+
+    if activity[variable] > ACTIVITY_LIMIT:
+      for index in range(len(activity)):
+        activity[index] /= ACTIVITY_LIMIT
+
+      self.bump_increment /= ACTIVITY_LIMIT
+
+    self.heap.increase(variable)
+
+  def bump_clause(self, clause: list) -> None:
+    """
+    Increases the activity of every variable in the clause
+
+    Parameters
+    ----------
+    clause : list
+        the clause involved in a conflict
+
+    Returns
+    -------
+    None
+    """
+    for literal in clause:
+      self.bump(abs(literal))
+
+  def decay_activity(self) -> None:
+    """
+    Decays every activity exponentially (EVSIDS) by growing the increment used for future bumps instead
+
+    Returns
+    -------
+    None
+    """
+    self.bump_increment /= ACTIVITY_DECAY
+
+  def get_assignments(self) -> dict:
+    """
+    Returns the literals on the trail in the same form as the string based solver
+
+    Returns
+    -------
+    dict
+        returns a dictionary mapping every literal set to True to the value True
+    """
+    return {str(literal): True for literal in self.trail}
@@ -1,9 +1,18 @@
 """
 Usage: SAT --help
-       SAT (-S1 | -S2 | -S3) [FILE]
+       SAT (-S1 | -S2 | -S3 | -S4 | -S5 | -S6 | -S7) [--engine=<engine>] [--restart=<policy>] [--reduce-interval=<conflicts>] [--preprocess] [--pure-literals=<mode>] [--decompose=<mode>] [--workers=<count>] [--cache] [--result-cache=<path>] [--stats] [--timeout=<seconds>] [FILE]
+       SAT (-S1 | -S2 | -S3 | -S4 | -S5 | -S6 | -S7) [--engine=<engine>] [--restart=<policy>] [--reduce-interval=<conflicts>] [--preprocess] [--cache] [--result-cache=<path>] --batch=<source> [--workers=<count>] [--timeout=<seconds>] [--summary=<path>]
+       SAT --enumerate=<count> [--project=<variables>] [--cache] [--timeout=<seconds>] [FILE]
+       SAT --count [--count-cache=<megabytes>] [--cache] [--stats] [--timeout=<seconds>] [FILE]
+       SAT --portfolio [--workers=<count>] [--cache] [--timeout=<seconds>] [FILE]
+       SAT --cube-and-conquer [--workers=<count>] [--depth=<depth>] [--cache] [--timeout=<seconds>] [FILE]
+       SAT --serve [--socket=<path> | --port=<port>] [--workers=<count>] [--queue=<size>] [--rules=<path>]... [--timeout=<seconds>]
 
 Process the DIMACS file defining a formula in Conjunctive Normal Form (CNF).
 Returns True if the formula is satisfiable and a list of satisfiable assignments.
+Solving a single file, on its own, with a portfolio or with cube-and-conquer, exits with status 10 if the formula is
+satisfiable, 20 if it is unsatisfiable, and 0 if no answer was found within the time limit or the search was interrupted with Ctrl-C.
+Every mode exits with status 1 if the input is invalid, a file cannot be read, or the search fails.
 
 Arguments:
   FILE File defining the CNF in DIMACS format
@@ -13,13 +22,53 @@ Options:
   -S1 Relative path for a DIMACS file defining a CNF to be solved using the Davis-Putnam-Logemann-Loveland algorithm
   -S2 Relative path for a DIMACS file defining a CNF to be solved using random literal selection as the branching heuristic.
   -S3 Relative path for a DIMACS file defining a CNF to be solved using Maximum Occurences in Minimal Size as the branching heuristic.
+  -S4 Relative path for a DIMACS file defining a CNF to be solved using variable activity (VSIDS) as the branching heuristic.
+  -S5 Relative path for a DIMACS file defining a CNF to be solved using one-sided Jeroslow-Wang as the branching heuristic.
+  -S6 Relative path for a DIMACS file defining a CNF to be solved using two-sided Jeroslow-Wang as the branching heuristic.
+  -S7 Relative path for a DIMACS file defining a CNF to be solved using Dynamic Largest Individual Sum (DLIS) as the branching heuristic.
+  --engine=<engine>  Search engine to run the heuristic with: dpll, iterative, watched or cdcl. Defaults to cdcl for -S4 or when restarting, and dpll otherwise.
+  --restart=<policy>  Restart policy of the cdcl engine, with phase saving: none, fixed, geometric, luby or glucose [default: none]
+  --reduce-interval=<conflicts>  Conflicts before the cdcl engine first deletes the least useful half of its learned clauses [default: 2000]
+  --preprocess  Simplify the CNF with subsumption and bounded variable elimination before searching
+  --pure-literals=<mode>  Where pure literals are set to True: none, root or all. Defaults to all for the dpll and iterative engines and none otherwise, the cdcl engine only supports none and root.
+  --decompose=<mode>  Where the CNF is split into components sharing no variable, solved on their own: none, root or all [default: none]. Only the dpll engine supports all, which also splits the CNF after every decision.
+  --stats  Print detailed statistics of the search, and its progress every second while it runs
+  --cache  Keep a binary copy of the CNF next to the file and memory-map it on later runs instead of parsing the file
+  --result-cache=<path>  Database of the results of the CNFs solved before, answering a CNF seen before without searching, and a file seen before without parsing it
+  --batch=<source>  Solve every file in a directory, matching a glob pattern, or listed in a manifest file, in parallel
+  --enumerate=<count>  Enumerate up to this many models of the CNF with the cdcl engine, 0 for every model, 2 to check that the model is unique
+  --project=<variables>  Variables two models must differ on to both be enumerated, as a comma separated list of variables and ranges such as 1-81
+  --count  Count the models of the CNF exactly, over the variables declared by its header, splitting it into components and caching their counts
+  --count-cache=<megabytes>  Memory the cached component counts may take before the least recently used ones are evicted [default: 64]
+  --portfolio  Race several heuristics, restart policies and seeds in parallel processes sharing short learned clauses, keeping the first answer
+  --cube-and-conquer  Split the CNF into cubes with a lookahead search and solve the cubes in parallel processes
+  --depth=<depth>  Number of splits along every branch of the lookahead, defaults to 16 cubes per worker
+  --serve  Keep solving the CNFs and Sudoku puzzles sent by SAT-client over a Unix socket or HTTP until stopped with Ctrl-C
+  --socket=<path>  Unix socket the server listens on, defaults to pydoku.sock in the temporary directory
+  --port=<port>  Port the server listens on for HTTP requests on localhost, instead of a Unix socket
+  --queue=<size>  Number of requests the server queues or solves at once before answering busy, defaults to four per worker
+  --rules=<path>  DIMACS file the server keeps loaded as a rule base, which requests naming it are solved along with
+  --workers=<count>  Number of worker processes in batch, portfolio, cube-and-conquer or server mode, defaults to the number of CPUs. When solving the components of a single file, they are solved in this process unless a number is given.
+  --timeout=<seconds>  Time limit of the search, per instance in batch mode, per request in server mode, per process in portfolio and cube-and-conquer mode, or of the whole enumeration
+  --summary=<path>  File collecting the result of every instance in batch mode, as CSV if it ends with .csv and JSON lines otherwise
 
 """
+# the modules of the other modes are imported by their handlers, so that a plain solve does not pay for importing them
 from pydoku.SATSolver import SATSolver
+from pydoku.SolverHooks import SolverHooks
+from pydoku.SolverStatistics import SolverStatistics
 from pydoku.FileHandler import FileHandler
+from pydoku.DecompositionType import DecompositionType
+from pydoku.DIMACSError import DIMACSError
+from pydoku.EngineType import EngineType
 from pydoku.HeuristicType import HeuristicType
+from pydoku.PureLiteralType import PureLiteralType
+from pydoku.RestartType import RestartType
 from docopt import docopt
+from pydoku.SolverBudget import SolverBudget, REASON_INTERRUPTED
+from pydoku.StatusType import StatusType
 from termcolor import colored, cprint
+import signal
 import sys
 
 ARG_KEY_HELP = '--help'
@@ -27,8 +76,73 @@ ARG_KEY_SOLVE = '-S'
 ARG_KEY_DPLL = '-1'
 ARG_KEY_RAND = '-2'
 ARG_KEY_MOMS = '-3'
+ARG_KEY_VSIDS = '-4'
+ARG_KEY_JW = '-5'
+ARG_KEY_JW_TWO_SIDED = '-6'
+ARG_KEY_DLIS = '-7'
+ARG_KEY_ENGINE = '--engine'
+ARG_KEY_RESTART = '--restart'
+ARG_KEY_REDUCE_INTERVAL = '--reduce-interval'
+ARG_KEY_PREPROCESS = '--preprocess'
+ARG_KEY_PURE_LITERALS = '--pure-literals'
+ARG_KEY_DECOMPOSE = '--decompose'
+ARG_KEY_CACHE = '--cache'
+ARG_KEY_RESULT_CACHE = '--result-cache'
+ARG_KEY_STATS = '--stats'
+ARG_KEY_BATCH = '--batch'
+ARG_KEY_WORKERS = '--workers'
+ARG_KEY_TIMEOUT = '--timeout'
+ARG_KEY_SUMMARY = '--summary'
+ARG_KEY_ENUMERATE = '--enumerate'
+ARG_KEY_PROJECT = '--project'
+ARG_KEY_COUNT = '--count'
+ARG_KEY_COUNT_CACHE = '--count-cache'
+ARG_KEY_PORTFOLIO = '--portfolio'
+ARG_KEY_CUBE_AND_CONQUER = '--cube-and-conquer'
+ARG_KEY_DEPTH = '--depth'
+ARG_KEY_SERVE = '--serve'
+ARG_KEY_SOCKET = '--socket'
+ARG_KEY_PORT = '--port'
+ARG_KEY_QUEUE = '--queue'
+ARG_KEY_RULES = '--rules'
 ARG_KEY_FILEPATH = 'FILE'
 
+EXIT_CODES = {
+  StatusType.SATISFIABLE: 10,
+  StatusType.UNSATISFIABLE: 20,
+  StatusType.UNKNOWN: 0
+}
+
+# invalid input, unreadable files and failed searches, kept apart from an UNKNOWN outcome
+EXIT_ERROR = 1
+
+ENGINES = {
+  'dpll': EngineType.RECURSIVE_DPLL,
+  'iterative': EngineType.ITERATIVE_DPLL,
+  'watched': EngineType.WATCHED_LITERALS,
+  'cdcl': EngineType.CDCL
+}
+
+RESTARTS = {
+  'none': RestartType.NONE,
+  'fixed': RestartType.FIXED,
+  'geometric': RestartType.GEOMETRIC,
+  'luby': RestartType.LUBY,
+  'glucose': RestartType.GLUCOSE
+}
+
+PURE_LITERALS = {
+  'none': PureLiteralType.NONE,
+  'root': PureLiteralType.ROOT,
+  'all': PureLiteralType.ALL
+}
+
+DECOMPOSITIONS = {
+  'none': DecompositionType.NONE,
+  'root': DecompositionType.ROOT,
+  'all': DecompositionType.ALL
+}
+
 def error(message: str) -> None:
   """
   Prints out an error message in the terminal
@@ -67,6 +181,494 @@ def success(message: str) -> None:
   """
   cprint(message, 'green', attrs = ['bold'], file = sys.stderr)
 
+def progress(statistics: SolverStatistics) -> None:
+  """
+  Prints out the progress of a running search in the terminal
+
+  Parameters
+  ----------
+  statistics : SolverStatistics
+      the statistics of the search so far
+
+  Returns
+  -------
+  None
+  """
+  cprint(f'{statistics.total_time:.1f}s: {statistics.decisions} decisions, {statistics.conflicts} conflicts, '
+         f'{statistics.propagations_per_second:,.0f} propagations per second', 'yellow', file = sys.stderr)
+
+def read_timeout(args: dict) -> float:
+  """
+  Reads the time limit from the command line arguments, exiting with an error message if it is invalid
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+
+  Returns
+  -------
+  float
+      returns the time limit in seconds, or None if there is none
+  """
+  timeout = args[ARG_KEY_TIMEOUT]
+
+  try:
+    timeout = float(timeout) if timeout is not None else None
+  except ValueError:
+    timeout = 0
+
+  if timeout is not None and timeout <= 0:
+    error('Invalid timeout provided as input.')
+    exit(EXIT_ERROR)
+
+  return timeout
+
+def read_projection(args: dict) -> list:
+  """
+  Reads the variables to project models on from the command line arguments, exiting with an error message if they are invalid
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+
+  Returns
+  -------
+  list
+      returns the variables in the order they were given, or None to project on every variable
+  """
+  projection = args[ARG_KEY_PROJECT]
+
+  if projection is None:
+    return None
+
+  variables = list()
+
+  for part in projection.split(','):
+    first, _, last = part.strip().partition('-')
+
+    if not first.isdigit() or not (last == '' or last.isdigit()) or int(first) == 0:
+      error('Invalid projection provided as input.')
+      exit(EXIT_ERROR)
+
+    variables.extend(range(int(first), int(last or first) + 1))
+
+  return variables
+
+def batch(args: dict, heuristic: HeuristicType, engine: EngineType, restart: RestartType, reduce_interval: int) -> None:
+  """
+  Solves every file of a batch in parallel, printing the result of every instance as soon as it finishes
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+  heuristic : HeuristicType
+      the branching heuristic to solve every instance with
+  engine : EngineType
+      the search engine to solve every instance with
+  restart : RestartType
+      the restart policy of the CDCL engine
+  reduce_interval : int
+      number of conflicts before the CDCL engine first reduces its learned clauses
+
+  Returns
+  -------
+  None
+
+  See Also
+  --------
+  BatchSolver : class distributing the files over a pool of worker processes
+  """
+  from pydoku.BatchSolver import BatchSolver, STATUS_SATISFIABLE, STATUS_UNSATISFIABLE
+
+  workers = args[ARG_KEY_WORKERS]
+
+  if workers is not None and (not workers.isdigit() or int(workers) == 0):
+    error('Invalid number of workers provided as input.')
+    exit(EXIT_ERROR)
+
+  timeout = read_timeout(args)
+
+  try:
+    filepaths = BatchSolver.collect(args[ARG_KEY_BATCH])
+  except OSError:
+    error('Error: An error occurred while reading the batch provided.')
+    exit(EXIT_ERROR)
+
+  solver = BatchSolver(heuristic, engine, restart, reduce_interval, args[ARG_KEY_PREPROCESS], args[ARG_KEY_CACHE],
+                       int(workers) if workers is not None else None, timeout, args[ARG_KEY_RESULT_CACHE])
+  results = solver.run(filepaths)
+
+  if args[ARG_KEY_SUMMARY] is not None:
+    results = BatchSolver.summarize(results, args[ARG_KEY_SUMMARY])
+
+  counts = dict()
+
+  for result in results:
+    counts[result['status']] = counts.get(result['status'], 0) + 1
+    message = f'{result["status"]} {result["file"]} ({result["run_time"]:.3f} seconds)'
+
+    if result['error'] is not None:
+      message += f': {result["error"]}'
+
+    if result['status'] in (STATUS_SATISFIABLE, STATUS_UNSATISFIABLE):
+      success(message)
+    else:
+      error(message)
+
+  success(f'Solved {len(filepaths)} instances: ' + ', '.join(f'{count} {status}' for status, count in sorted(counts.items())))
+
+def enumeration(args: dict) -> None:
+  """
+  Enumerates the models of a single file, writing every model to the `.models` file as soon as it is found
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+
+  Returns
+  -------
+  None
+
+  See Also
+  --------
+  IncrementalSolver.enumerate : function yielding the models one at a time, blocking each of them once found
+  """
+  from pydoku.IncrementalSolver import IncrementalSolver
+
+  limit = args[ARG_KEY_ENUMERATE]
+
+  if not limit.isdigit():
+    error('Invalid number of models provided as input.')
+    exit(EXIT_ERROR)
+
+  limit = int(limit) or None
+  projection = read_projection(args)
+  timeout = read_timeout(args)
+  filepath = args[ARG_KEY_FILEPATH]
+  output_filepath = f'{filepath}.models'
+  try:
+    cnf = FileHandler.load(filepath) if args[ARG_KEY_CACHE] else FileHandler.parse(filepath, integers = True)
+  except DIMACSError as exception:
+    error(f'Error: {exception}')
+    exit(EXIT_ERROR)
+  except:
+    error('Error: An error occurred while reading the file provided.')
+    exit(EXIT_ERROR)
+
+  try:
+    budget = SolverBudget(time_limit = timeout)
+    solver = IncrementalSolver(budget = budget)
+    solver.add_clauses(cnf)
+    models = solver.enumerate(limit = limit, projection = projection)
+
+    # Ctrl-C stops the enumeration cooperatively, keeping the models found so far
+    handler = signal.signal(signal.SIGINT, lambda signum, frame: budget.interrupt())
+
+    try:
+      for _ in FileHandler.output_models(output_filepath, models):
+        pass
+    finally:
+      signal.signal(signal.SIGINT, handler)
+
+    report = success if solver.models != 0 else error
+    kind = 'assignments of the projected variables' if projection is not None else 'models'
+
+    if solver.complete and solver.models == 0:
+      error('Formula provided is unsatisfiable.')
+    elif solver.complete and solver.models == 1:
+      success('The formula has a unique assignment of the projected variables.' if projection is not None else 'The formula has a unique model.')
+    elif solver.complete:
+      success(f'Found all {solver.models} {kind} of the formula.')
+    elif budget.reason == REASON_INTERRUPTED:
+      report(f'Enumeration interrupted after {solver.models} {kind}.')
+    elif budget.reason is not None:
+      report(f'Enumeration stopped by the {budget.reason} limit after {solver.models} {kind}.')
+    else:
+      report(f'Stopped at the limit of {solver.models} {kind}, the formula may have more.')
+
+    report(f'Number of backtracks: {solver.backtracks}')
+    report(f'Number of splits: {solver.splits}')
+    report(f'Number of conflicts: {solver.conflicts}')
+    report(f'Number of learned clauses: {solver.learned_clauses}')
+
+    if solver.models != 0:
+      success(f'Models of the CNF can be found here: {output_filepath}')
+
+  except:
+    error('Error: An error occurred while solving the provided CNF formula.')
+    exit(EXIT_ERROR)
+
+  if solver.models != 0:
+    exit(EXIT_CODES[StatusType.SATISFIABLE])
+
+  exit(EXIT_CODES[StatusType.UNSATISFIABLE if solver.complete else StatusType.UNKNOWN])
+
+def count(args: dict) -> None:
+  """
+  Counts the models of a single file and reports the count along with the statistics of the component cache
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+
+  Returns
+  -------
+  None
+
+  See Also
+  --------
+  ModelCounter : class counting the models over components, caching their counts
+  """
+  from pydoku.ModelCounter import ModelCounter
+
+  if not args[ARG_KEY_COUNT_CACHE].isdigit():
+    error('Invalid cache size provided as input.')
+    exit(EXIT_ERROR)
+
+  timeout = read_timeout(args)
+  filepath = args[ARG_KEY_FILEPATH]
+  try:
+    variables = FileHandler.read_variables(filepath)
+    cnf = FileHandler.load(filepath) if args[ARG_KEY_CACHE] else FileHandler.parse(filepath, integers = True)
+  except DIMACSError as exception:
+    error(f'Error: {exception}')
+    exit(EXIT_ERROR)
+  except:
+    error('Error: An error occurred while reading the file provided.')
+    exit(EXIT_ERROR)
+
+  try:
+    budget = SolverBudget(time_limit = timeout)
+    counter = ModelCounter(int(args[ARG_KEY_COUNT_CACHE]) << 20, budget)
+
+    # Ctrl-C stops the count cooperatively
+    handler = signal.signal(signal.SIGINT, lambda signum, frame: budget.interrupt())
+
+    try:
+      models = counter.count(cnf, variables)
+    finally:
+      signal.signal(signal.SIGINT, handler)
+
+    report = success if models else error
+
+    if models is not None:
+      report(f'Number of models: {models}')
+    elif budget.reason == REASON_INTERRUPTED:
+      error('Count interrupted before it was complete.')
+    else:
+      error(f'No count found within the {budget.reason} limit.')
+
+    report(f'Number of decisions: {counter.decisions}')
+    report(f'Number of conflicts: {counter.conflicts}')
+    report(f'Number of components: {counter.components} ({counter.cache_hits} cache hits, {counter.cache_misses} misses, {counter.cache_evictions} evictions)')
+    report(f'Component cache: {len(counter.cache)} counts taking {counter.cache_size / (1 << 20):.1f} MB')
+
+    if args[ARG_KEY_STATS]:
+      for line in counter.statistics.lines():
+        report(line)
+
+  except:
+    error('Error: An error occurred while counting the models of the provided CNF formula.')
+    exit(EXIT_ERROR)
+
+  if models is None:
+    exit(EXIT_CODES[StatusType.UNKNOWN])
+
+  exit(EXIT_CODES[StatusType.SATISFIABLE if models != 0 else StatusType.UNSATISFIABLE])
+
+def portfolio(args: dict) -> None:
+  """
+  Races the default portfolio of configurations on a single file and reports the first answer
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+
+  Returns
+  -------
+  None
+
+  See Also
+  --------
+  PortfolioSolver : class running every configuration in its own process
+  """
+  from pydoku.PortfolioSolver import PortfolioSolver
+
+  workers = args[ARG_KEY_WORKERS]
+
+  if workers is not None and (not workers.isdigit() or int(workers) == 0):
+    error('Invalid number of workers provided as input.')
+    exit(EXIT_ERROR)
+
+  timeout = read_timeout(args)
+  filepath = args[ARG_KEY_FILEPATH]
+  output_filepath = f'{filepath}.out'
+  try:
+    cnf = FileHandler.load(filepath) if args[ARG_KEY_CACHE] else FileHandler.parse(filepath, integers = True)
+  except DIMACSError as exception:
+    error(f'Error: {exception}')
+    exit(EXIT_ERROR)
+  except:
+    error('Error: An error occurred while reading the file provided.')
+    exit(EXIT_ERROR)
+
+  try:
+    solver = PortfolioSolver(workers = int(workers) if workers is not None else None, budget = SolverBudget(time_limit = timeout))
+    satisfied, assignments, backtracks, splits = solver.solve(cnf)
+    report = success if satisfied else error
+
+    if satisfied:
+      FileHandler.output(output_filepath, assignments)
+      success('Satisfiable solution for the formula found.')
+    elif satisfied is False:
+      error('Formula provided is unsatisfiable.')
+    else:
+      error('No answer found within the time limit by any process.')
+
+    if solver.winner is not None:
+      heuristic, engine, restart, seed = solver.winner
+      report(f'Winning configuration: {heuristic.name} heuristic, {engine.name} engine, {restart.name} restarts, seed {seed}')
+
+    report(f'Number of backtracks: {backtracks}')
+    report(f'Number of splits: {splits}')
+    report(f'Number of conflicts: {solver.conflicts}')
+    report(f'Number of learned clauses: {solver.learned_clauses} ({solver.imported_clauses} imported from other processes)')
+    report(f'Number of restarts: {solver.restarts}')
+
+    if satisfied:
+      success(f'Truth assignments satisfying the CNF can be found here: {output_filepath}')
+
+  except:
+    error('Error: An error occurred while solving the provided CNF formula.')
+    exit(EXIT_ERROR)
+
+  exit(EXIT_CODES[solver.status])
+
+def cube_and_conquer(args: dict) -> None:
+  """
+  Solves a single file by splitting it into cubes that are solved in parallel
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+
+  Returns
+  -------
+  None
+
+  See Also
+  --------
+  CubeSolver : class generating the cubes and distributing them over the worker processes
+  """
+  from pydoku.CubeSolver import CubeSolver
+
+  workers = args[ARG_KEY_WORKERS]
+  depth = args[ARG_KEY_DEPTH]
+
+  if workers is not None and (not workers.isdigit() or int(workers) == 0):
+    error('Invalid number of workers provided as input.')
+    exit(EXIT_ERROR)
+
+  if depth is not None and not depth.isdigit():
+    error('Invalid depth provided as input.')
+    exit(EXIT_ERROR)
+
+  timeout = read_timeout(args)
+  filepath = args[ARG_KEY_FILEPATH]
+  output_filepath = f'{filepath}.out'
+  try:
+    cnf = FileHandler.load(filepath) if args[ARG_KEY_CACHE] else FileHandler.parse(filepath, integers = True)
+  except DIMACSError as exception:
+    error(f'Error: {exception}')
+    exit(EXIT_ERROR)
+  except:
+    error('Error: An error occurred while reading the file provided.')
+    exit(EXIT_ERROR)
+
+  try:
+    solver = CubeSolver(workers = int(workers) if workers is not None else None, depth = int(depth) if depth is not None else None,
+                        budget = SolverBudget(time_limit = timeout))
+    satisfied, assignments, backtracks, splits = solver.solve(cnf)
+    report = success if satisfied else error
+
+    if satisfied:
+      FileHandler.output(output_filepath, assignments)
+      success('Satisfiable solution for the formula found.')
+    elif satisfied is False:
+      error('Formula provided is unsatisfiable.')
+    else:
+      error('No answer found within the time limit, some cubes are left unsolved.')
+
+    report(f'Number of cubes: {solver.cubes} ({solver.refuted_cubes} others refuted by the lookahead, {solver.solved_cubes} solved)')
+    report(f'Number of backtracks: {backtracks}')
+    report(f'Number of splits: {splits}')
+    report(f'Number of conflicts: {solver.conflicts}')
+
+    if satisfied:
+      success(f'Truth assignments satisfying the CNF can be found here: {output_filepath}')
+
+  except:
+    error('Error: An error occurred while solving the provided CNF formula.')
+    exit(EXIT_ERROR)
+
+  exit(EXIT_CODES[solver.status])
+
+def serve(args: dict) -> None:
+  """
+  Runs the solver as a server until it is stopped with Ctrl-C or SIGTERM
+
+  Parameters
+  ----------
+  args : dict
+      the parsed command line arguments
+
+  Returns
+  -------
+  None
+
+  See Also
+  --------
+  SolverServer : class answering the requests over a Unix socket or HTTP
+  """
+  from pydoku.SolverServer import SolverServer
+
+  for key in (ARG_KEY_WORKERS, ARG_KEY_PORT, ARG_KEY_QUEUE):
+    if args[key] is not None and (not args[key].isdigit() or int(args[key]) == 0):
+      error(f'Invalid {key[2:]} provided as input.')
+      exit(EXIT_ERROR)
+
+  timeout = read_timeout(args)
+  workers, port, queue = (int(args[key]) if args[key] is not None else None for key in (ARG_KEY_WORKERS, ARG_KEY_PORT, ARG_KEY_QUEUE))
+
+  try:
+    server = SolverServer(args[ARG_KEY_SOCKET], port, workers, queue, args[ARG_KEY_RULES], timeout)
+  except DIMACSError as exception:
+    error(f'Error: {exception}')
+    exit(EXIT_ERROR)
+  except TypeError as exception:
+    error(str(exception))
+    exit(EXIT_ERROR)
+  except:
+    error('Error: An error occurred while reading the rules provided.')
+    exit(EXIT_ERROR)
+
+  success(f'Serving on {server.address} with {server.workers} workers, press Ctrl-C to stop.')
+
+  try:
+    server.run()
+  except OSError as exception:
+    error(f'Error: {exception.strerror or exception}')
+    exit(EXIT_ERROR)
+
+  success(f'Answered {server.requests} requests ({server.rejected} rejected while busy).')
+
 def interpret():
   """
   Interprets command line input and provides appropriate input to the SAT solver.
@@ -83,9 +685,25 @@ def interpret():
   """
   args = docopt(__doc__)
 
+  if args[ARG_KEY_ENUMERATE] is not None:
+    enumeration(args)
+
+  if args[ARG_KEY_COUNT]:
+    count(args)
+
+  if args[ARG_KEY_PORTFOLIO]:
+    portfolio(args)
+
+  if args[ARG_KEY_CUBE_AND_CONQUER]:
+    cube_and_conquer(args)
+
+  if args[ARG_KEY_SERVE]:
+    serve(args)
+    exit(0)
+
   if args[ARG_KEY_SOLVE] is None:
     error('Invalid input for command line utility.')
-    exit(0)
+    exit(EXIT_ERROR)
 
   if args[ARG_KEY_DPLL]:
     heuristic = HeuristicType.STANDARD_DPLL
@@ -93,34 +711,158 @@ def interpret():
     heuristic = HeuristicType.RANDOM_LITERAL
   elif args[ARG_KEY_MOMS]:
     heuristic = HeuristicType.MAX_OCCURRENCES_MIN_SIZE
+  elif args[ARG_KEY_VSIDS]:
+    heuristic = HeuristicType.VSIDS
+  elif args[ARG_KEY_JW]:
+    heuristic = HeuristicType.JEROSLOW_WANG
+  elif args[ARG_KEY_JW_TWO_SIDED]:
+    heuristic = HeuristicType.JEROSLOW_WANG_TWO_SIDED
+  elif args[ARG_KEY_DLIS]:
+    heuristic = HeuristicType.DYNAMIC_LARGEST_INDIVIDUAL_SUM
   else:
     error('Invalid heuristic provided as input.')
+    exit(EXIT_ERROR)
+
+  if args[ARG_KEY_RESTART] not in RESTARTS:
+    error('Invalid restart policy provided as input.')
+    exit(EXIT_ERROR)
+
+  restart = RESTARTS[args[ARG_KEY_RESTART]]
+
+  if args[ARG_KEY_ENGINE] is None:
+    engine = EngineType.CDCL if heuristic == HeuristicType.VSIDS or restart != RestartType.NONE else EngineType.RECURSIVE_DPLL
+  elif args[ARG_KEY_ENGINE] in ENGINES:
+    engine = ENGINES[args[ARG_KEY_ENGINE]]
+  else:
+    error('Invalid engine provided as input.')
+    exit(EXIT_ERROR)
+
+  if heuristic == HeuristicType.VSIDS and engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL):
+    error('VSIDS is only supported by the watched and cdcl engines.')
+    exit(EXIT_ERROR)
+
+  if restart != RestartType.NONE and engine != EngineType.CDCL:
+    error('Restarts are only supported by the cdcl engine.')
+    exit(EXIT_ERROR)
+
+  if not args[ARG_KEY_REDUCE_INTERVAL].isdigit() or int(args[ARG_KEY_REDUCE_INTERVAL]) == 0:
+    error('Invalid reduce interval provided as input.')
+    exit(EXIT_ERROR)
+
+  reduce_interval = int(args[ARG_KEY_REDUCE_INTERVAL])
+
+  if args[ARG_KEY_BATCH] is not None:
+    batch(args, heuristic, engine, restart, reduce_interval)
     exit(0)
 
+  pure_literals = None
+
+  if args[ARG_KEY_PURE_LITERALS] is not None:
+    if args[ARG_KEY_PURE_LITERALS] not in PURE_LITERALS:
+      error('Invalid pure literal mode provided as input.')
+      exit(EXIT_ERROR)
+
+    pure_literals = PURE_LITERALS[args[ARG_KEY_PURE_LITERALS]]
+
+  if pure_literals == PureLiteralType.ALL and engine == EngineType.CDCL:
+    error('Pure literals below the root are not supported by the cdcl engine.')
+    exit(EXIT_ERROR)
+
+  if args[ARG_KEY_DECOMPOSE] not in DECOMPOSITIONS:
+    error('Invalid decomposition mode provided as input.')
+    exit(EXIT_ERROR)
+
+  decompose = DECOMPOSITIONS[args[ARG_KEY_DECOMPOSE]]
+
+  if decompose == DecompositionType.ALL and engine != EngineType.RECURSIVE_DPLL:
+    error('Decomposition below the root is only supported by the dpll engine.')
+    exit(EXIT_ERROR)
+
+  workers = args[ARG_KEY_WORKERS]
+
+  if workers is not None and (not workers.isdigit() or int(workers) == 0):
+    error('Invalid number of workers provided as input.')
+    exit(EXIT_ERROR)
+
+  timeout = read_timeout(args)
   filepath = args[ARG_KEY_FILEPATH]
   output_filepath = f'{filepath}.out'
+  result_cache = None
+
+  if args[ARG_KEY_RESULT_CACHE] is not None:
+    from pydoku.ResultCache import ResultCache
+    result_cache = ResultCache(args[ARG_KEY_RESULT_CACHE])
+
+  solver = SATSolver(SolverHooks(on_progress = progress) if args[ARG_KEY_STATS] else None, SolverBudget(time_limit = timeout), result_cache)
+
   try:
-    cnf = FileHandler.parse(filepath)
+    # a file solved before is answered from the result cache without parsing it
+    result = solver.recall_file(filepath)
+
+    if result is None:
+      if args[ARG_KEY_CACHE]:
+        cnf = FileHandler.load(filepath)
+      else:
+        cnf = FileHandler.parse(filepath, integers = engine in (EngineType.WATCHED_LITERALS, EngineType.CDCL))
+  except DIMACSError as exception:
+    error(f'Error: {exception}')
+    exit(EXIT_ERROR)
   except:
     error('Error: An error occurred while reading the file provided.')
-    exit(0)
+    exit(EXIT_ERROR)
 
   try:
-    solver = SATSolver()
-    satisfied, assignments, backtracks = solver.solve(cnf, heuristic)
+    # Ctrl-C stops the search cooperatively, reporting what was done so far
+    handler = signal.signal(signal.SIGINT, lambda signum, frame: solver.interrupt())
+
+    try:
+      if result is None:
+        result = solver.solve(cnf, heuristic, engine, restart, reduce_interval, preprocess = args[ARG_KEY_PREPROCESS],
+                              pure_literals = pure_literals, decompose = decompose, workers = int(workers) if workers is not None else None)
+        solver.link_file()
+    finally:
+      signal.signal(signal.SIGINT, handler)
+
+    satisfied, assignments, backtracks, splits = result
+    report = success if satisfied else error
 
     if satisfied:
       FileHandler.output(output_filepath, assignments)
       success('Satisfiable solution for the formula found.')
-      success(f'Number of backtracks: {backtracks}')
-      success(f'Truth assignments satisfying the CNF can be found here: {output_filepath}')
-    else:
+    elif satisfied is False:
       error('Formula provided is unsatisfiable.')
-      error(f'Number of backtracks: {backtracks}')
+    elif solver.budget.reason == REASON_INTERRUPTED:
+      error('Search interrupted before an answer was found.')
+    else:
+      error(f'No answer found within the {solver.budget.reason} limit.')
+
+    if solver.cached:
+      report('Answer found in the result cache, the CNF was solved before.')
+
+    report(f'Number of backtracks: {backtracks}')
+    report(f'Number of splits: {splits}')
+    report(f'Number of conflicts: {solver.conflicts}')
+    report(f'Number of learned clauses: {solver.learned_clauses} ({solver.live_learned_clauses} live, {solver.deleted_learned_clauses} deleted)')
+    report(f'Number of restarts: {solver.restarts}')
+
+    if args[ARG_KEY_PREPROCESS]:
+      report(f'Preprocessing: {solver.eliminated_variables} variables eliminated, {solver.subsumed_clauses} clauses subsumed, {solver.strengthened_clauses} clauses strengthened')
+
+    if decompose != DecompositionType.NONE and not solver.cached:
+      report(f'Number of components: {solver.components} (the largest has {solver.largest_component} clauses)')
+
+    if args[ARG_KEY_STATS]:
+      for line in solver.statistics.lines():
+        report(line)
+
+    if satisfied:
+      success(f'Truth assignments satisfying the CNF can be found here: {output_filepath}')
 
   except:
     error('Error: An error occurred while solving the provided CNF formula.')
-    exit(0)
+    exit(EXIT_ERROR)
+
+  exit(EXIT_CODES[solver.status])
 
 if __name__ == "__main__":
   interpret()
@@ -0,0 +1,220 @@
+"""
+Usage: SAT-client --help
+       SAT-client [--socket=<path> | --port=<port>] [--rules=<path>] [--heuristic=<number>] [--engine=<engine>] [--timeout=<seconds>] [--retries=<count>] FILE
+       SAT-client [--socket=<path> | --port=<port>] [--timeout=<seconds>] [--retries=<count>] --sudoku=<puzzle>
+
+Sends a DIMACS file or a Sudoku puzzle to a solver started with SAT --serve and reports its answer.
+The truth assignments satisfying a CNF are written next to the file, and the solution of a puzzle is printed.
+Exits with status 10 if the formula is satisfiable, 20 if it is unsatisfiable, 0 if no answer was found within the
+time limit, and 1 if the input is invalid, the server cannot be reached or stays busy, or the request failed.
+
+Arguments:
+  FILE File defining the CNF in DIMACS format
+
+Options:
+  -h --help
+  --socket=<path>  Unix socket the server listens on, defaults to pydoku.sock in the temporary directory
+  --port=<port>  Port the server listens on for HTTP requests on localhost, instead of a Unix socket
+  --rules=<path>  Rule base loaded by the server to solve the CNF along with, named by the path it was given to the server as
+  --heuristic=<number>  Branching heuristic, numbered like the -S options of SAT [default: 4]
+  --engine=<engine>  Search engine to run the heuristic with: dpll, iterative, watched or cdcl. Defaults to cdcl for heuristic 4, and dpll otherwise.
+  --timeout=<seconds>  Time limit of the search, which the time limit of the server caps
+  --retries=<count>  Number of times to send the request again, a second apart, while the server is busy [default: 0]
+  --sudoku=<puzzle>  Sudoku puzzle written row by row, with 1-9 and then A-Z as values and . or 0 for empty cells
+
+"""
+from docopt import docopt
+from termcolor import cprint
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+# the client imports no module of pydoku, only docopt and termcolor besides the standard library, so that it starts
+# fast, hence the server constants are repeated here
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'pydoku.sock')
+HOST = '127.0.0.1'
+
+ARG_KEY_SOCKET = '--socket'
+ARG_KEY_PORT = '--port'
+ARG_KEY_RULES = '--rules'
+ARG_KEY_HEURISTIC = '--heuristic'
+ARG_KEY_ENGINE = '--engine'
+ARG_KEY_TIMEOUT = '--timeout'
+ARG_KEY_RETRIES = '--retries'
+ARG_KEY_SUDOKU = '--sudoku'
+ARG_KEY_FILEPATH = 'FILE'
+
+EXIT_CODES = {
+  'SAT': 10,
+  'UNSAT': 20
+}
+
+# invalid input, an unreachable or busy server, and failed requests, kept apart from an UNKNOWN outcome
+EXIT_ERROR = 1
+
+def error(message: str) -> None:
+  """
+  Prints out an error message in the terminal
+
+  Parameters
+  ----------
+  message : str
+      message to display the user
+
+  Returns
+  -------
+  None
+  """
+  cprint(message, 'red', attrs = ['bold'], file = sys.stderr)
+
+def success(message: str) -> None:
+  """
+  Prints out a success message in the terminal
+
+  Parameters
+  ----------
+  message : str
+      message to display the user
+
+  Returns
+  -------
+  None
+  """
+  cprint(message, 'green', attrs = ['bold'], file = sys.stderr)
+
+def send(request: dict, path: str, port: int) -> dict:
+  """
+  Sends a request to the server and waits for its answer
+
+  Parameters
+  ----------
+  request : dict
+      the request, as a JSON object
+  path : str
+      path of the Unix socket of the server, if it is not listening on a port
+  port : int
+      port of the server on localhost, None to use the Unix socket
+
+  Returns
+  -------
+  dict
+      returns the answer of the server
+  """
+  body = json.dumps(request).encode()
+
+  if port is not None:
+    # only imported over HTTP, since it takes longer to import than everything else
+    import http.client
+
+    connection = http.client.HTTPConnection(HOST, port)
+
+    try:
+      connection.request('POST', '/solve', body, {'Content-Type': 'application/json'})
+      return json.loads(connection.getresponse().read())
+    finally:
+      connection.close()
+
+  with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+    connection.connect(path)
+    connection.sendall(body + b'\n')
+
+    with connection.makefile('rb') as stream:
+      return json.loads(stream.readline())
+
+def main():
+  """
+  Interprets command line input, sends the request to the server and reports its answer
+
+  Returns
+  -------
+  None
+  """
+  args = docopt(__doc__)
+  request = dict()
+
+  for key in (ARG_KEY_PORT, ARG_KEY_HEURISTIC, ARG_KEY_RETRIES):
+    if args[key] is not None and not args[key].isdigit():
+      error(f'Invalid {key[2:]} provided as input.')
+      exit(EXIT_ERROR)
+
+  if args[ARG_KEY_TIMEOUT] is not None:
+    try:
+      request['timeout'] = float(args[ARG_KEY_TIMEOUT])
+    except ValueError:
+      error('Invalid timeout provided as input.')
+      exit(EXIT_ERROR)
+
+  filepath = args[ARG_KEY_FILEPATH]
+
+  if filepath is not None:
+    try:
+      with open(filepath, 'r') as file:
+        request['dimacs'] = file.read()
+    except (OSError, UnicodeDecodeError):
+      error('Error: An error occurred while reading the file provided.')
+      exit(EXIT_ERROR)
+
+    request['heuristic'] = int(args[ARG_KEY_HEURISTIC])
+
+    if args[ARG_KEY_RULES] is not None:
+      request['rules'] = args[ARG_KEY_RULES]
+
+    if args[ARG_KEY_ENGINE] is not None:
+      request['engine'] = args[ARG_KEY_ENGINE]
+  else:
+    request['sudoku'] = args[ARG_KEY_SUDOKU]
+
+  path = args[ARG_KEY_SOCKET] or DEFAULT_SOCKET_PATH
+  port = int(args[ARG_KEY_PORT]) if args[ARG_KEY_PORT] is not None else None
+  retries = int(args[ARG_KEY_RETRIES])
+
+  try:
+    answer = send(request, path, port)
+
+    while answer['status'] == 'BUSY' and retries > 0:
+      retries -= 1
+      time.sleep(1)
+      answer = send(request, path, port)
+  except (OSError, ValueError) as exception:
+    error(f'Error: Could not reach the server at {path if port is None else f"{HOST}:{port}"}: {exception}')
+    exit(EXIT_ERROR)
+
+  status = answer['status']
+  report = success if status == 'SAT' else error
+
+  if status in ('ERROR', 'BUSY'):
+    error(f'Error: {answer["error"]}')
+    exit(EXIT_ERROR)
+
+  if status == 'SAT' and filepath is not None:
+    output_filepath = f'{filepath}.out'
+
+    # the same format as the output of SAT
+    with open(output_filepath, 'w') as file:
+      file.write(f'p cnf {len(answer["model"])} {len(answer["model"])}\n')
+      file.write('\n'.join(f'{literal} 0' for literal in answer['model']))
+
+    success('Satisfiable solution for the formula found.')
+  elif status == 'SAT':
+    print(answer['solution'])
+    success('Solution for the puzzle found.')
+  elif status == 'UNSAT':
+    error('Formula provided is unsatisfiable.')
+  else:
+    error('No answer found within the time limit.')
+
+  report(f'Number of backtracks: {answer["backtracks"]}')
+  report(f'Number of splits: {answer["splits"]}')
+  report(f'Number of conflicts: {answer["conflicts"]}')
+  report(f'Solved in {answer["run_time"]:.3f} seconds')
+
+  if status == 'SAT' and filepath is not None:
+    success(f'Truth assignments satisfying the CNF can be found here: {output_filepath}')
+
+  exit(EXIT_CODES.get(status, 0))
+
+if __name__ == "__main__":
+  main()
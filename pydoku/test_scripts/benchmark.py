@@ -0,0 +1,63 @@
+"""
+Usage: benchmark.py [--repeats=<runs>] [--warmup=<runs>] [--quick] [--output=<path>] [--baseline=<path>] [--tolerance=<fraction>]
+
+Benchmarks every engine on the bundled corpus of Sudoku puzzles and random 3-SAT instances.
+Writes the report as JSON and exits with status 1 if the model of any instance does not satisfy its clauses or,
+given a baseline report, if any instance regressed.
+
+Options:
+  -h --help
+  --repeats=<runs>  Number of timed runs of every instance [default: 5]
+  --warmup=<runs>  Number of untimed runs of every instance before the timed ones [default: 1]
+  --quick  Only benchmark a few instances of every kind
+  --output=<path>  File to write the report to [default: pydoku/test_files/reports/benchmark.json]
+  --baseline=<path>  Report of an earlier run to compare against
+  --tolerance=<fraction>  Relative growth of the median run time flagged as a regression [default: 0.1]
+
+"""
+from pydoku.Benchmark import Benchmark
+from docopt import docopt
+
+import json
+import sys
+
+if __name__ == '__main__':
+  args = docopt(__doc__)
+
+  benchmark = Benchmark(repeats = int(args['--repeats']), warmup = int(args['--warmup']), quick = args['--quick'])
+  report = benchmark.run(progress = lambda name: print(f'--- benchmarked {name} ---'))
+
+  for name, result in report['results'].items():
+    peak_rss = result['peak_rss']
+    print(f'{name} (peak RSS: {peak_rss / 2 ** 20:.1f} MiB)' if peak_rss is not None else name)
+
+    for instance, statistics in result['instances'].items():
+      print(f'  {instance}: median {statistics["median"]:.4f}s, IQR {statistics["iqr"]:.4f}s, satisfied {statistics["satisfied"]}, verified {statistics["verified"]}')
+
+  with open(args['--output'], 'w') as file:
+    json.dump(report, file, indent = 2)
+
+  print(f'--- report written to {args["--output"]} ---')
+
+  invalid = [f'{name} {instance}' for name, result in report['results'].items()
+             for instance, statistics in result['instances'].items() if statistics['verified'] is False]
+
+  for instance in invalid:
+    print(f'INVALID MODEL {instance}')
+
+  if len(invalid) != 0:
+    sys.exit(1)
+
+  if args['--baseline'] is not None:
+    with open(args['--baseline'], 'r') as file:
+      baseline = json.load(file)
+
+    regressions = Benchmark.compare(report, baseline, float(args['--tolerance']))
+
+    for regression in regressions:
+      print(f'REGRESSION {regression}')
+
+    if len(regressions) != 0:
+      sys.exit(1)
+
+    print('--- no regressions against the baseline ---')
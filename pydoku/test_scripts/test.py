@@ -1,103 +1,45 @@
-from pydoku.SATSolver import SATSolver
-from pydoku.FileHandler import FileHandler
 from pydoku.HeuristicType import HeuristicType
+from pydoku.IncrementalSolver import IncrementalSolver
+from pydoku.ModelVerifier import ModelVerifier
+from pydoku.Sudoku import Sudoku
 
 import time
-from copy import deepcopy
 import math
 
-def to_dimacs(sudoku: str) -> str:
-  """
-  Takes in a string defining a sudoku as parameter and encodes it into dimacs
-
-  Parameters
-  ----------
-  sudoku: string
-      a definition of the puzzle in dimacs format
-
-  Returns
-  -------
-  string
-      returns string describing the sudoku puzzle in dimacs format
-  """
-  sudoku_values = []
-  sudoku = sudoku.strip()
-  side = int(math.sqrt(len(sudoku)))
-
-  for i, value in enumerate(sudoku):
-    if value != '.':
-      row = (i // side) + 1
-      column = (i % side) + 1
-      rcv = f'{row}{column}{value} 0'
-      sudoku_values.append(rcv)
-
-  return '\n'.join(sudoku_values)
-
-def evaluate(cnf: list, assignments: dict) -> bool:
-  """
-  Returns a randomly selected literal from the current CNF
-
-  Parameters
-  ----------
-  cnf : list
-      a list of clauses defining a CNF
-  assignments : list
-      a list of clauses defining a CNF
-
-  Returns
-  -------
-  bool
-      returns true if the assignments provided satisfy the CNF
-  """
-  for clause in cnf:
-    valid = True
-    for literal in clause:
-      atom = literal
-      if literal[0] == '-':
-        atom = literal[1:len(literal)]
-
-      valid = valid or assignments[atom]
-
-      if not valid:
-        return False
-
-  return True
-
 if __name__ == '__main__':
   heuristic_id = 1
   size = 9
   heuristic = HeuristicType(heuristic_id)
 
   sudoku_examples = f'pydoku/test_files/{size}x{size}/examples.txt'
-  sudoku_rules = f'pydoku/test_files/{size}x{size}/rules.txt'
-  sudoku_file = f'pydoku/test_files/{size}x{size}/dimacs.txt'
 
-  rules = FileHandler.parse(sudoku_rules)
-  examples = open(sudoku_examples, 'r')
+  box = int(round(math.sqrt(size)))
 
-  for line in examples:
-    dimacs = to_dimacs(line)
+  if box * box != size:
+    raise ValueError(f'Invalid board size {size}, it must be a perfect square.')
 
-    # write the dimacs to a file, this will allow us to mimic reading the CNF from files
-    write_file = open(sudoku_file, '+w')
-    write_file.write(dimacs)
-    write_file.close()
+  # the rules are generated once, every puzzle only assumes its givens
+  sudoku = Sudoku(box)
+  rules = [[str(literal) for literal in clause] for clause in sudoku.rules()]
+  solver = IncrementalSolver()
+  solver.add_clauses(rules)
+  verifier = ModelVerifier(rules)
+  examples = open(sudoku_examples, 'r')
 
-    sudoku = FileHandler.parse(sudoku_file)
-    cnf = sudoku + rules
+  for line in examples:
+    givens = sudoku.givens(Sudoku.parse(line))
 
     start_time = time.time()
 
-    solver = SATSolver()
-    satisfied, result_assignments, backtracks, splits = solver.solve(deepcopy(cnf), heuristic)
-
-    # check if the returned assignments are valid
-    valid = evaluate(cnf, result_assignments)
+    satisfied, result_assignments, backtracks, splits = solver.solve(givens, heuristic)
 
-    if valid:
+    # check that the model satisfies the rules and keeps the givens
+    if not satisfied:
+      print('DPLL Output: Unsatisfied')
+    elif verifier.verify(result_assignments) and all(str(literal) in result_assignments for literal in givens):
       print(f'DPLL Output: Satisfied. Backtracks: {backtracks}')
     else:
-      print('DPLL Output: Unsatisfied')
+      print('DPLL Output: Invalid model')
 
     print('--- %s seconds ---' % (time.time() - start_time))
     print('--- %s backtracks ---' % backtracks)
\ No newline at end of file
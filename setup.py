@@ -15,7 +15,7 @@ KEYWORDS = 'sat solver boolean satisfiability propositional logic ai artificial
 PYTHON_VERSION = '>=3.7.0'
 REQUIRED = ['docopt', 'termcolor']
 EXCLUDE = ['tests', '*.tests', '*.tests.*', 'tests.*']
-EXTRAS = {}
+EXTRAS = {'numpy': ['numpy']}
 
 here = os.path.abspath(os.path.dirname(__file__))
 with io.open(os.path.join(here, 'README.md'), encoding='utf-8') as f:
@@ -33,7 +33,7 @@ setup(
   packages = find_packages(exclude = EXCLUDE),
   py_modules = ['pydoku'],
   entry_points = {
-    'console_scripts': ['SAT = pydoku.cli:interpret']
+    'console_scripts': ['SAT = pydoku.cli:interpret', 'SAT-client = pydoku.client:main']
   },
   install_requires = REQUIRED,
   extras_require = EXTRAS,
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from pydoku.DIMACSError import DIMACSError
+from pydoku.FileHandler import FileHandler
+
+CNF = 'c a comment\np cnf 4 3\n1 -2 0\n2 3\n-4 0\n-1 0\n'
+CLAUSES = [[1, -2], [2, 3, -4], [-1]]
+
+def test_parse_text():
+  assert FileHandler.parse_text(CNF, integers = True) == CLAUSES
+  assert FileHandler.parse_text(CNF) == [[str(literal) for literal in clause] for clause in CLAUSES]
+
+@pytest.mark.parametrize('text, message', [
+  ('p cnf 2 1\np cnf 2 1\n1 2 0\n', 'duplicate problem line'),
+  ('p cnf 2\n1 2 0\n', 'problem line'),
+  ('p dnf 2 1\n1 2 0\n', 'problem line'),
+  ('p cnf 2 1\n1 x 0\n', 'literals must be integers'),
+  ('p cnf 2 1\n1 3 0\n', 'exceeds the 2 variables declared'),
+  ('p cnf 2 2\n1 2 0\n0\n', 'empty clause'),
+  ('p cnf 2 2\n1 2 0\n', '1 clauses found while 2 were declared')
+])
+def test_read_dimacs_errors(text, message):
+  with pytest.raises(DIMACSError, match = message):
+    FileHandler.parse_text(text)
+
+def test_cache_round_trip(tmp_path):
+  filepath = str(tmp_path / 'formula.cnf')
+
+  with open(filepath, 'w') as file:
+    file.write(CNF)
+
+  store = FileHandler.load(filepath)
+  assert store.to_lists() == CLAUSES
+  assert os.path.exists(f'{filepath}.cache')
+
+  cached = FileHandler.load_cache(f'{filepath}.cache')
+  assert cached.to_lists() == CLAUSES
+  cached.close()
+
+@pytest.mark.parametrize('corrupt', [
+  lambda data: b'',
+  lambda data: data[:10],
+  lambda data: data[:-4],
+  lambda data: b'x' * len(data)
+])
+def test_corrupt_cache_is_rebuilt(tmp_path, corrupt):
+  filepath = str(tmp_path / 'formula.cnf')
+  cache_path = f'{filepath}.cache'
+
+  with open(filepath, 'w') as file:
+    file.write(CNF)
+
+  FileHandler.load(filepath).close()
+
+  with open(cache_path, 'rb') as file:
+    data = file.read()
+
+  with open(cache_path, 'wb') as file:
+    file.write(corrupt(data))
+
+  # the corrupt cache is newer than the file, so it is read and must be rejected
+  with pytest.raises(DIMACSError):
+    FileHandler.load_cache(cache_path)
+
+  store = FileHandler.load(filepath)
+  assert store.to_lists() == CLAUSES
+  store.close()
+
+  with open(cache_path, 'rb') as file:
+    assert file.read() == data
@@ -0,0 +1,64 @@
+import itertools
+import random
+
+import pytest
+
+from pydoku.HeuristicType import HeuristicType
+from pydoku.IncrementalSolver import IncrementalSolver
+
+def count_models(cnf: list, variables: int, assumptions: list = (), projection: list = None) -> int:
+  projected = set()
+
+  for values in itertools.product((False, True), repeat = variables):
+    if all(any(values[abs(literal) - 1] == (literal > 0) for literal in clause) for clause in list(cnf) + [[literal] for literal in assumptions]):
+      projected.add(tuple(values[variable - 1] for variable in (projection or range(1, variables + 1))))
+
+  return len(projected)
+
+def random_cnf(generator: random.Random, variables: int) -> list:
+  return [[generator.choice((-1, 1)) * generator.randint(1, variables) for _ in range(generator.randint(1, 3))]
+          for _ in range(generator.randint(1, 2 * variables))]
+
+# heuristics other than VSIDS can stop with variables left unassigned, which are blocked differently
+@pytest.mark.parametrize('heuristic', (HeuristicType.VSIDS, HeuristicType.STANDARD_DPLL, HeuristicType.JEROSLOW_WANG))
+def test_enumerate_counts_every_model(heuristic):
+  generator = random.Random(heuristic)
+
+  for _ in range(80):
+    variables = generator.randint(1, 7)
+    # the highest variable occurs in a clause, so the solver knows every variable
+    cnf = random_cnf(generator, variables) + [[variables, -variables]]
+    solver = IncrementalSolver()
+    solver.add_clauses(cnf)
+    found = list(solver.enumerate(heuristic = heuristic))
+
+    assert len(found) == count_models(cnf, variables), cnf
+    assert len({frozenset(model) for model in found}) == len(found)
+    assert solver.models == len(found) and solver.complete
+
+def test_enumerate_under_assumptions_and_projection():
+  generator = random.Random(5)
+
+  for _ in range(80):
+    variables = generator.randint(2, 7)
+    cnf = random_cnf(generator, variables) + [[variables, -variables]]
+    assumptions = [generator.choice((-1, 1))]
+    projection = generator.sample(range(1, variables + 1), generator.randint(1, variables))
+    solver = IncrementalSolver()
+    solver.add_clauses(cnf)
+
+    assert len(list(solver.enumerate(assumptions, projection = projection))) == count_models(cnf, variables, assumptions, projection)
+
+def test_enumeration_does_not_restrict_later_calls():
+  solver = IncrementalSolver()
+  solver.add_clauses([[1, 2]])
+
+  assert len(list(solver.enumerate())) == 3
+  assert len(list(solver.enumerate())) == 3
+
+def test_enumerate_limit():
+  solver = IncrementalSolver()
+  solver.add_clauses([[1, 2, 3]])
+
+  assert len(list(solver.enumerate(limit = 2))) == 2
+  assert not solver.complete
@@ -0,0 +1,54 @@
+import itertools
+import random
+import sys
+
+import pytest
+
+from pydoku.ModelCounter import ModelCounter
+from pydoku.SolverBudget import SolverBudget
+
+def count_models(cnf: list, variables: int) -> int:
+  return sum(all(any(values[abs(literal) - 1] == (literal > 0) for literal in clause) for clause in cnf)
+             for values in itertools.product((False, True), repeat = variables))
+
+def test_count_matches_brute_force():
+  generator = random.Random(2)
+  counter = ModelCounter()
+
+  for _ in range(300):
+    variables = generator.randint(1, 10)
+    cnf = [[generator.choice((-1, 1)) * generator.randint(1, variables) for _ in range(generator.randint(1, 3))]
+           for _ in range(generator.randint(0, 3 * variables))]
+
+    # the cache is kept between counts, so components counted earlier are looked up
+    assert counter.count(cnf, variables) == count_models(cnf, variables), cnf
+
+def test_free_variables_double_the_count():
+  assert ModelCounter().count([[1, 2]], 5) == 3 * 8
+
+def test_long_chain_does_not_recurse():
+  # every clause [i, i + 1] is its own decision, so a recursive search would nest one call per variable
+  limit = sys.getrecursionlimit()
+  sys.setrecursionlimit(300)
+
+  try:
+    count = ModelCounter().count([[variable, variable + 1] for variable in range(1, 400)])
+  finally:
+    sys.setrecursionlimit(limit)
+
+  # no two adjacent variables are both False, which the Fibonacci numbers count
+  previous, current = 1, 2
+
+  for _ in range(399):
+    previous, current = current, previous + current
+
+  assert count == current
+
+def test_exhausted_budget_returns_none():
+  counter = ModelCounter(budget = SolverBudget(decision_limit = 1))
+
+  assert counter.count([[variable, variable + 1, variable + 2] for variable in range(1, 30)]) is None
+
+def test_too_few_variables():
+  with pytest.raises(TypeError):
+    ModelCounter().count([[1, 5]], 3)
@@ -0,0 +1,51 @@
+import itertools
+import random
+
+from pydoku.Preprocessor import Preprocessor
+from pydoku.SolverBudget import SolverBudget
+
+def models(cnf: list, variables: int):
+  for values in itertools.product((False, True), repeat = variables):
+    if all(any(values[abs(literal) - 1] == (literal > 0) for literal in clause) for clause in cnf):
+      yield {str(variable if value else -variable): True for variable, value in enumerate(values, 1)}
+
+def satisfies(cnf: list, assignments: dict) -> bool:
+  true = {int(literal) for literal, value in assignments.items() if value}
+
+  return all(any(literal in true if literal > 0 else -literal not in true for literal in clause) for clause in cnf)
+
+def test_extend_round_trip():
+  generator = random.Random(1)
+
+  for _ in range(300):
+    variables = generator.randint(1, 8)
+    cnf = [[generator.choice((-1, 1)) * generator.randint(1, variables) for _ in range(generator.randint(1, 3))]
+           for _ in range(generator.randint(1, 4 * variables))]
+    preprocessor = Preprocessor()
+    simplified = preprocessor.simplify(cnf)
+    # every model of the simplified CNF extends to a model of the original one
+    model = next(models(simplified, variables), None)
+    expected = next(models(cnf, variables), None)
+
+    assert (model is None) == (expected is None), cnf
+
+    if model is not None:
+      extended = preprocessor.extend(model)
+
+      assert satisfies(cnf, extended), cnf
+      # variables only occurring in tautologies are dropped along with them
+      kept = [clause for clause in cnf if not any(-literal in clause for literal in clause)]
+      assert {abs(int(literal)) for literal in extended} == {abs(literal) for clause in kept for literal in clause}
+
+def test_unsatisfiable_cnf_simplifies_to_empty_clause():
+  assert Preprocessor().simplify([[1, 2], [-1, 2], [1, -2], [-1, -2]]) == [[]]
+
+def test_exhausted_budget_stops_simplification():
+  budget = SolverBudget(time_limit = 60)
+  budget.start()
+  budget.interrupt()
+
+  try:
+    assert Preprocessor().simplify([[1, 2], [-1, 3]], budget) is None
+  finally:
+    budget.stop()
@@ -0,0 +1,88 @@
+import itertools
+import random
+
+import pytest
+
+from pydoku.EngineType import EngineType
+from pydoku.HeuristicType import HeuristicType
+from pydoku.SATSolver import SATSolver
+from pydoku.SolverBudget import SolverBudget
+from pydoku.StatusType import StatusType
+
+# the string literal engines do not support VSIDS, the integer literal engines branch with it by default
+CONFIGURATIONS = [
+  (EngineType.RECURSIVE_DPLL, HeuristicType.STANDARD_DPLL),
+  (EngineType.RECURSIVE_DPLL, HeuristicType.JEROSLOW_WANG_TWO_SIDED),
+  (EngineType.ITERATIVE_DPLL, HeuristicType.STANDARD_DPLL),
+  (EngineType.ITERATIVE_DPLL, HeuristicType.MAX_OCCURRENCES_MIN_SIZE),
+  (EngineType.WATCHED_LITERALS, HeuristicType.VSIDS),
+  (EngineType.WATCHED_LITERALS, HeuristicType.DYNAMIC_LARGEST_INDIVIDUAL_SUM),
+  (EngineType.CDCL, HeuristicType.VSIDS),
+  (EngineType.CDCL, HeuristicType.JEROSLOW_WANG)
+]
+
+def random_cnf(generator: random.Random, variables: int, clauses: int, size: int = 3) -> list:
+  # clauses of up to size distinct variables, since the string literal engines expect no repeated literal
+  return [[generator.choice((-1, 1)) * variable for variable in generator.sample(range(1, variables + 1), generator.randint(1, min(size, variables)))]
+          for _ in range(clauses)]
+
+def is_satisfiable(cnf: list, variables: int) -> bool:
+  for values in itertools.product((False, True), repeat = variables):
+    if all(any(values[abs(literal) - 1] == (literal > 0) for literal in clause) for clause in cnf):
+      return True
+
+  return False
+
+def satisfies(cnf: list, assignments: dict) -> bool:
+  # variables left out of the model are False
+  true = {int(literal) for literal, value in assignments.items() if value}
+  assert not any(-literal in true for literal in true)
+
+  return all(any(literal in true if literal > 0 else -literal not in true for literal in clause) for clause in cnf)
+
+def to_input(cnf: list, engine: EngineType) -> list:
+  if engine in (EngineType.RECURSIVE_DPLL, EngineType.ITERATIVE_DPLL):
+    return [[str(literal) for literal in clause] for clause in cnf]
+
+  return [list(clause) for clause in cnf]
+
+@pytest.mark.parametrize('engine, heuristic', CONFIGURATIONS)
+@pytest.mark.parametrize('preprocess', (False, True))
+def test_solve_matches_brute_force(engine, heuristic, preprocess):
+  generator = random.Random(engine * 100 + heuristic)
+
+  for _ in range(60):
+    variables = generator.randint(1, 8)
+    cnf = random_cnf(generator, variables, generator.randint(1, 4 * variables))
+    solver = SATSolver()
+    satisfied, assignments, _, _ = solver.solve(to_input(cnf, engine), heuristic, engine, preprocess = preprocess)
+
+    assert satisfied == is_satisfiable(cnf, variables), cnf
+    assert solver.status == (StatusType.SATISFIABLE if satisfied else StatusType.UNSATISFIABLE)
+
+    if satisfied:
+      assert satisfies(cnf, assignments), cnf
+
+@pytest.mark.parametrize('engine, heuristic', CONFIGURATIONS)
+def test_unsatisfiable_pigeonhole(engine, heuristic):
+  # 4 pigeons in 3 holes
+  pigeon = lambda index, hole: 3 * index + hole + 1
+  cnf = [[pigeon(index, hole) for hole in range(3)] for index in range(4)]
+  cnf += [[-pigeon(first, hole), -pigeon(second, hole)] for hole in range(3) for first, second in itertools.combinations(range(4), 2)]
+  satisfied, _, _, _ = SATSolver().solve(to_input(cnf, engine), heuristic, engine)
+
+  assert satisfied is False
+
+def test_exhausted_budget_is_unknown():
+  generator = random.Random(7)
+  cnf = [[generator.choice((-1, 1)) * variable for variable in generator.sample(range(1, 61), 3)] for _ in range(250)]
+  solver = SATSolver(budget = SolverBudget(decision_limit = 1))
+  satisfied, _, _, _ = solver.solve(cnf, HeuristicType.VSIDS, EngineType.CDCL)
+
+  assert satisfied is None
+  assert solver.status == StatusType.UNKNOWN
+  assert solver.budget.reason == 'decisions'
+
+def test_invalid_heuristic_for_engine():
+  with pytest.raises(TypeError):
+    SATSolver().solve([['1']], HeuristicType.VSIDS, EngineType.RECURSIVE_DPLL)